@@ -0,0 +1,82 @@
+# expression_cache.py
+# Общий для lab2 и lab3 кэш результатов по выражению: таблица истинности
+# (битовая маска), нормальные формы, минимизации. Ключ строит сама лабораторная
+# из скомпилированной формы выражения, поэтому пробелы и лишние скобки не
+# порождают новых записей.
+import hashlib
+import os
+import shelve
+from collections import OrderedDict
+
+CACHE_MAXSIZE = 4096
+CACHE_PATH_ENV = 'EXPRESSION_CACHE_PATH'  # Путь к файлу постоянного уровня кэша
+
+
+def canonical_key(namespace, compiled, variables):
+    """Хэш скомпилированной формы выражения вместе с упорядоченным списком переменных."""
+    payload = repr((namespace, tuple(compiled), tuple(variables)))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ExpressionCache:
+    """LRU-кэш в памяти с необязательным постоянным уровнем на диске (shelve)."""
+
+    def __init__(self, maxsize=CACHE_MAXSIZE, path=None):
+        self.maxsize = maxsize
+        self.path = path
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._shelf = None
+
+    def _disk(self):
+        if self.path and self._shelf is None:
+            self._shelf = shelve.open(self.path)
+        return self._shelf
+
+    def get_or_compute(self, key, compute):
+        """Возвращает значение по ключу, вычисляя его через compute() при промахе."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        disk = self._disk()
+        if disk is not None and key in disk:
+            value = disk[key]
+            self.disk_hits += 1
+        else:
+            value = compute()
+            self.misses += 1
+            if disk is not None:
+                disk[key] = value
+
+        self.entries[key] = value
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.disk_hits = self.misses = 0
+
+    def close(self):
+        if self._shelf is not None:
+            self._shelf.close()
+            self._shelf = None
+
+    def stats(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            'size': len(self.entries),
+        }
+
+
+def default_cache():
+    """Кэш для интерфейсов лабораторных; постоянный уровень включается переменной окружения."""
+    return ExpressionCache(path=os.environ.get(CACHE_PATH_ENV))
@@ -0,0 +1,28 @@
+# bench_binary_multiply.py
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from binary_multiply import binary_multiply, METHODS
+
+WIDTHS = (8, 32, 128, 512, 2048, 8192)
+
+
+def bench(widths=WIDTHS, pairs=20):
+    """Сравнивает методы умножения на операндах разной разрядности (без трассировки)."""
+    print(f"{'бит':>6} " + " ".join(f"{m:>12}" for m in METHODS) + "   (мкс на умножение)")
+    for bits in widths:
+        operands = [(random.getrandbits(bits) | 1 << (bits - 1), random.getrandbits(bits)) for _ in range(pairs)]
+        timings = []
+        for method in METHODS:
+            seconds = min(timeit.repeat(lambda: [binary_multiply(x, y, method) for x, y in operands],
+                                        number=1, repeat=3))
+            timings.append(seconds / pairs * 1e6)
+        print(f"{bits:>6} " + " ".join(f"{t:12.1f}" for t in timings))
+
+
+if __name__ == "__main__":
+    bench()
@@ -0,0 +1,28 @@
+# bench_to_signed_binary_batch.py
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from to_signed_binary import to_signed_binary
+from to_signed_binary_batch import to_signed_binary_batch
+
+
+def bench(count=100_000, bits=16, repeat=3):
+    """Сравнивает пропускную способность поштучного и пакетного преобразования."""
+    limit = (1 << (bits - 1)) - 1
+    values = [random.randint(-limit, limit) for _ in range(count)]
+
+    per_call = min(timeit.repeat(lambda: [to_signed_binary(v, bits) for v in values], number=1, repeat=repeat))
+    batch = min(timeit.repeat(lambda: to_signed_binary_batch(values, bits), number=1, repeat=repeat))
+
+    print(f"{count} чисел, {bits} бит")
+    print(f"  to_signed_binary:       {count / per_call:12.0f} чисел/с")
+    print(f"  to_signed_binary_batch: {count / batch:12.0f} чисел/с (x{per_call / batch:.1f})")
+
+
+if __name__ == "__main__":
+    for bits in (8, 16, 32):
+        bench(bits=bits)
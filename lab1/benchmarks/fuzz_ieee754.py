@@ -0,0 +1,49 @@
+# fuzz_ieee754.py
+# Дифференциальная проверка программной арифметики IEEE-754 против NumPy float32/float16.
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from ieee754_addition import ieee754_batch
+
+DTYPES = {'single': (np.uint32, np.float32, 32), 'half': (np.uint16, np.float16, 16)}
+
+
+def fuzz(count=1_000_000, fmt='single', seed=0):
+    """Сравнивает ieee754_batch с аппаратной арифметикой NumPy на случайных битовых кодах.
+
+    Возвращает число расхождений; NaN сравниваются только по факту NaN.
+    """
+    uint_type, float_type, width = DTYPES[fmt]
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, 1 << width, count, dtype=np.uint64).astype(uint_type)
+    b = rng.integers(0, 1 << width, count, dtype=np.uint64).astype(uint_type)
+    # Треть пар — близкие по порядку числа, чтобы чаще срабатывали сокращение и перенос
+    close = count // 3
+    b[:close] = (a[:close] ^ rng.integers(0, 1 << 8, close, dtype=np.uint64).astype(uint_type))
+
+    mismatches = 0
+    with np.errstate(all='ignore'):
+        expected = {
+            'add': a.view(float_type) + b.view(float_type),
+            'sub': a.view(float_type) - b.view(float_type),
+            'mul': a.view(float_type) * b.view(float_type),
+        }
+    for op, reference in expected.items():
+        start = time.perf_counter()
+        result = ieee754_batch(op, a, b, fmt)
+        elapsed = time.perf_counter() - start
+        both_nan = np.isnan(reference) & np.isnan(result.view(float_type))
+        bad = int(np.count_nonzero((result != reference.view(uint_type)) & ~both_nan))
+        mismatches += bad
+        print(f"{fmt} {op}: {count / elapsed:12.0f} пар/с, расхождений: {bad}")
+    return mismatches
+
+
+if __name__ == "__main__":
+    failures = fuzz(fmt='single') + fuzz(fmt='half')
+    sys.exit(1 if failures else 0)
@@ -1,23 +1,98 @@
 # binary_divide.py
-precision = 5
-def binary_divide(x, y):
-    """Делит два числа в прямом коде с точностью до 5 знаков после запятой."""
+from decimal import Decimal
+from fractions import Fraction
+
+precision = 5  # Число знаков после запятой по умолчанию
+METHODS = ('restoring', 'non_restoring', 'repeated')
+
+
+def restoring_divide(dividend, divisor):
+    """Деление с восстановлением остатка: один сдвиг и одно вычитание на бит делимого."""
+    quotient = 0
+    remainder = 0
+    for i in range(dividend.bit_length() - 1, -1, -1):
+        remainder = (remainder << 1) | ((dividend >> i) & 1)
+        remainder -= divisor
+        if remainder < 0:
+            remainder += divisor  # Восстанавливаем остаток
+            quotient <<= 1
+        else:
+            quotient = (quotient << 1) | 1
+    return quotient, remainder
+
+
+def non_restoring_divide(dividend, divisor):
+    """Деление без восстановления остатка: знак остатка выбирает вычитание или сложение."""
+    quotient = 0
+    remainder = 0
+    for i in range(dividend.bit_length() - 1, -1, -1):
+        bit = (dividend >> i) & 1
+        if remainder >= 0:
+            remainder = ((remainder << 1) | bit) - divisor
+        else:
+            remainder = ((remainder << 1) | bit) + divisor
+        quotient = (quotient << 1) | (remainder >= 0)
+    if remainder < 0:
+        remainder += divisor  # Итоговая коррекция
+    return quotient, remainder
+
+
+def repeated_subtract_divide(dividend, divisor):
+    """Исходный способ: вычитание делителя по одному разу на единицу частного."""
+    quotient = 0
+    remainder = dividend
+    while remainder >= divisor:
+        remainder -= divisor
+        quotient += 1
+    return quotient, remainder
+
+
+_DIVIDERS = {
+    'restoring': restoring_divide,
+    'non_restoring': non_restoring_divide,
+    'repeated': repeated_subtract_divide,
+}
+
+
+def _operands(x, y, method):
+    """Сводит деление x / y (целых или дробных) к делению двух неотрицательных целых."""
     if y == 0:
         raise ValueError("Деление на ноль!")
+    if method not in _DIVIDERS:
+        raise ValueError(f"Неизвестный метод деления: {method}")
     is_negative = (x < 0) ^ (y < 0)
-    x, y = abs(x), abs(y)
-    quotient = 0
-    remainder = x
-    decimal_part = 0.0
+    x, y = Fraction(abs(x)), Fraction(abs(y))
+    return is_negative, x.numerator * y.denominator, x.denominator * y.numerator
 
-    while remainder >= y:
-        remainder -= y
-        quotient += 1
-    for i in range(precision):
-        remainder *= 10
-        decimal_digit = 0
-        while remainder >= y:
-            remainder -= y
-            decimal_digit += 1
-        decimal_part += decimal_digit / (10 ** (i + 1))
-    return - (quotient + decimal_part) if is_negative else quotient + decimal_part
\ No newline at end of file
+
+def binary_divide(x, y, digits=None, method='restoring', exact=False):
+    """Делит два числа в прямом коде с точностью до digits знаков после запятой (по умолчанию 5).
+
+    Дробная часть отбрасывается, а не округляется. При exact=True возвращается
+    точная десятичная дробь Decimal, иначе float.
+    """
+    is_negative, x, y = _operands(x, y, method)
+    digits = precision if digits is None else digits
+
+    if method == 'repeated':
+        # Цифры дробной части получаем по одной, как в исходной реализации
+        quotient, remainder = repeated_subtract_divide(x, y)
+        scaled = quotient
+        for _ in range(digits):
+            digit, remainder = repeated_subtract_divide(remainder * 10, y)
+            scaled = scaled * 10 + digit
+    else:
+        scaled, _ = _DIVIDERS[method](x * 10 ** digits, y)
+
+    result = Decimal(-scaled if is_negative else scaled).scaleb(-digits)
+    return result if exact else float(result)
+
+
+def binary_fraction(x, y, bits=None, method='restoring'):
+    """Возвращает частное в виде двоичной дроби с bits разрядами после точки, например '-10.1000'."""
+    is_negative, x, y = _operands(x, y, method)
+    bits = precision if bits is None else bits
+    scaled, _ = _DIVIDERS[method](x << bits, y)
+    integer, fraction = scaled >> bits, scaled & ((1 << bits) - 1)
+    text = format(integer, 'b') + ('.' + format(fraction, f'0{bits}b') if bits else '')
+    return ('-' if is_negative and scaled else '') + text
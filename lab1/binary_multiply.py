@@ -1,13 +1,80 @@
 # binary_multiply.py
 
-def binary_multiply(x, y):
-    """Умножает два числа в прямом коде, учитывая знак."""
-    is_negative = (x < 0) ^ (y < 0)
-    x, y = abs(x), abs(y)
+METHODS = ('shift_add', 'booth', 'karatsuba')
+KARATSUBA_CUTOFF = 2048  # Ниже этой разрядности Карацуба переходит на умножение по Буту
+
+
+def shift_add_multiply(x, y, trace=None):
+    """Умножение сдвигом и сложением для неотрицательных чисел."""
     result = 0
+    step = 0
     while y > 0:
-        if y % 2 == 1:
+        if y & 1:
             result += x
+        if trace is not None:
+            trace.append(f"Шаг {step}: бит {y & 1}, частичное произведение {x if y & 1 else 0}, сумма {result}")
         x <<= 1
         y >>= 1
-    return -result if is_negative else result
\ No newline at end of file
+        step += 1
+    return result
+
+
+def booth_multiply(x, y, trace=None):
+    """Умножение по Буту с основанием 4: по одному частичному произведению на пару бит множителя."""
+    result = 0
+    prev = 0  # Бит y[-1]
+    shift = 0
+    while y > 0 or prev:
+        triple = ((y & 3) << 1) | prev
+        # Перекодировка тройки бит в цифру из {-2, -1, 0, 1, 2}
+        digit = (0, 1, 1, 2, -2, -1, -1, 0)[triple]
+        partial = (digit * x) << shift
+        result += partial
+        if trace is not None:
+            trace.append(f"Шаг {shift // 2}: цифра {digit:+d}, частичное произведение {partial}, сумма {result}")
+        prev = (y >> 1) & 1
+        y >>= 2
+        shift += 2
+    return result
+
+
+def karatsuba_multiply(x, y, trace=None, _depth=0):
+    """Умножение Карацубы: три рекурсивных умножения половин вместо четырёх."""
+    n = max(x.bit_length(), y.bit_length())
+    if n <= KARATSUBA_CUTOFF:
+        result = booth_multiply(x, y)
+        if trace is not None:
+            trace.append(f"{'  ' * _depth}База ({n} бит): {result}")
+        return result
+
+    half = n // 2
+    mask = (1 << half) - 1
+    x_high, x_low = x >> half, x & mask
+    y_high, y_low = y >> half, y & mask
+    high = karatsuba_multiply(x_high, y_high, trace, _depth + 1)
+    low = karatsuba_multiply(x_low, y_low, trace, _depth + 1)
+    middle = karatsuba_multiply(x_high + x_low, y_high + y_low, trace, _depth + 1) - high - low
+    result = (high << (2 * half)) + (middle << half) + low
+    if trace is not None:
+        trace.append(f"{'  ' * _depth}Склейка ({n} бит, половина {half}): {result}")
+    return result
+
+
+_MULTIPLIERS = {
+    'shift_add': shift_add_multiply,
+    'booth': booth_multiply,
+    'karatsuba': karatsuba_multiply,
+}
+
+
+def binary_multiply(x, y, method='shift_add', trace=None):
+    """Умножает два числа в прямом коде, учитывая знак.
+
+    trace — необязательный список, в который дописываются шаги алгоритма;
+    без него трассировка не выполняется.
+    """
+    if method not in _MULTIPLIERS:
+        raise ValueError(f"Неизвестный метод умножения: {method}")
+    is_negative = (x < 0) ^ (y < 0)
+    result = _MULTIPLIERS[method](abs(x), abs(y), trace)
+    return -result if is_negative else result
@@ -0,0 +1,88 @@
+# code_cache.py
+# Ленивые таблицы готовых кодов для малых разрядностей (до 16 бит): каждая
+# ячейка вычисляется при первом обращении, таблицы вытесняются по LRU,
+# когда их суммарный размер превышает бюджет памяти.
+import sys
+from collections import OrderedDict
+
+CACHE_MAX_BITS = 16
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+def _entry_size(entry):
+    """Приблизительный размер записи в байтах (кортеж строк или строка)."""
+    if isinstance(entry, tuple):
+        unique = {id(item): item for item in entry}
+        return sys.getsizeof(entry) + sum(sys.getsizeof(item) for item in unique.values())
+    return sys.getsizeof(entry)
+
+
+class CodeCache:
+    """Кэш таблиц кодов, ключ — вид кода и разрядность."""
+
+    def __init__(self, max_bits=CACHE_MAX_BITS, max_bytes=CACHE_MAX_BYTES):
+        self.enabled = True
+        self.max_bits = max_bits
+        self.max_bytes = max_bytes
+        self.tables = OrderedDict()  # ключ -> [список ячеек, размер в байтах]
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+
+    def usable(self, bits):
+        return self.enabled and bits <= self.max_bits
+
+    def get(self, key, size, index, build, *args):
+        """Возвращает ячейку index таблицы key; при промахе вычисляет её через build(*args)."""
+        table = self.tables.get(key)
+        if table is None:
+            table = [[None] * size, 0]
+            table[1] = sys.getsizeof(table[0])
+            self.tables[key] = table
+            self.nbytes += table[1]
+        else:
+            self.tables.move_to_end(key)
+
+        entry = table[0][index]
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        entry = build(*args)
+        table[0][index] = entry
+        grown = _entry_size(entry)
+        table[1] += grown
+        self.nbytes += grown
+        self._evict(keep=key)
+        return entry
+
+    def _evict(self, keep):
+        while self.nbytes > self.max_bytes and len(self.tables) > 1:
+            key, table = next(iter(self.tables.items()))
+            if key == keep:
+                break
+            del self.tables[key]
+            self.nbytes -= table[1]
+            self.evictions += 1
+
+    def clear(self):
+        self.tables.clear()
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Метрики: попадания, промахи, доля попаданий, вытеснения и занятая память."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'bytes': self.nbytes,
+            'tables': {key: table[1] for key, table in self.tables.items()},
+        }
+
+
+CODE_CACHE = CodeCache()
@@ -1,33 +1,161 @@
-from to_binary import to_binary
+import math
+import struct
+from fractions import Fraction
 
-# Глобальные переменные
+from code_cache import CODE_CACHE
+
+try:
+    import numpy as np
+except ImportError:  # Векторный путь необязателен
+    np = None
+
+# Глобальные переменные (одинарная точность)
 EXPONENT_OFFSET = 127  # Смещение для экспоненты
 MANTISSA_BITS = 23  # Количество бит для мантиссы
 
+# Формат: (бит экспоненты, бит мантиссы, символ struct, целочисленный тип NumPy)
+FORMATS = {
+    'half': (5, 10, '>e', 'uint16'),
+    'single': (8, 23, '>f', 'uint32'),
+    'double': (11, 52, '>d', 'uint64'),
+}
+ROUNDING_MODES = ('nearest_even', 'toward_zero', 'up', 'down')
+
+
+def _format(fmt):
+    if fmt not in FORMATS:
+        raise ValueError(f"Неизвестный формат IEEE-754: {fmt}")
+    return FORMATS[fmt]
+
+
+def encode_ieee754(num, fmt='single', rounding='nearest_even'):
+    """Кодирует число в поля IEEE-754 (знак, смещённая экспонента, мантисса) без потери точности.
 
-def float_to_ieee754(num):
-    """Преобразует число с плавающей точкой в формат IEEE-754 (32-бит)."""
-    sign = '0' if num >= 0 else '1'
-    num = abs(num)
-    exponent = EXPONENT_OFFSET
+    rounding: 'nearest_even' — к ближайшему чётному, 'toward_zero' — отбрасывание,
+    'up' — к +inf, 'down' — к -inf.
+    """
+    exp_bits, man_bits, struct_fmt, _ = _format(fmt)
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Неизвестный режим округления: {rounding}")
+    width = 1 + exp_bits + man_bits
 
-    while num >= 2:
-        num /= 2
-        exponent += 1
-    while num < 1 and num != 0:
-        num *= 2
-        exponent -= 1
+    if rounding == 'nearest_even' and isinstance(num, float):
+        try:
+            bits = int.from_bytes(struct.pack(struct_fmt, num), 'big')
+        except OverflowError:
+            pass  # Переполнение формата разбираем ниже
+        else:
+            return bits >> (width - 1), (bits >> man_bits) & ((1 << exp_bits) - 1), bits & ((1 << man_bits) - 1)
+
+    exp_max = (1 << exp_bits) - 1
+    if isinstance(num, float) and math.isnan(num):
+        return int(math.copysign(1, num) < 0), exp_max, 1 << (man_bits - 1)
+    sign = int(math.copysign(1, num) < 0) if isinstance(num, float) else int(num < 0)
+    if isinstance(num, float) and math.isinf(num):
+        return sign, exp_max, 0
+    if num == 0:
+        return sign, 0, 0
+
+    value = abs(Fraction(num))
+    p, q = value.numerator, value.denominator
+    # Порядок e такой, что 2^e <= value < 2^(e+1)
+    e = p.bit_length() - q.bit_length()
+    if (p << max(0, -e)) < (q << max(0, e)):
+        e -= 1
 
-    mantissa = num - 1
-    mantissa_bin = []
+    bias = (1 << (exp_bits - 1)) - 1
+    e_min = 1 - bias
+    subnormal = e < e_min
+    scale = (e_min if subnormal else e) - man_bits
+    significand, remainder = divmod(p << max(0, -scale), q << max(0, scale))
+    denominator = q << max(0, scale)
 
-    for _ in range(MANTISSA_BITS):
-        mantissa *= 2
-        if mantissa >= 1:
-            mantissa_bin.append('1')
-            mantissa -= 1
+    if remainder:
+        if rounding == 'nearest_even':
+            round_up = 2 * remainder > denominator or (2 * remainder == denominator and significand & 1)
+        elif rounding == 'up':
+            round_up = not sign
+        elif rounding == 'down':
+            round_up = bool(sign)
         else:
-            mantissa_bin.append('0')
+            round_up = False
+        significand += round_up
+
+    if subnormal:
+        # После округления субнормальное число может стать минимальным нормальным
+        return sign, int(significand >> man_bits), significand & ((1 << man_bits) - 1)
+
+    if significand >> (man_bits + 1):
+        significand >>= 1
+        e += 1
+    exponent = e + bias
+    if exponent >= exp_max:
+        to_infinity = rounding == 'nearest_even' or (rounding == 'up' and not sign) or (rounding == 'down' and sign)
+        if to_infinity:
+            return sign, exp_max, 0
+        return sign, exp_max - 1, (1 << man_bits) - 1
+    return sign, exponent, significand - (1 << man_bits)
+
+
+def decode_ieee754(sign, exponent, mantissa, fmt='single'):
+    """Восстанавливает значение из полей IEEE-754 (точно, так как формат не шире double)."""
+    exp_bits, man_bits, _, _ = _format(fmt)
+    exp_max = (1 << exp_bits) - 1
+    bias = exp_max >> 1
+    if exponent == exp_max:
+        value = math.nan if mantissa else math.inf
+    elif exponent == 0:
+        value = math.ldexp(mantissa, 1 - bias - man_bits)
+    else:
+        value = math.ldexp((1 << man_bits) | mantissa, exponent - bias - man_bits)
+    return -value if sign else value
+
+
+def ieee754_to_float(code, fmt='single'):
+    """Разбирает строку вида '0 01111111 100...' обратно в число."""
+    sign, exponent, mantissa = code.split()
+    return decode_ieee754(int(sign, 2), int(exponent, 2), int(mantissa, 2), fmt)
+
+
+def float_to_ieee754(num, fmt='single', rounding='nearest_even'):
+    """Преобразует число с плавающей точкой в формат IEEE-754 (по умолчанию 32-бит)."""
+    exp_bits, man_bits, struct_fmt, _ = _format(fmt)
+    # Половинная точность: 2^16 кодов, строку берём из таблицы по битам числа
+    if fmt == 'half' and rounding == 'nearest_even' and isinstance(num, float) and CODE_CACHE.usable(16):
+        try:
+            bits = int.from_bytes(struct.pack(struct_fmt, num), 'big')
+        except OverflowError:
+            pass
+        else:
+            return CODE_CACHE.get(('ieee754', fmt), 1 << 16, bits, _format_fields, bits >> 15, (bits >> 10) & 0x1F,
+                                  bits & 0x3FF, exp_bits, man_bits)
+    sign, exponent, mantissa = encode_ieee754(num, fmt, rounding)
+    return _format_fields(sign, exponent, mantissa, exp_bits, man_bits)
+
+
+def _format_fields(sign, exponent, mantissa, exp_bits, man_bits):
+    return f"{sign} {exponent:0{exp_bits}b} {mantissa:0{man_bits}b}"
+
+
+def float_to_ieee754_batch(values, fmt='single', rounding='nearest_even'):
+    """Кодирует массив чисел; возвращает три целочисленных массива: знаки, экспоненты, мантиссы.
+
+    С NumPy и округлением к ближайшему чётному работает векторно через приведение
+    типа и побитовые операции, иначе — поэлементно через encode_ieee754.
+    """
+    exp_bits, man_bits, _, uint_type = _format(fmt)
+    if np is not None and rounding == 'nearest_even':
+        with np.errstate(over='ignore'):
+            floats = np.asarray(values, dtype=np.float64).astype(np.dtype(f'float{1 + exp_bits + man_bits}'))
+        bits = floats.view(uint_type)
+        width = 1 + exp_bits + man_bits
+        sign = bits >> np.array(width - 1, dtype=uint_type)
+        exponent = (bits >> np.array(man_bits, dtype=uint_type)) & np.array((1 << exp_bits) - 1, dtype=uint_type)
+        mantissa = bits & np.array((1 << man_bits) - 1, dtype=uint_type)
+        return sign, exponent, mantissa
 
-    exponent_bin = to_binary(exponent, 8)
-    return f"{sign} {exponent_bin} {''.join(mantissa_bin)}"
\ No newline at end of file
+    fields = [encode_ieee754(float(v), fmt, rounding) for v in values]
+    if np is not None:
+        columns = np.array(fields, dtype=np.uint64).reshape(-1, 3).T
+        return tuple(np.ascontiguousarray(c.astype(uint_type)) for c in columns)
+    return tuple(list(c) for c in zip(*fields)) if fields else ([], [], [])
@@ -1,13 +1,343 @@
 # ieee754_addition.py
+# Программная (soft-float) арифметика над закодированными битами IEEE-754:
+# выравнивание порядков, сложение мантисс, нормализация и округление
+# с битами guard/round/sticky (три младших бита рабочей мантиссы).
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from float_to_ieee754 import float_to_ieee754
-
-def ieee754_addition(num1, num2):
-    """Сложение двух чисел с плавающей точкой в формате IEEE-754 (32-бит)."""
-    n1_ieee = float_to_ieee754(num1)
-    n2_ieee = float_to_ieee754(num2)
-    result = num1 + num2
-    result_ieee = float_to_ieee754(result)
-    return n1_ieee, n2_ieee, result, result_ieee
\ No newline at end of file
+from float_to_ieee754 import float_to_ieee754, encode_ieee754, decode_ieee754, FORMATS, ROUNDING_MODES
+
+try:
+    import numpy as np
+except ImportError:  # Пакетный режим работает и без NumPy, но поэлементно
+    np = None
+
+GRS_BITS = 3  # guard, round, sticky
+
+
+def pack_bits(sign, exponent, mantissa, fmt='single'):
+    """Собирает поля IEEE-754 в одно целое."""
+    exp_bits, man_bits, _, _ = FORMATS[fmt]
+    return (sign << (exp_bits + man_bits)) | (exponent << man_bits) | mantissa
+
+
+def unpack_bits(bits, fmt='single'):
+    """Разбирает целое на поля IEEE-754: знак, смещённую экспоненту, мантиссу."""
+    exp_bits, man_bits, _, _ = FORMATS[fmt]
+    return bits >> (exp_bits + man_bits), (bits >> man_bits) & ((1 << exp_bits) - 1), bits & ((1 << man_bits) - 1)
+
+
+def _shift_right_sticky(value, shift):
+    """Сдвиг вправо, при котором все вытолкнутые единицы собираются в младший (sticky) бит."""
+    if shift <= 0:
+        return value
+    if shift >= value.bit_length():
+        return 1 if value else 0
+    return (value >> shift) | ((value & ((1 << shift) - 1)) != 0)
+
+
+def _nan(fmt):
+    exp_bits, man_bits, _, _ = FORMATS[fmt]
+    return pack_bits(0, (1 << exp_bits) - 1, 1 << (man_bits - 1), fmt)
+
+
+def _round_pack(sign, exponent, significand, fmt, rounding):
+    """Округляет рабочую мантиссу (со скрытым битом и GRS) и упаковывает результат.
+
+    exponent — смещённый порядок (не меньше 1); если скрытый бит не выставлен,
+    число субнормальное.
+    """
+    exp_bits, man_bits, _, _ = FORMATS[fmt]
+    exp_max = (1 << exp_bits) - 1
+    low = significand & ((1 << GRS_BITS) - 1)
+    significand >>= GRS_BITS
+    if low:
+        half = 1 << (GRS_BITS - 1)
+        if rounding == 'nearest_even':
+            significand += low > half or (low == half and significand & 1)
+        elif rounding == 'up':
+            significand += not sign
+        elif rounding == 'down':
+            significand += sign
+    if significand >> (man_bits + 1):
+        significand >>= 1
+        exponent += 1
+    if exponent >= exp_max:
+        if rounding == 'nearest_even' or (rounding == 'up' and not sign) or (rounding == 'down' and sign):
+            return pack_bits(sign, exp_max, 0, fmt)
+        return pack_bits(sign, exp_max - 1, (1 << man_bits) - 1, fmt)
+    if not significand >> man_bits:
+        exponent = 0  # Субнормальное число
+    return pack_bits(sign, exponent, significand & ((1 << man_bits) - 1), fmt)
+
+
+def _operand(bits, fmt):
+    """Знак, эффективный порядок и мантисса со скрытым битом."""
+    _, man_bits, _, _ = FORMATS[fmt]
+    sign, exponent, mantissa = unpack_bits(bits, fmt)
+    if exponent == 0:
+        return sign, 1, mantissa
+    return sign, exponent, mantissa | (1 << man_bits)
+
+
+def ieee754_add_bits(a, b, fmt='single', rounding='nearest_even'):
+    """Складывает два числа, заданных битами IEEE-754; результат — тоже биты."""
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Неизвестный режим округления: {rounding}")
+    exp_bits, man_bits, _, _ = FORMATS[fmt]
+    exp_max = (1 << exp_bits) - 1
+    sign_a, exp_a, man_a = unpack_bits(a, fmt)
+    sign_b, exp_b, man_b = unpack_bits(b, fmt)
+
+    # Специальные значения
+    if (exp_a == exp_max and man_a) or (exp_b == exp_max and man_b):
+        return _nan(fmt)
+    if exp_a == exp_max or exp_b == exp_max:
+        if exp_a == exp_b and sign_a != sign_b:
+            return _nan(fmt)  # inf + (-inf)
+        return a if exp_a == exp_max else b
+
+    sign_a, exp_a, sig_a = _operand(a, fmt)
+    sign_b, exp_b, sig_b = _operand(b, fmt)
+    sig_a <<= GRS_BITS
+    sig_b <<= GRS_BITS
+    if (exp_a, sig_a) < (exp_b, sig_b):
+        sign_a, exp_a, sig_a, sign_b, exp_b, sig_b = sign_b, exp_b, sig_b, sign_a, exp_a, sig_a
+
+    # Выравнивание порядков: меньшее слагаемое сдвигается вправо с учётом sticky
+    sig_b = _shift_right_sticky(sig_b, exp_a - exp_b)
+    exponent = exp_a
+
+    if sign_a == sign_b:
+        significand = sig_a + sig_b
+        if significand >> (man_bits + 1 + GRS_BITS):
+            significand = _shift_right_sticky(significand, 1)
+            exponent += 1
+    else:
+        significand = sig_a - sig_b
+        if significand == 0:
+            return pack_bits(int(rounding == 'down'), 0, 0, fmt)
+        # Нормализация влево после вычитания, но не ниже минимального порядка
+        shift = min(man_bits + 1 + GRS_BITS - significand.bit_length(), exponent - 1)
+        if shift > 0:
+            significand <<= shift
+            exponent -= shift
+
+    return _round_pack(sign_a, exponent, significand, fmt, rounding)
+
+
+def ieee754_sub_bits(a, b, fmt='single', rounding='nearest_even'):
+    """Вычитание: сложение с противоположным знаком второго операнда."""
+    exp_bits, man_bits, _, _ = FORMATS[fmt]
+    return ieee754_add_bits(a, b ^ (1 << (exp_bits + man_bits)), fmt, rounding)
+
+
+def ieee754_mul_bits(a, b, fmt='single', rounding='nearest_even'):
+    """Умножает два числа, заданных битами IEEE-754."""
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Неизвестный режим округления: {rounding}")
+    exp_bits, man_bits, _, _ = FORMATS[fmt]
+    exp_max = (1 << exp_bits) - 1
+    bias = exp_max >> 1
+    sign_a, exp_a, man_a = unpack_bits(a, fmt)
+    sign_b, exp_b, man_b = unpack_bits(b, fmt)
+    sign = sign_a ^ sign_b
+
+    a_zero, b_zero = exp_a == 0 and man_a == 0, exp_b == 0 and man_b == 0
+    if (exp_a == exp_max and man_a) or (exp_b == exp_max and man_b):
+        return _nan(fmt)
+    if exp_a == exp_max or exp_b == exp_max:
+        return _nan(fmt) if a_zero or b_zero else pack_bits(sign, exp_max, 0, fmt)
+    if a_zero or b_zero:
+        return pack_bits(sign, 0, 0, fmt)
+
+    _, exp_a, sig_a = _operand(a, fmt)
+    _, exp_b, sig_b = _operand(b, fmt)
+    # Субнормальные сомножители нормализуем, позволяя порядку уйти ниже 1
+    for_a = man_bits + 1 - sig_a.bit_length()
+    for_b = man_bits + 1 - sig_b.bit_length()
+    sig_a, exp_a = sig_a << for_a, exp_a - for_a
+    sig_b, exp_b = sig_b << for_b, exp_b - for_b
+
+    exponent = exp_a + exp_b - bias
+    significand = _shift_right_sticky(sig_a * sig_b, man_bits - GRS_BITS)
+    if significand >> (man_bits + 1 + GRS_BITS):
+        significand = _shift_right_sticky(significand, 1)
+        exponent += 1
+    if exponent < 1:
+        significand = _shift_right_sticky(significand, 1 - exponent)
+        exponent = 1
+    return _round_pack(sign, exponent, significand, fmt, rounding)
+
+
+def _to_bits(num, fmt, rounding):
+    return pack_bits(*encode_ieee754(num, fmt, rounding), fmt)
+
+
+def _from_bits(bits, fmt):
+    return decode_ieee754(*unpack_bits(bits, fmt), fmt)
+
+
+def ieee754_addition(num1, num2, fmt='single', rounding='nearest_even'):
+    """Сложение двух чисел с плавающей точкой в формате IEEE-754 (по умолчанию 32-бит)."""
+    n1_ieee = float_to_ieee754(num1, fmt, rounding)
+    n2_ieee = float_to_ieee754(num2, fmt, rounding)
+    result_bits = ieee754_add_bits(_to_bits(num1, fmt, rounding), _to_bits(num2, fmt, rounding), fmt, rounding)
+    result = _from_bits(result_bits, fmt)
+    result_ieee = float_to_ieee754(result, fmt)
+    return n1_ieee, n2_ieee, result, result_ieee
+
+
+# Пакетный режим: тот же алгоритм над массивами NumPy (int64 вмещает рабочие
+# мантиссы половинной и одинарной точности вместе с произведением).
+BATCH_OPERATIONS = {'add': ieee754_add_bits, 'sub': ieee754_sub_bits, 'mul': ieee754_mul_bits}
+VECTOR_FORMATS = ('half', 'single')
+
+
+def _v_bit_length(values):
+    return np.frexp(values.astype(np.float64))[1].astype(np.int64)
+
+
+def _v_shift_right_sticky(values, shift):
+    shift = np.clip(shift, 0, 62)
+    lost = (values & ((np.int64(1) << shift) - 1)) != 0
+    return (values >> shift) | lost
+
+
+def _v_operand(bits, fmt):
+    exp_bits, man_bits, _, _ = FORMATS[fmt]
+    sign = (bits >> (exp_bits + man_bits)) & 1
+    exponent = (bits >> man_bits) & ((1 << exp_bits) - 1)
+    mantissa = bits & ((1 << man_bits) - 1)
+    significand = np.where(exponent == 0, mantissa, mantissa | (1 << man_bits))
+    return sign, exponent, mantissa, np.maximum(exponent, 1), significand
+
+
+def _v_round_pack(sign, exponent, significand, fmt, rounding):
+    exp_bits, man_bits, _, _ = FORMATS[fmt]
+    exp_max = (1 << exp_bits) - 1
+    low = significand & ((1 << GRS_BITS) - 1)
+    significand = significand >> GRS_BITS
+    half = 1 << (GRS_BITS - 1)
+    if rounding == 'nearest_even':
+        round_up = (low > half) | ((low == half) & ((significand & 1) == 1))
+    elif rounding == 'up':
+        round_up = (low != 0) & (sign == 0)
+    elif rounding == 'down':
+        round_up = (low != 0) & (sign == 1)
+    else:
+        round_up = np.zeros_like(low, dtype=bool)
+    significand = significand + round_up
+    carry = (significand >> (man_bits + 1)) != 0
+    significand = np.where(carry, significand >> 1, significand)
+    exponent = exponent + carry
+
+    exponent = np.where((significand >> man_bits) != 0, exponent, 0)
+    mantissa = significand & ((1 << man_bits) - 1)
+    overflow = exponent >= exp_max
+    if rounding == 'nearest_even':
+        to_infinity = overflow
+    elif rounding == 'up':
+        to_infinity = overflow & (sign == 0)
+    elif rounding == 'down':
+        to_infinity = overflow & (sign == 1)
+    else:
+        to_infinity = np.zeros_like(overflow)
+    exponent = np.where(to_infinity, exp_max, np.where(overflow, exp_max - 1, exponent))
+    mantissa = np.where(to_infinity, 0, np.where(overflow, (1 << man_bits) - 1, mantissa))
+    return (sign << (exp_bits + man_bits)) | (exponent << man_bits) | mantissa
+
+
+def _v_add(a, b, fmt, rounding):
+    exp_bits, man_bits, _, _ = FORMATS[fmt]
+    exp_max = (1 << exp_bits) - 1
+    sign_a, field_a, man_a, exp_a, sig_a = _v_operand(a, fmt)
+    sign_b, field_b, man_b, exp_b, sig_b = _v_operand(b, fmt)
+    sig_a, sig_b = sig_a << GRS_BITS, sig_b << GRS_BITS
+
+    swap = (exp_a < exp_b) | ((exp_a == exp_b) & (sig_a < sig_b))
+    sign_big, sign_small = np.where(swap, sign_b, sign_a), np.where(swap, sign_a, sign_b)
+    exp_big, exp_small = np.where(swap, exp_b, exp_a), np.where(swap, exp_a, exp_b)
+    sig_big, sig_small = np.where(swap, sig_b, sig_a), np.where(swap, sig_a, sig_b)
+
+    sig_small = _v_shift_right_sticky(sig_small, exp_big - exp_small)
+    same = sign_big == sign_small
+    significand = np.where(same, sig_big + sig_small, sig_big - sig_small)
+    exponent = exp_big
+
+    carry = same & ((significand >> (man_bits + 1 + GRS_BITS)) != 0)
+    significand = np.where(carry, (significand >> 1) | (significand & 1), significand)
+    exponent = exponent + carry
+
+    shift = np.minimum(man_bits + 1 + GRS_BITS - _v_bit_length(significand), exponent - 1)
+    shift = np.where(~same & (significand != 0), np.maximum(shift, 0), 0)
+    significand = significand << shift
+    exponent = exponent - shift
+
+    result = _v_round_pack(sign_big, exponent, significand, fmt, rounding)
+    cancelled = ~same & (significand == 0)
+    result = np.where(cancelled, np.int64(rounding == 'down') << (exp_bits + man_bits), result)
+
+    nan_a, nan_b = (field_a == exp_max) & (man_a != 0), (field_b == exp_max) & (man_b != 0)
+    inf_a, inf_b = (field_a == exp_max) & (man_a == 0), (field_b == exp_max) & (man_b == 0)
+    nan = nan_a | nan_b | (inf_a & inf_b & (sign_a != sign_b))
+    result = np.where(inf_b, b, result)
+    result = np.where(inf_a, a, result)
+    return np.where(nan, _nan(fmt), result)
+
+
+def _v_mul(a, b, fmt, rounding):
+    exp_bits, man_bits, _, _ = FORMATS[fmt]
+    exp_max = (1 << exp_bits) - 1
+    bias = exp_max >> 1
+    sign_a, field_a, man_a, exp_a, sig_a = _v_operand(a, fmt)
+    sign_b, field_b, man_b, exp_b, sig_b = _v_operand(b, fmt)
+    sign = sign_a ^ sign_b
+
+    zero_a, zero_b = (field_a == 0) & (man_a == 0), (field_b == 0) & (man_b == 0)
+    for_a = np.where(zero_a, 0, man_bits + 1 - _v_bit_length(sig_a))
+    for_b = np.where(zero_b, 0, man_bits + 1 - _v_bit_length(sig_b))
+    sig_a, exp_a = sig_a << for_a, exp_a - for_a
+    sig_b, exp_b = sig_b << for_b, exp_b - for_b
+
+    exponent = exp_a + exp_b - bias
+    significand = _v_shift_right_sticky(sig_a * sig_b, np.int64(man_bits - GRS_BITS))
+    carry = (significand >> (man_bits + 1 + GRS_BITS)) != 0
+    significand = np.where(carry, (significand >> 1) | (significand & 1), significand)
+    exponent = exponent + carry
+    underflow = exponent < 1
+    significand = np.where(underflow, _v_shift_right_sticky(significand, 1 - exponent), significand)
+    exponent = np.where(underflow, 1, exponent)
+
+    result = _v_round_pack(sign, exponent, significand, fmt, rounding)
+    nan_a, nan_b = (field_a == exp_max) & (man_a != 0), (field_b == exp_max) & (man_b != 0)
+    inf_a, inf_b = (field_a == exp_max) & (man_a == 0), (field_b == exp_max) & (man_b == 0)
+    signed_zero = sign << (exp_bits + man_bits)
+    result = np.where(zero_a | zero_b, signed_zero, result)
+    result = np.where(inf_a | inf_b, signed_zero | (exp_max << man_bits), result)
+    nan = nan_a | nan_b | ((inf_a | inf_b) & (zero_a | zero_b))
+    return np.where(nan, _nan(fmt), result)
+
+
+def ieee754_batch(op, a, b, fmt='single', rounding='nearest_even'):
+    """Выполняет операцию ('add', 'sub', 'mul') над массивами битовых кодов IEEE-754.
+
+    Для половинной и одинарной точности при наличии NumPy вычисления идут
+    векторно; иначе — поэлементно через ieee754_*_bits.
+    """
+    if op not in BATCH_OPERATIONS:
+        raise ValueError(f"Неизвестная операция: {op}")
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Неизвестный режим округления: {rounding}")
+    if np is None or fmt not in VECTOR_FORMATS:
+        scalar = BATCH_OPERATIONS[op]
+        result = [scalar(int(x), int(y), fmt, rounding) for x, y in zip(a, b)]
+        return np.array(result, dtype=FORMATS[fmt][3]) if np is not None else result
+
+    exp_bits, man_bits, _, uint_type = FORMATS[fmt]
+    a = np.asarray(a).astype(np.int64)
+    b = np.asarray(b).astype(np.int64)
+    if op == 'sub':
+        b = b ^ (1 << (exp_bits + man_bits))
+    result = _v_mul(a, b, fmt, rounding) if op == 'mul' else _v_add(a, b, fmt, rounding)
+    return result.astype(uint_type)
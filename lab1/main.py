@@ -1,4 +1,5 @@
 # main.py
+import sys
 from to_binary import to_binary
 from to_signed_binary import to_signed_binary
 from binary_addition import binary_addition
@@ -6,6 +7,13 @@ from binary_subtraction import binary_subtraction
 from binary_multiply import binary_multiply
 from binary_divide import binary_divide
 from ieee754_addition import ieee754_addition
+from stream import cli
+
+UNREPRESENTABLE = "не представимо"  # -2^(n-1) не имеет прямого и обратного кода той же разрядности
+
+
+def _code(code):
+    return UNREPRESENTABLE if code is None else code
 
 def main():
     # Ввод целых чисел
@@ -38,8 +46,8 @@ def main():
     print("\nСложение:")
     sum_result, direct_sum, reverse_sum, additional_sum = binary_addition(additional1, additional2)
     print(f"Результат сложения (десятичный): {sum_result}")
-    print(f"Результат сложения (двоичный): {direct_sum}")
-    print(f"Обратный код: {reverse_sum}")
+    print(f"Результат сложения (двоичный): {_code(direct_sum)}")
+    print(f"Обратный код: {_code(reverse_sum)}")
     print(f"Дополнительный код: {additional_sum}")
 
     # Вычитание
@@ -47,13 +55,13 @@ def main():
     (first_result, first_direct, first_reverse, first_additional), (
     second_result, second_direct, second_reverse, second_additional) = binary_subtraction(additional1, additional2)
     print(f"Первая разность (десятичный): {first_result}")
-    print(f"Первая разность (двоичный): {first_direct}")
-    print(f"Обратный код (первая разность): {first_reverse}")
+    print(f"Первая разность (двоичный): {_code(first_direct)}")
+    print(f"Обратный код (первая разность): {_code(first_reverse)}")
     print(f"Дополнительный код (первая разность): {first_additional}\n")
 
     print(f"Вторая разность (десятичный): {second_result}")
-    print(f"Вторая разность (двоичный): {second_direct}")
-    print(f"Обратный код (вторая разность): {second_reverse}")
+    print(f"Вторая разность (двоичный): {_code(second_direct)}")
+    print(f"Обратный код (вторая разность): {_code(second_reverse)}")
     print(f"Дополнительный код (вторая разность): {second_additional}")
 
     # Ввод чисел с плавающей точкой
@@ -69,4 +77,7 @@ def main():
     print(f"Результат в IEEE-754: {ieee_result}")
 
 if __name__ == "__main__":
+    # С аргументами — потоковый режим (python main.py data.csv | python main.py -), без — диалоговый
+    if len(sys.argv) > 1:
+        sys.exit(cli(sys.argv[1:]))
     main()
\ No newline at end of file
@@ -0,0 +1,173 @@
+# stream.py
+# Потоковый режим: пары операндов читаются построчно из stdin или файла
+# (CSV или NDJSON), результаты пишутся пачками — память не зависит от числа строк.
+import argparse
+import csv
+import io
+import json
+import sys
+from typing import NamedTuple
+
+from binary_multiply import binary_multiply
+from binary_divide import binary_divide
+from twos_complement import add, subtract, encode
+from ieee754_addition import ieee754_addition
+
+OPERATIONS = ('mul', 'div', 'add', 'sub', 'ieee')
+COLUMNS = {
+    'mul': ['mul'],
+    'div': ['div'],
+    'add': ['add', 'add_code', 'add_overflow'],
+    'sub': ['sub', 'sub_code', 'sub_overflow'],
+    'ieee': ['ieee', 'ieee_code'],
+}
+CHUNK_ROWS = 4096  # Сколько строк копится в буфере перед записью
+
+
+def _number(value):
+    if isinstance(value, (int, float)):
+        return value
+    text = str(value).strip()
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+class BadRecord(NamedTuple):
+    """Строка входа, которую не удалось разобрать; вместо пары операндов даёт строку с ошибкой."""
+    text: str
+    error: str
+
+
+def _integer(value, op):
+    if not isinstance(value, int):
+        raise ValueError(f"Операция {op} требует целых чисел")
+    return value
+
+
+def read_pairs(source, fmt='csv'):
+    """Лениво читает пары операндов: CSV — два столбца, NDJSON — объекты {"a": ..., "b": ...}.
+
+    Испорченная строка NDJSON не прерывает поток: вместо пары выдаётся BadRecord.
+    """
+    if fmt == 'ndjson':
+        for line in source:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except ValueError as e:
+                yield BadRecord(line, f"Некорректный JSON: {e}")
+                continue
+            if not isinstance(obj, dict):
+                yield BadRecord(line, "Ожидался JSON-объект")
+                continue
+            yield obj.get('a'), obj.get('b')
+        return
+
+    for index, row in enumerate(csv.reader(source)):
+        if not row:
+            continue
+        if index == 0 and not _is_number(row[0]):
+            continue  # Заголовок
+        yield row[0], row[1] if len(row) > 1 else None
+
+
+def _is_number(text):
+    try:
+        _number(text)
+        return True
+    except ValueError:
+        return False
+
+
+def evaluate_row(a, b, operations=OPERATIONS, bits=8):
+    """Выполняет выбранные операции над одной парой; ошибки попадают в поле error."""
+    row = {'a': a, 'b': b}
+    errors = []
+    try:
+        a, b = _number(a), _number(b)
+    except (TypeError, ValueError):
+        row['error'] = "Некорректные операнды"
+        return row
+
+    for op in operations:
+        try:
+            if op == 'mul':
+                row['mul'] = binary_multiply(_integer(a, op), _integer(b, op))
+            elif op == 'div':
+                row['div'] = round(binary_divide(a, b), 5)
+            elif op in ('add', 'sub'):
+                code1 = encode(_integer(a, op), bits)[2]
+                code2 = encode(_integer(b, op), bits)[2]
+                codes, flags = add(code1, code2) if op == 'add' else subtract(code1, code2)
+                row[op], row[f'{op}_code'], row[f'{op}_overflow'] = codes[0], codes[3], flags['overflow']
+            elif op == 'ieee':
+                _, _, result, result_ieee = ieee754_addition(float(a), float(b))
+                row['ieee'], row['ieee_code'] = result, result_ieee
+            else:
+                raise ValueError(f"Неизвестная операция: {op}")
+        except (ValueError, OverflowError) as e:
+            errors.append(f"{op}: {e}")
+
+    if errors:
+        row['error'] = "; ".join(errors)
+    return row
+
+
+def write_rows(rows, sink, fmt='csv', operations=OPERATIONS):
+    """Пишет результаты в sink пачками по CHUNK_ROWS строк."""
+    columns = ['a', 'b'] + [c for op in operations for c in COLUMNS.get(op, [])] + ['error']
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    if fmt == 'csv':
+        writer.writerow(columns)
+
+    count = 0
+    for count, row in enumerate(rows, 1):
+        if fmt == 'csv':
+            writer.writerow([row.get(c, '') for c in columns])
+        else:
+            buffer.write(json.dumps(row, ensure_ascii=False))
+            buffer.write('\n')
+        if count % CHUNK_ROWS == 0:
+            sink.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+    sink.write(buffer.getvalue())
+    return count
+
+
+def run_stream(source, sink, fmt='csv', output_fmt=None, operations=OPERATIONS, bits=8):
+    """Обрабатывает весь поток и возвращает число строк."""
+    pairs = read_pairs(source, fmt)
+    rows = ({'a': pair.text, 'error': pair.error} if isinstance(pair, BadRecord)
+            else evaluate_row(pair[0], pair[1], operations, bits) for pair in pairs)
+    return write_rows(rows, sink, output_fmt or fmt, operations)
+
+
+def cli(argv=None):
+    parser = argparse.ArgumentParser(description="Потоковая обработка пар операндов (lab1).")
+    parser.add_argument('input', nargs='?', default='-', help="CSV/NDJSON файл или '-' для stdin")
+    parser.add_argument('--format', choices=('csv', 'ndjson'), help="формат входа (по умолчанию — по расширению)")
+    parser.add_argument('--output-format', choices=('csv', 'ndjson'), help="формат выхода (по умолчанию — как вход)")
+    parser.add_argument('--ops', default=','.join(OPERATIONS), help="операции через запятую: " + ','.join(OPERATIONS))
+    parser.add_argument('--bits', type=int, default=8, help="разрядность для сложения и вычитания")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ('ndjson' if args.input.endswith(('.ndjson', '.jsonl')) else 'csv')
+    operations = [op for op in args.ops.split(',') if op]
+    for op in operations:
+        if op not in OPERATIONS:
+            parser.error(f"неизвестная операция: {op}")
+
+    source = sys.stdin if args.input == '-' else open(args.input, newline='', encoding='utf-8')
+    try:
+        run_stream(source, sys.stdout, fmt, args.output_format, operations, args.bits)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    sys.stdout.flush()
+    return 0
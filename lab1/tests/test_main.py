@@ -2,6 +2,8 @@
 import sys
 import os
 import unittest
+import json
+from decimal import Decimal
 from unittest.mock import patch
 from io import StringIO
 
@@ -10,11 +12,18 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from to_binary import to_binary
 from to_signed_binary import to_signed_binary
 from binary_addition import binary_addition
-from binary_multiply import binary_multiply
+from binary_multiply import binary_multiply, METHODS as MULTIPLY_METHODS
 from binary_subtraction import binary_subtraction
-from binary_divide import binary_divide
-from float_to_ieee754 import float_to_ieee754
-from ieee754_addition import ieee754_addition
+from binary_divide import binary_divide, binary_fraction, METHODS
+import float_to_ieee754 as ieee_module
+from float_to_ieee754 import float_to_ieee754, encode_ieee754, decode_ieee754, ieee754_to_float, float_to_ieee754_batch
+import ieee754_addition as soft_float
+from ieee754_addition import ieee754_addition, ieee754_add_bits, ieee754_sub_bits, ieee754_mul_bits, ieee754_batch
+import twos_complement
+from code_cache import CODE_CACHE, CodeCache
+from stream import run_stream
+import to_signed_binary_batch as batch_module
+from to_signed_binary_batch import to_signed_binary_batch
 from main import main
 
 class TestBinaryOperations(unittest.TestCase):
@@ -50,15 +59,56 @@ class TestBinaryOperations(unittest.TestCase):
         self.assertIn("Результат (десятичный):", output)
         self.assertIn("Результат в IEEE-754:", output)
 
+    @patch('builtins.input', side_effect=[-100, 28, 1.5, 1.5])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_unrepresentable_result(self, mock_stdout, mock_input):
+        # -100 - 28 = -128: в 8 битах есть только дополнительный код
+        main()
+        output = mock_stdout.getvalue()
+        self.assertIn("Первая разность (двоичный): не представимо", output)
+        self.assertIn("Обратный код (первая разность): не представимо", output)
+        self.assertIn("Дополнительный код (первая разность): 10000000", output)
+        self.assertNotIn("None", output)
+
     def test_binary_multiply(self):
         self.assertEqual(binary_multiply(3, 4), 12)
         self.assertEqual(binary_multiply(-3, 4), -12)
         self.assertEqual(binary_multiply(-3, -4), 12)
 
+    def test_binary_multiply_methods(self):
+        pairs = [(3, 4), (-3, 4), (0, 7), (255, -255), (7, 0b101101), ((1 << 5000) + 3, (1 << 4999) - 1)]
+        for method in MULTIPLY_METHODS:
+            for x, y in pairs:
+                self.assertEqual(binary_multiply(x, y, method), x * y)
+
+    def test_binary_multiply_trace(self):
+        trace = []
+        self.assertEqual(binary_multiply(3, 5, 'booth', trace=trace), 15)
+        self.assertEqual(trace, [
+            "Шаг 0: цифра +1, частичное произведение 3, сумма 3",
+            "Шаг 1: цифра +1, частичное произведение 12, сумма 15",
+        ])
+        trace = []
+        binary_multiply(3, 5, trace=trace)
+        self.assertEqual(len(trace), 3)
+
     def test_binary_divide(self):
         self.assertEqual(binary_divide(10, 2), 5.0)
         self.assertEqual(binary_divide(-10, 2), -5.0)
 
+    def test_binary_divide_methods(self):
+        for x, y in [(10, 3), (-7, 2), (3, 4), (0, 5), (255, -16), (1, 7)]:
+            expected = binary_divide(x, y, method='repeated')
+            for method in METHODS:
+                self.assertEqual(binary_divide(x, y, method=method), expected)
+
+    def test_binary_divide_exact(self):
+        self.assertEqual(binary_divide(10**9, 3, exact=True), Decimal('333333333.33333'))
+        self.assertEqual(binary_divide(-1, 3, digits=20, method='non_restoring', exact=True),
+                         Decimal('-0.33333333333333333333'))
+        self.assertEqual(binary_fraction(-5, 2, bits=4), '-10.1000')
+        self.assertEqual(binary_fraction(1, 3, bits=6), '0.010101')
+
     def test_divide_by_zero(self):
         with self.assertRaises(ValueError):
             binary_divide(10, 0)
@@ -75,10 +125,80 @@ class TestBinaryOperations(unittest.TestCase):
         self.assertEqual(float_to_ieee754(1.5), '0 01111111 10000000000000000000000')
         self.assertEqual(float_to_ieee754(-1.5), '1 01111111 10000000000000000000000')
 
+    def test_float_to_ieee754_special_values(self):
+        self.assertEqual(float_to_ieee754(0.0), '0 00000000 00000000000000000000000')
+        self.assertEqual(float_to_ieee754(-0.0), '1 00000000 00000000000000000000000')
+        self.assertEqual(float_to_ieee754(float('inf')), '0 11111111 00000000000000000000000')
+        self.assertEqual(float_to_ieee754(float('nan')), '0 11111111 10000000000000000000000')
+        self.assertEqual(float_to_ieee754(2.0 ** -149), '0 00000000 00000000000000000000001')
+        self.assertEqual(float_to_ieee754(1e40), '0 11111111 00000000000000000000000')
+
+    def test_float_to_ieee754_rounding(self):
+        # 0.1 в одинарной точности: ближайшее округляется вверх, отбрасывание — вниз
+        self.assertEqual(float_to_ieee754(0.1), '0 01111011 10011001100110011001101')
+        self.assertEqual(float_to_ieee754(0.1, rounding='toward_zero'), '0 01111011 10011001100110011001100')
+        self.assertEqual(float_to_ieee754(-0.1, rounding='down'), '1 01111011 10011001100110011001101')
+        self.assertEqual(float_to_ieee754(65520.0, 'half'), '0 11111 0000000000')
+        self.assertEqual(float_to_ieee754(65520.0, 'half', 'toward_zero'), '0 11110 1111111111')
+        self.assertEqual(float_to_ieee754(1.0, 'double'), '0 01111111111 ' + '0' * 52)
+
+    def test_ieee754_decode_roundtrip(self):
+        for fmt in ('half', 'single', 'double'):
+            for num in (1.5, -0.375, 2.0 ** -24, 1024.0):
+                self.assertEqual(decode_ieee754(*encode_ieee754(num, fmt), fmt), num)
+                self.assertEqual(ieee754_to_float(float_to_ieee754(num, fmt), fmt), num)
+
+    def test_float_to_ieee754_batch(self):
+        values = [1.5, -0.0, 1e40, 0.1]
+        for np_module in (ieee_module.np, None):
+            with patch.object(ieee_module, 'np', np_module):
+                for rounding in ('nearest_even', 'toward_zero'):
+                    signs, exponents, mantissas = float_to_ieee754_batch(values, rounding=rounding)
+                    fields = [tuple(int(f) for f in row) for row in zip(signs, exponents, mantissas)]
+                    self.assertEqual(fields, [encode_ieee754(v, 'single', rounding) for v in values])
+
     def test_ieee754_addition(self):
         ieee1, ieee2, result_decimal, ieee_result = ieee754_addition(1.5, 1.5)
         self.assertEqual(result_decimal, 3.0)
 
+    def test_ieee754_soft_float(self):
+        one, two, three = 0x3F800000, 0x40000000, 0x40400000
+        self.assertEqual(ieee754_add_bits(one, two), three)
+        self.assertEqual(ieee754_sub_bits(one, one), 0)
+        self.assertEqual(ieee754_sub_bits(one, one, rounding='down'), 0x80000000)
+        self.assertEqual(ieee754_mul_bits(three, 0xBF000000), 0xBFC00000)  # 3 * -0.5
+        self.assertEqual(ieee754_add_bits(0x7F800000, 0xFF800000), 0x7FC00000)  # inf - inf
+        self.assertEqual(ieee754_add_bits(1, 1), 2)  # субнормальные
+        self.assertEqual(ieee754_mul_bits(0x7F7FFFFF, two), 0x7F800000)
+        self.assertEqual(ieee754_mul_bits(0x7F7FFFFF, two, rounding='toward_zero'), 0x7F7FFFFF)
+        # 1 + 2^-24 — ровно середина, округление к чётному оставляет 1
+        self.assertEqual(ieee754_add_bits(one, 0x33800000), one)
+        self.assertEqual(ieee754_add_bits(one, 0x33800000, rounding='up'), one + 1)
+        _, _, result, _ = ieee754_addition(0.1, 0.2)
+        self.assertEqual(result, 0.30000001192092896)
+
+    def test_ieee754_batch(self):
+        a = [0x3F800000, 0x40490FDB, 0x00000001, 0xFF800000]
+        b = [0x3F800000, 0xC0490FDB, 0x80000001, 0x3F800000]
+        for np_module in (soft_float.np, None):
+            with patch.object(soft_float, 'np', np_module):
+                for op, scalar in (('add', ieee754_add_bits), ('sub', ieee754_sub_bits), ('mul', ieee754_mul_bits)):
+                    for rounding in ('nearest_even', 'down'):
+                        result = [int(r) for r in ieee754_batch(op, a, b, rounding=rounding)]
+                        self.assertEqual(result, [scalar(x, y, rounding=rounding) for x, y in zip(a, b)])
+
+    @unittest.skipIf(soft_float.np is None, "нужен NumPy")
+    def test_ieee754_batch_against_numpy(self):
+        np = soft_float.np
+        rng = np.random.default_rng(0)
+        a = rng.integers(0, 1 << 32, 20000, dtype=np.uint64).astype(np.uint32)
+        b = rng.integers(0, 1 << 32, 20000, dtype=np.uint64).astype(np.uint32)
+        with np.errstate(all='ignore'):
+            expected = a.view(np.float32) + b.view(np.float32)
+        result = ieee754_batch('add', a, b)
+        same = (result == expected.view(np.uint32)) | (np.isnan(expected) & np.isnan(result.view(np.float32)))
+        self.assertTrue(same.all())
+
     def test_to_binary(self):
         self.assertEqual(to_binary(5), '00000101')
         self.assertEqual(to_binary(0), '00000000')
@@ -89,6 +209,33 @@ class TestBinaryOperations(unittest.TestCase):
         self.assertEqual(to_signed_binary(-5), ('10000101', '11111010', '11111011'))
         self.assertEqual(to_signed_binary(0), ('00000000', '00000000', '00000000'))
 
+    def test_code_cache(self):
+        CODE_CACHE.clear()
+        first = to_signed_binary(-5, 12)
+        self.assertEqual(to_signed_binary(-5, 12), first)
+        self.assertEqual(first, twos_complement.encode(-5, 12))
+        self.assertEqual(float_to_ieee754(1.5, 'half'), '0 01111 1000000000')
+        float_to_ieee754(1.5, 'half')
+        stats = CODE_CACHE.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['hit_rate']), (2, 2, 0.5))
+        self.assertEqual(set(stats['tables']), {('signed', 12), ('ieee754', 'half')})
+        self.assertGreater(stats['bytes'], 0)
+
+        CODE_CACHE.enabled = False
+        try:
+            self.assertEqual(to_signed_binary(-5, 12), first)
+            self.assertEqual(CODE_CACHE.stats()['hits'], 2)
+        finally:
+            CODE_CACHE.enabled = True
+
+    def test_code_cache_eviction(self):
+        cache = CodeCache(max_bytes=1)
+        cache.get(('signed', 4), 15, 0, to_signed_binary, -7, 4)
+        cache.get(('signed', 5), 31, 0, to_signed_binary, -15, 5)
+        self.assertEqual(list(cache.tables), [('signed', 5)])
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertEqual(cache.nbytes, cache.stats()['tables'][('signed', 5)])
+
     def test_binary_addition(self):
         result, direct, reverse, additional = binary_addition('00000101', '00000011')
         self.assertEqual(result, 8)
@@ -104,6 +251,84 @@ class TestBinaryOperations(unittest.TestCase):
         self.assertEqual(reverse_first, '00000011')
         self.assertEqual(additional_first, '00000011')
 
+    def test_to_signed_binary_batch(self):
+        values = [5, -5, 0, 127, -127]
+        for np_module in (batch_module.np, None):
+            with patch.object(batch_module, 'np', np_module):
+                table = to_signed_binary_batch(values)
+                for i, num in enumerate(values):
+                    direct, reverse, additional = to_signed_binary(num)
+                    self.assertEqual(table.strings('direct')[i], direct)
+                    self.assertEqual(table.strings('reverse')[i], reverse)
+                    self.assertEqual(table.strings('additional')[i], additional)
+                self.assertEqual(list(table.packed('additional')[1]), [0b11111011])
+
+    def test_to_signed_binary_batch_range_error(self):
+        for np_module in (batch_module.np, None):
+            with patch.object(batch_module, 'np', np_module):
+                with self.assertRaisesRegex(ValueError, "Число -128 выходит за пределы 8-битного диапазона."):
+                    to_signed_binary_batch([1, -128, 3])
+
+    def test_binary_addition_negative(self):
+        result, direct, reverse, additional = binary_addition('11111011', '00000011')
+        self.assertEqual(result, -2)
+        self.assertEqual((direct, reverse, additional), to_signed_binary(-2))
+
+    def test_twos_complement_flags(self):
+        codes, flags = twos_complement.add('01111111', '00000001')
+        self.assertEqual(codes, (-128, None, None, '10000000'))
+        self.assertTrue(flags['overflow'])
+        self.assertFalse(flags['carry'])
+        codes, flags = twos_complement.add('11111111', '00000001')
+        self.assertEqual(codes[0], 0)
+        self.assertFalse(flags['overflow'])
+        self.assertTrue(flags['carry'])
+        codes, flags = twos_complement.subtract('1000', '0001', bits=16)
+        self.assertEqual(codes[0], -9)
+        self.assertFalse(flags['overflow'])
+
+    def test_twos_complement_wide(self):
+        bits = 4096
+        a, b = (1 << 4000) + 12345, -(1 << 3999) - 7
+        codes, flags = twos_complement.add(twos_complement.encode(a, bits)[2], twos_complement.encode(b, bits)[2])
+        self.assertEqual(codes[0], a + b)
+        self.assertEqual(twos_complement.decode(codes[3]), a + b)
+        self.assertEqual(twos_complement.decode(twos_complement.negate(codes[3])), -(a + b))
+        self.assertFalse(flags['overflow'])
+
+    def test_stream_csv(self):
+        source = StringIO("a,b\n3,4\n10,0\n1.5,1.5\n")
+        sink = StringIO()
+        self.assertEqual(run_stream(source, sink, operations=['mul', 'div', 'add']), 3)
+        lines = sink.getvalue().splitlines()
+        self.assertEqual(lines[0], "a,b,mul,div,add,add_code,add_overflow,error")
+        self.assertEqual(lines[1], "3,4,12,0.75,7,00000111,False,")
+        self.assertIn("div: Деление на ноль!", lines[2])
+        self.assertIn("mul: Операция mul требует целых чисел", lines[3])
+
+    def test_stream_ndjson(self):
+        source = StringIO('{"a": 1.5, "b": 1.5}\n\n{"a": 100, "b": 100}\n')
+        sink = StringIO()
+        run_stream(source, sink, fmt='ndjson', operations=['ieee', 'add'])
+        rows = [json.loads(line) for line in sink.getvalue().splitlines()]
+        self.assertEqual(rows[0]['ieee'], 3.0)
+        self.assertEqual(rows[0]['ieee_code'], float_to_ieee754(3.0))
+        self.assertTrue(rows[1]['add_overflow'])
+
+    def test_stream_ndjson_bad_lines(self):
+        # Испорченные строки дают строку с ошибкой, остальной поток обрабатывается
+        source = StringIO('{"a": 3, "b": 4}\n{"a": 3,\n[1, 2]\n{"a": 1, "b": 2}\n')
+        sink = StringIO()
+        self.assertEqual(run_stream(source, sink, fmt='ndjson', operations=['mul']), 4)
+        rows = [json.loads(line) for line in sink.getvalue().splitlines()]
+        self.assertEqual([row.get('mul') for row in rows], [12, None, None, 2])
+        self.assertIn("Некорректный JSON", rows[1]['error'])
+        self.assertEqual(rows[2]['error'], "Ожидался JSON-объект")
+        sink = StringIO()
+        run_stream(StringIO('oops\n'), sink, fmt='ndjson', output_fmt='csv', operations=['mul'])
+        line = sink.getvalue().splitlines()[1]
+        self.assertTrue(line.startswith("oops,,,Некорректный JSON"), line)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,12 +1,21 @@
 # to_signed_binary.py
 
 from to_binary import to_binary # type: ignore
+from code_cache import CODE_CACHE
 
 def to_signed_binary(num, bits=8):
     """Преобразует число в прямой, обратный и дополнительный коды."""
     if abs(num) >= 2 ** (bits - 1):
         raise ValueError(f"Число {num} выходит за пределы {bits}-битного диапазона.")
 
+    # Для малых разрядностей берём готовую ячейку таблицы
+    if type(num) is int and CODE_CACHE.usable(bits):
+        offset = (1 << (bits - 1)) - 1
+        return CODE_CACHE.get(('signed', bits), 2 * offset + 1, num + offset, _to_signed_binary, num, bits)
+    return _to_signed_binary(num, bits)
+
+
+def _to_signed_binary(num, bits):
     # Прямой код
     sign = '0' if num >= 0 else '1'
     magnitude = to_binary(abs(num), bits - 1)  # Прямой код без знака
@@ -0,0 +1,110 @@
+# to_signed_binary_batch.py
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него работаем через array('Q')
+    np = None
+
+MAX_BATCH_BITS = 64  # Коды хранятся в 64-битных словах
+
+
+class CodeStrings:
+    """Ленивое строковое представление столбца кодов: строка строится только при обращении."""
+
+    def __init__(self, words, bits):
+        self.words = words
+        self.bits = bits
+
+    def __len__(self):
+        return len(self.words)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return format(int(self.words[index]), f'0{self.bits}b')
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class CodeTable:
+    """Прямой, обратный и дополнительный коды набора чисел в виде 64-битных слов."""
+
+    KINDS = ('direct', 'reverse', 'additional')
+
+    def __init__(self, bits, direct, reverse, additional):
+        self.bits = bits
+        self.direct = direct
+        self.reverse = reverse
+        self.additional = additional
+
+    def __len__(self):
+        return len(self.direct)
+
+    def strings(self, kind='direct'):
+        """Возвращает ленивое строковое представление одного из кодов."""
+        return CodeStrings(self._column(kind), self.bits)
+
+    def packed(self, kind='direct'):
+        """Упаковывает код в байты (старший бит первым), ceil(bits / 8) байт на число."""
+        words = self._column(kind)
+        width = (self.bits + 7) // 8
+        if np is not None and isinstance(words, np.ndarray):
+            raw = words.astype('>u8').view(np.uint8).reshape(-1, 8)[:, 8 - width:]
+            return np.ascontiguousarray(raw)
+        return [word.to_bytes(width, 'big') for word in words]
+
+    def _column(self, kind):
+        if kind not in self.KINDS:
+            raise ValueError(f"Неизвестный вид кода: {kind}")
+        return getattr(self, kind)
+
+
+def to_signed_binary_batch(values, bits=8):
+    """Преобразует массив чисел в прямой, обратный и дополнительный коды за один проход."""
+    if not 2 <= bits <= MAX_BATCH_BITS:
+        raise ValueError(f"Разрядность {bits} вне диапазона 2..{MAX_BATCH_BITS}.")
+    if np is not None:
+        return _batch_numpy(values, bits)
+    return _batch_python(values, bits)
+
+
+def _batch_numpy(values, bits):
+    nums = np.asarray(values, dtype=np.int64).ravel()
+    magnitude = np.abs(nums).astype(np.uint64)
+    out_of_range = magnitude >= np.uint64(1 << (bits - 1))
+    if out_of_range.any():
+        num = int(nums[np.argmax(out_of_range)])
+        raise ValueError(f"Число {num} выходит за пределы {bits}-битного диапазона.")
+
+    sign = np.uint64(1 << (bits - 1))
+    mask = np.uint64((1 << bits) - 1)
+    negative = nums < 0
+    direct = np.where(negative, magnitude | sign, magnitude)
+    reverse = np.where(negative, magnitude ^ mask, magnitude)
+    additional = nums.astype(np.uint64) & mask
+    return CodeTable(bits, direct, reverse, additional)
+
+
+def _batch_python(values, bits):
+    limit = 1 << (bits - 1)
+    mask = (1 << bits) - 1
+    direct, reverse, additional = array('Q'), array('Q'), array('Q')
+    for num in values:
+        num = int(num)
+        if num >= 0:
+            if num >= limit:
+                raise ValueError(f"Число {num} выходит за пределы {bits}-битного диапазона.")
+            direct.append(num)
+            reverse.append(num)
+            additional.append(num)
+        else:
+            if -num >= limit:
+                raise ValueError(f"Число {num} выходит за пределы {bits}-битного диапазона.")
+            direct.append(limit | -num)
+            reverse.append(mask ^ -num)
+            additional.append(num & mask)
+    return CodeTable(bits, direct, reverse, additional)
@@ -0,0 +1,70 @@
+# twos_complement.py
+# Арифметика в дополнительном коде произвольной разрядности (8/16/32/64/N бит).
+# Операнды хранятся целыми словами Python, поэтому инверсия, +1 и перенос
+# выполняются за O(bits), без посимвольной пересборки строк.
+
+
+def _mask(bits):
+    return (1 << bits) - 1
+
+
+def decode(code):
+    """Возвращает значение числа, записанного в дополнительном коде (разрядность = длина строки)."""
+    value = int(code, 2)
+    return value - (1 << len(code)) if code[0] == '1' else value
+
+
+def encode(num, bits=8):
+    """Возвращает прямой, обратный и дополнительный коды числа заданной разрядности."""
+    if abs(num) >= 1 << (bits - 1):
+        raise ValueError(f"Число {num} выходит за пределы {bits}-битного диапазона.")
+    if num >= 0:
+        code = format(num, f'0{bits}b')
+        return code, code, code
+    direct = format((1 << (bits - 1)) | -num, f'0{bits}b')
+    reverse = format(_mask(bits) ^ -num, f'0{bits}b')
+    additional = format(num & _mask(bits), f'0{bits}b')
+    return direct, reverse, additional
+
+
+def negate(code):
+    """Меняет знак числа в дополнительном коде: инверсия и +1 одной операцией."""
+    bits = len(code)
+    return format(-int(code, 2) & _mask(bits), f'0{bits}b')
+
+
+def _result(value, raw, bits, carry):
+    """Собирает результат: (значение, прямой, обратный, дополнительный) и флаги."""
+    low, high = -(1 << (bits - 1)), 1 << (bits - 1)
+    overflow = not low <= value < high
+    signed = raw - (1 << bits) if raw >> (bits - 1) else raw
+    if signed == low:
+        # -2^(bits-1) не имеет прямого и обратного кода той же разрядности
+        direct = reverse = None
+    else:
+        direct, reverse, _ = encode(signed, bits)
+    additional = format(raw, f'0{bits}b')
+    return (signed, direct, reverse, additional), {'overflow': overflow, 'carry': bool(carry)}
+
+
+def add(bin1, bin2, bits=None):
+    """Складывает два числа в дополнительном коде.
+
+    Короткие операнды расширяются знаком до ``bits`` (по умолчанию — длина
+    большего операнда). Результат приводится к разрядности, флаг ``overflow``
+    сообщает о знаковом переполнении, ``carry`` — о переносе из старшего разряда.
+    """
+    if bits is None:
+        bits = max(len(bin1), len(bin2))
+    num1, num2 = decode(bin1), decode(bin2)
+    unsigned = (num1 & _mask(bits)) + (num2 & _mask(bits))
+    return _result(num1 + num2, unsigned & _mask(bits), bits, unsigned >> bits)
+
+
+def subtract(minuend, subtrahend, bits=None):
+    """Вычитает числа в дополнительном коде как minuend + ~subtrahend + 1."""
+    if bits is None:
+        bits = max(len(minuend), len(subtrahend))
+    num1, num2 = decode(minuend), decode(subtrahend)
+    unsigned = (num1 & _mask(bits)) + (~num2 & _mask(bits)) + 1
+    return _result(num1 - num2, unsigned & _mask(bits), bits, unsigned >> bits)
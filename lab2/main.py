@@ -1,130 +1,333 @@
+import decimal
 import itertools
+import os
 import re
-def evaluate_expression(expr, values):
-    expr = expr.replace(' ', '')
+import sys
+from decimal import Decimal
+from functools import lru_cache
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from expression_cache import canonical_key, default_cache
+
+# Шаблоны кода для операций; вычисление строго слева направо, как в исходном разборе
+_OPERATORS = {
+    '&': '{} and {}',
+    '|': '{} or {}',
+    '->': '(not {}) or {}',
+    '<->': '{} == {}',
+}
+
+# Те же операции над целыми столбцами таблицы: _m — маска из 2^n единиц
+_BITWISE_OPERATORS = {
+    '&': '{} & {}',
+    '|': '{} | {}',
+    '->': '(_m ^ {}) | {}',
+    '<->': '_m ^ ({} ^ {})',
+    '!': '_m ^ {}',
+}
+
 
-    def parse_left_to_right(expr):
+class _ExpressionCompiler:
+    """Однопроходный разбор выражения по индексу (без срезов строки) с генерацией кода.
+
+    Каждый узел записывается во временную переменную, поэтому сгенерированный
+    код плоский и не упирается в ограничение вложенности скобок компилятора Python.
+    """
+
+    def __init__(self, expr, variables, bitwise=False):
+        self.expr = expr
+        self.bitwise = bitwise
+        self.operators = _BITWISE_OPERATORS if bitwise else _OPERATORS
+        self.pos = 0
+        self.slots = {var: i for i, var in enumerate(variables)}
+        self.loaded = {}
+        self.lines = []
+
+    def emit(self, code):
+        name = f"t{len(self.lines)}"
+        self.lines.append(f"    {name} = {code}")
+        return name
+
+    def parse_left_to_right(self):
         # Сначала обрабатываем отрицания и скобки
-        left, expr = parse_term(expr)
+        left = self.parse_term()
 
         # Затем все операции строго слева направо
-        while expr:  # Изменено: проверяем, что expr не пустая строка
-            if expr.startswith('<->'):
+        expr = self.expr
+        while self.pos < len(expr):
+            if expr.startswith('<->', self.pos):
                 op = '<->'
-                expr = expr[3:]
-            elif expr.startswith('->'):
+            elif expr.startswith('->', self.pos):
                 op = '->'
-                expr = expr[2:]
-            elif expr and expr[0] in ('&', '|'):  # Изменено: проверяем только & и |
-                op = expr[0]
-                expr = expr[1:]
+            elif expr[self.pos] in ('&', '|'):
+                op = expr[self.pos]
             else:
                 break  # Выходим из цикла, если нет оператора
+            self.pos += len(op)
 
-            right, expr = parse_term(expr)
-
-            if op == '&':
-                left = left and right
-            elif op == '|':
-                left = left or right
-            elif op == '->':
-                left = (not left) or right
-            elif op == '<->':
-                left = (left == right)
+            right = self.parse_term()
+            left = self.emit(self.operators[op].format(left, right))
 
-        return left, expr
+        return left
 
-    def parse_term(expr):
-        if not expr:
+    def parse_term(self):
+        if self.pos >= len(self.expr):
             raise ValueError("Неожиданный конец выражения")
 
-        if expr[0] == '!':
+        ch = self.expr[self.pos]
+        if ch == '!':
             # Отрицание имеет высший приоритет
-            val, rest = parse_term(expr[1:])
-            return not val, rest
-        elif expr[0] == '(':
+            self.pos += 1
+            operand = self.parse_term()
+            return self.emit(_BITWISE_OPERATORS['!'].format(operand) if self.bitwise else f"not {operand}")
+        elif ch == '(':
             # Скобки - следующий приоритет
-            val, rest = parse_left_to_right(expr[1:])
-            if not rest or not rest.startswith(')'):  # Изменено: используем startswith
+            self.pos += 1
+            val = self.parse_left_to_right()
+            if self.pos >= len(self.expr) or self.expr[self.pos] != ')':
                 raise ValueError("Не закрыта скобка")
-            return val, rest[1:]
-        elif expr[0] in values:
-            # Переменная
-            return values[expr[0]], expr[1:]
-        elif expr[0].isalpha(): # Добавлена проверка на допустимые переменные
-            raise ValueError(f"Неизвестная переменная: {expr[0]}")
+            self.pos += 1
+            return val
+        elif ch in self.slots:
+            # Переменная: читаем из аргумента один раз
+            self.pos += 1
+            if ch not in self.loaded:
+                self.loaded[ch] = self.emit(f"_v[{self.slots[ch]}]")
+            return self.loaded[ch]
+        elif ch.isalpha():
+            raise ValueError(f"Неизвестная переменная: {ch}")
         else:
-            raise ValueError(f"Неизвестный символ: {expr[0]}")
+            raise ValueError(f"Неизвестный символ: {ch}")
 
+    def compile(self):
+        result = self.parse_left_to_right()
+        if self.pos < len(self.expr):  # Проверяем, что все выражение было обработано
+            raise ValueError(f"Неожиданный символ в конце выражения: {self.expr[self.pos]}")
+        if self.bitwise:
+            source = "def _compiled(_v, _m):\n" + "\n".join(self.lines) + f"\n    return {result}\n"
+        else:
+            source = "def _compiled(_v):\n" + "\n".join(self.lines) + f"\n    return int({result})\n"
+        namespace = {}
+        exec(compile(source, '<expression>', 'exec'), namespace)
+        compiled = namespace['_compiled']
+        compiled.source = source  # Каноническая форма: не зависит от пробелов и лишних скобок
+        return compiled
+
+
+@lru_cache(maxsize=1024)
+def _compile_cached(expr, variables, bitwise=False):
     try:
-        result, remaining_expr = parse_left_to_right(expr)  # Сохраняем оставшуюся часть
-        if remaining_expr:  # Проверяем, что все выражение было обработано
-            raise ValueError(f"Неожиданный символ в конце выражения: {remaining_expr[0]}")
-        return int(result)
-    except ValueError as e:
-        raise  # Просто перебрасываем ValueError, если он возник
+        return _ExpressionCompiler(expr, variables, bitwise).compile()
+    except ValueError:
+        raise
     except Exception as e:
         raise ValueError(f"Ошибка вычисления: {e}")
 
-def truth_table(expr, variables):
+
+def compile_expression(expr, variables):
+    """Разбирает выражение один раз и возвращает функцию от кортежа значений переменных.
+
+    Значения передаются в порядке variables; результат — 0 или 1.
+    """
+    return _compile_cached(expr.replace(' ', ''), tuple(variables))
+
+
+def evaluate_expression(expr, values):
+    return compile_expression(expr, values)(tuple(values.values()))
+
+
+def variable_columns(count):
+    """Столбцы переменных таблицы из 2^count строк, упакованные в целые.
+
+    Старший бит соответствует первой строке таблицы, младший — последней.
+    """
+    rows = 1 << count
+    columns = []
+    for j in range(count):
+        half = 1 << (count - 1 - j)  # Длина серии одинаковых значений переменной
+        column, width = (1 << half) - 1, 2 * half
+        while width < rows:  # Удваиваем узор сдвигом, без деления длинных чисел
+            column |= column << width
+            width *= 2
+        columns.append(column)
+    return columns
+
+
+def truth_column(expr, variables=None):
+    """Вычисляет весь столбец результата за один проход побитовыми операциями.
+
+    Возвращает целое, в котором старший из 2^n битов — значение функции в первой
+    строке таблицы; это же число является индексной формой функции.
+    """
+    if variables is None:
+        variables = sorted(set(re.findall(r'[a-z]', expr.lower())))
+    compiled = _compile_cached(expr.replace(' ', ''), tuple(variables), bitwise=True)
+    return compiled(variable_columns(len(variables)), (1 << (1 << len(variables))) - 1)
+
+
+def _table_rows(all_vars, variables, results):
     table = []
-    # Определяем все переменные в выражении
-    all_vars = sorted(set(re.findall(r'[a-z]', expr.lower())))
-    for values in itertools.product([0, 1], repeat=len(all_vars)):
+    for values, result in zip(itertools.product([0, 1], repeat=len(all_vars)), results):
         values_dict = dict(zip(all_vars, values))
-        result = evaluate_expression(expr, values_dict)
         # Добавляем только запрошенные переменные и результат
-        table.append(tuple(values_dict[v] for v in variables) + (result,))
+        table.append(tuple(values_dict[v] for v in variables) + (int(result),))
     return table
 
 
+def truth_table(expr, variables, bitsliced=False):
+    # Определяем все переменные в выражении
+    all_vars = sorted(set(re.findall(r'[a-z]', expr.lower())))
+    if bitsliced:
+        results = format(truth_column(expr, all_vars), f'0{1 << len(all_vars)}b')
+    else:
+        compiled = compile_expression(expr, all_vars)
+        results = (compiled(values) for values in itertools.product([0, 1], repeat=len(all_vars)))
+    return _table_rows(all_vars, variables, results)
+
+
+RENDER_CHUNK = 1024  # Сколько термов собирается перед одной записью в поток
+
+
+def _rows_with(bits, value):
+    """Номера строк, где результат равен value ('1' или '0'), за один проход по строке битов."""
+    pos = bits.find(value)
+    while pos != -1:
+        yield pos
+        pos = bits.find(value, pos + 1)
+
+
+def iter_normal_form(bits, variables, sdnf=True):
+    """Генерирует СДНФ (или СКНФ) по кускам: термы вместе с разделителями.
+
+    bits — столбец результата строкой '0'/'1', первая строка таблицы слева.
+    """
+    n = len(variables)
+    # Литералы для значения 0 и 1 каждой переменной
+    if sdnf:
+        literals = [(f"!{var}", var) for var in variables]
+        inner, outer, empty = " ∧ ", " ∨ ", "0"
+    else:
+        literals = [(var, f"!{var}") for var in variables]
+        inner, outer, empty = " ∨ ", " ∧ ", "1"
+
+    first = True
+    for row in _rows_with(bits, '1' if sdnf else '0'):
+        term = inner.join(literals[i][(row >> (n - 1 - i)) & 1] for i in range(n))
+        yield f"({term})" if first else f"{outer}({term})"
+        first = False
+    if first:
+        yield empty
+
+
+def iter_numeric_form(bits, sdnf=True):
+    """Генерирует числовую форму СДНФ/СКНФ по кускам."""
+    yield "("
+    for i, row in enumerate(_rows_with(bits, '1' if sdnf else '0')):
+        yield str(row) if i == 0 else f", {row}"
+    yield ") ∨" if sdnf else ") ∧"
+
+
+# Точная десятичная арифметика без ограничения точности для перевода индекса
+_EXACT = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX)
+DIRECT_CONVERSION_BITS = 4096  # Куски не длиннее переводятся напрямую через int
+
+
+def _binary_to_decimal(bits, powers):
+    """Перевод строки битов в Decimal делением пополам: старшая половина * 2^k + младшая.
+
+    Умножение больших Decimal в libmpdec субквадратичное, поэтому весь перевод —
+    O(M(n) log n) вместо квадратичного int -> str.
+    """
+    if len(bits) <= DIRECT_CONVERSION_BITS:
+        return Decimal(int(bits, 2) if bits else 0)
+    half = 1 << ((len(bits) - 1).bit_length() - 1)  # Степени двойки повторяются, их удобно кэшировать
+    if half not in powers:
+        powers[half] = _EXACT.power(Decimal(2), half)
+    high = _binary_to_decimal(bits[:-half], powers)
+    return _EXACT.add(_EXACT.multiply(high, powers[half]), _binary_to_decimal(bits[-half:], powers))
+
+
+def index_form(bits):
+    """Индексная форма: число, двоичная запись которого — столбец результата.
+
+    Десятичная запись строится делением пополам (субквадратично): 2^22 строк — около секунды.
+    """
+    # Decimal не ограничен int_max_str_digits, поэтому годится и для огромных таблиц
+    return f"{_binary_to_decimal(bits, {})} - {bits}"
+
+
+def write_chunks(sink, pieces):
+    """Пишет куски в sink пачками по RENDER_CHUNK."""
+    chunk = []
+    for piece in pieces:
+        chunk.append(piece)
+        if len(chunk) >= RENDER_CHUNK:
+            sink.write(''.join(chunk))
+            chunk.clear()
+    sink.write(''.join(chunk))
+
+
+def column_bits(column, variable_count):
+    """Строка результатов из упакованного столбца truth_column."""
+    return format(column, f'0{1 << variable_count}b')
+
+
+_FORM_SECTIONS = (
+    ("\nСовершенная дизъюнктивная нормальная форма (СДНФ):\n", 'sdnf'),
+    ("\nСовершенная конъюнктивная нормальная форма (СКНФ):\n", 'sknf'),
+    ("\nЧисловая форма СДНФ:\n", 'numeric_sdnf'),
+    ("Числовая форма СКНФ:\n", 'numeric_sknf'),
+    ("\nИндексная форма:\n", 'index_form'),
+)
+
+
+def write_normal_forms(sink, bits, variables, forms=None):
+    """Пишет СДНФ, СКНФ, числовые и индексную формы в sink, не собирая их целиком в памяти.
+
+    Если готовые формы (словарь get_normal_forms) уже есть, пишутся они.
+    """
+    parts = forms or {
+        'sdnf': iter_normal_form(bits, variables, sdnf=True),
+        'sknf': iter_normal_form(bits, variables, sdnf=False),
+        'numeric_sdnf': iter_numeric_form(bits, sdnf=True),
+        'numeric_sknf': iter_numeric_form(bits, sdnf=False),
+        'index_form': (index_form(bits),),
+    }
+    for title, key in _FORM_SECTIONS:
+        sink.write(title)
+        pieces = parts[key]
+        write_chunks(sink, (pieces,) if isinstance(pieces, str) else pieces)
+        sink.write("\n")
+
+
 def get_normal_forms(truth_table, variables):
-    minterms = []
-    maxterms = []
-    for i, row in enumerate(truth_table):
-        if row[-1]:
-            minterms.append(i)
-        else:
-            maxterms.append(i)
-    
-    # СДНФ
-    sdnf_terms = []
-    for m in minterms:
-        term = []
-        for i, var in enumerate(variables):
-            val = (m >> (len(variables)-1-i)) & 1
-            term.append(f"!{var}" if not val else var)
-        sdnf_terms.append(" ∧ ".join(term))
-    sdnf = " ∨ ".join([f"({t})" for t in sdnf_terms]) if sdnf_terms else "0"
-    
-    # СКНФ
-    sknf_terms = []
-    for M in maxterms:
-        term = []
-        for i, var in enumerate(variables):
-            val = (M >> (len(variables)-1-i)) & 1
-            term.append(var if not val else f"!{var}")
-        sknf_terms.append(" ∨ ".join(term))
-    sknf = " ∧ ".join([f"({t})" for t in sknf_terms]) if sknf_terms else "1"
-    
-    # Числовые формы
-    numeric_sdnf = f"({', '.join(map(str, minterms))}) ∨" if minterms else "() ∨"
-    numeric_sknf = f"({', '.join(map(str, maxterms))}) ∧" if maxterms else "() ∧"
-    
-    # Исправленный расчет индексной формы
-    binary_result = ''.join(str(row[-1]) for row in truth_table)  # '00100000'
-    # Убираем reversed() - теперь биты идут от старшего к младшему
-    index_num = sum(int(bit) * (2 ** (len(binary_result)-1-i)) for i, bit in enumerate(binary_result))
-    index_form = f"{index_num} - {binary_result}"
-    
+    binary_result = ''.join('1' if row[-1] else '0' for row in truth_table)
     return {
-        'sdnf': sdnf,
-        'sknf': sknf,
-        'numeric_sdnf': numeric_sdnf,
-        'numeric_sknf': numeric_sknf,
-        'index_form': index_form
+        'sdnf': ''.join(iter_normal_form(binary_result, variables, sdnf=True)),
+        'sknf': ''.join(iter_normal_form(binary_result, variables, sdnf=False)),
+        'numeric_sdnf': ''.join(iter_numeric_form(binary_result, sdnf=True)),
+        'numeric_sknf': ''.join(iter_numeric_form(binary_result, sdnf=False)),
+        'index_form': index_form(binary_result)
     }
 
+EXPRESSION_CACHE = default_cache()
+
+
+def analyze(expr, variables):
+    """Битовая маска таблицы истинности и нормальные формы с кэшированием по скомпилированной форме."""
+    all_vars = sorted(set(re.findall(r'[a-z]', expr.lower())))
+    compiled = compile_expression(expr, all_vars)
+    key = canonical_key('lab2', (compiled.source, tuple(variables)), all_vars)
+
+    def compute():
+        table = truth_table(expr, variables)
+        bits = ''.join(str(row[-1]) for row in table)
+        return {'variables': all_vars, 'mask': int(bits, 2), 'rows': len(table),
+                'forms': get_normal_forms(table, variables)}
+
+    return EXPRESSION_CACHE.get_or_compute(key, compute)
+
+
 def main():
     print("Введите логическую функцию (переменные a-e, операции &, |, !, ->, <->)")
     expr = input("Функция: ").strip()
@@ -134,8 +337,9 @@ def main():
         print("Ошибка: не найдены переменные")
         return
     
-    tt = truth_table(expr, variables)
-    forms = get_normal_forms(tt, variables)
+    analysis = analyze(expr, variables)
+    bits = format(analysis['mask'], f"0{analysis['rows']}b")
+    tt = _table_rows(analysis['variables'], variables, bits)
 
     print("\nТаблица истинности:")
     header = " | ".join(variables) + " | F"
@@ -143,20 +347,8 @@ def main():
     print("-" * len(header))
     for row in tt:
         print(" | ".join(map(str, row)))
-    
-    print("\nСовершенная дизъюнктивная нормальная форма (СДНФ):")
-    print(forms['sdnf'])
-    
-    print("\nСовершенная конъюнктивная нормальная форма (СКНФ):")
-    print(forms['sknf'])
-    
-    print("\nЧисловая форма СДНФ:")
-    print(forms['numeric_sdnf'])
-    print("Числовая форма СКНФ:")
-    print(forms['numeric_sknf'])
-    
-    print("\nИндексная форма:")
-    print(forms['index_form'])
+
+    write_normal_forms(sys.stdout, bits, variables, analysis['forms'])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,7 +3,10 @@ import itertools
 import re
 from unittest.mock import patch, call
 from io import StringIO
-from main import evaluate_expression, truth_table, get_normal_forms, main
+from decimal import Decimal
+from main import (evaluate_expression, compile_expression, truth_column, variable_columns, column_bits,
+                  truth_table, get_normal_forms, write_normal_forms, iter_normal_form, index_form, analyze,
+                  EXPRESSION_CACHE, main)
 
 class TestLogicFunctions(unittest.TestCase):
     def setUp(self):
@@ -32,6 +35,30 @@ class TestLogicFunctions(unittest.TestCase):
         with self.assertRaises(ValueError):
             evaluate_expression("a*b", {'a':1, 'b':1})
     
+    def test_evaluate_expression_error_messages(self):
+        cases = {
+            "a&": "Неожиданный конец выражения",
+            "(a|b": "Не закрыта скобка",
+            "a&x": "Неизвестная переменная: x",
+            "a*b": "Неожиданный символ в конце выражения: *",
+            "a&*": "Неизвестный символ: *",
+        }
+        for expr, message in cases.items():
+            with self.assertRaises(ValueError) as ctx:
+                evaluate_expression(expr, {'a': 1, 'b': 1})
+            self.assertEqual(str(ctx.exception), message)
+
+    def test_compile_expression(self):
+        # Операции выполняются строго слева направо: (a | b) & c
+        compiled = compile_expression("a | b & c", ['a', 'b', 'c'])
+        self.assertIs(compiled, compile_expression("a|b&c", ('a', 'b', 'c')))
+        self.assertEqual(compiled((1, 0, 0)), 0)
+        self.assertEqual(compiled((1, 0, 1)), 1)
+
+        long_expr = "&".join(["!(a->b)"] * 2000)
+        self.assertEqual(evaluate_expression(long_expr, {'a': 1, 'b': 0}), 1)
+        self.assertEqual(evaluate_expression(long_expr, {'a': 1, 'b': 1}), 0)
+
     def test_truth_table_basic(self):
         # Тестирование таблиц истинности для базовых операций
         self.assertEqual(truth_table("a&b", ['a', 'b']), [
@@ -48,6 +75,23 @@ class TestLogicFunctions(unittest.TestCase):
             (0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 1)
         ])
     
+    def test_truth_table_bitsliced(self):
+        for expr in ("a&b", "!a|(b<->c)", "(a->b)&(!c|a)", "a->b->c"):
+            variables = sorted(set(re.findall(r'[a-z]', expr)))
+            self.assertEqual(truth_table(expr, variables, bitsliced=True), truth_table(expr, variables))
+        self.assertEqual(truth_table("a&b", ['b', 'a'], bitsliced=True), truth_table("a&b", ['b', 'a']))
+
+    def test_truth_column(self):
+        self.assertEqual(variable_columns(2), [0b0011, 0b0101])
+        self.assertEqual(truth_column("a&b"), 0b0001)
+        self.assertEqual(truth_column("a<->b"), 0b1001)
+        self.assertEqual(truth_column("!a->b"), 0b0111)
+
+        # 22 переменные: цепочка импликаций истинна ровно на 23 монотонных наборах
+        names = "abcdefghijklmnopqrstuv"
+        expr = "&".join(f"({x}->{y})" for x, y in zip(names, names[1:]))
+        self.assertEqual(bin(truth_column(expr)).count('1'), len(names) + 1)
+
     def test_get_normal_forms(self):
         # Тестирование нормальных форм
         and_table = [(0,0,0), (0,1,0), (1,0,0), (1,1,1)]
@@ -70,6 +114,48 @@ class TestLogicFunctions(unittest.TestCase):
         self.assertEqual(forms['sdnf'], "0")
         self.assertEqual(forms['sknf'], "(a) ∧ (!a)")
 
+    def test_write_normal_forms(self):
+        table = truth_table("a->(b|c)", self.variables)
+        forms = get_normal_forms(table, self.variables)
+        sink = StringIO()
+        write_normal_forms(sink, ''.join(str(row[-1]) for row in table), self.variables)
+        output = sink.getvalue()
+        for key in ('sdnf', 'sknf', 'numeric_sdnf', 'numeric_sknf', 'index_form'):
+            self.assertIn(f"\n{forms[key]}\n", output)
+
+    def test_streaming_large_function(self):
+        # 16 переменных, 2^15 минтермов: формы пишутся кусками, индекс — прямо из столбца
+        names = "abcdefghijklmnop"
+        column = truth_column("&".join(names[1:]) + "|a")  # слева направо: (b & ... & p) | a
+        bits = column_bits(column, len(names))
+        sink = StringIO()
+        write_normal_forms(sink, bits, list(names))
+        self.assertEqual(sink.getvalue().count("(a ∧"), 1 << 15)
+        index_num, index_bits = index_form(bits).split(" - ")
+        self.assertEqual(index_bits, bits)
+        self.assertEqual(int(Decimal(index_num)), column)
+        terms = iter_normal_form(bits, list(names), sdnf=False)
+        self.assertEqual(next(terms), "(a ∨ b ∨ c ∨ d ∨ e ∨ f ∨ g ∨ h ∨ i ∨ j ∨ k ∨ l ∨ m ∨ n ∨ o ∨ p)")
+
+    def test_index_form_large(self):
+        # Перевод делением пополам совпадает с прямым переводом и на длинных столбцах
+        bits = ''.join('1' if (i * 7919) % 11 < 5 else '0' for i in range(50000))
+        index_num, index_bits = index_form(bits).split(" - ")
+        self.assertEqual(index_bits, bits)
+        self.assertEqual(index_num, str(Decimal(int(bits, 2))))
+        self.assertEqual(index_form("0001"), "1 - 0001")
+        self.assertEqual(index_form(""), "0 - ")
+
+    def test_analyze_cache(self):
+        EXPRESSION_CACHE.clear()
+        first = analyze("a&(b|c)", self.variables)
+        # Пробелы не меняют скомпилированную форму, поэтому запись та же
+        self.assertIs(analyze("a & ( b | c )", self.variables), first)
+        self.assertEqual(first['mask'], truth_column("a&(b|c)"))
+        self.assertIsNot(analyze("a&(b|c)", ['c', 'b', 'a']), first)
+        stats = EXPRESSION_CACHE.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+
     @patch('builtins.input', return_value='a&b')
     @patch('sys.stdout', new_callable=StringIO)
     def test_main_basic(self, mock_stdout, mock_input):
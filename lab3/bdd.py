@@ -0,0 +1,298 @@
+import itertools
+import weakref
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from evaluator import BINARY_OPERATORS
+
+FALSE, TRUE = 0, 1  # Номера терминальных вершин
+
+# Двуместная операция как таблица из 4 битов: бит (2a + b) — значение op(a, b)
+OPERATOR_TABLES = {op: sum(bool(fn(a, b)) << (2 * a + b) for a in (False, True) for b in (False, True))
+                   for op, fn in BINARY_OPERATORS.items()}
+_AND, _OR = OPERATOR_TABLES['&'], OPERATOR_TABLES['|']
+_NOT = -1  # Ключ операции отрицания в таблице вычисленных результатов
+
+
+class BDD:
+    """Менеджер упорядоченных сокращённых диаграмм решений (ROBDD).
+
+    Вершины хранятся в параллельных списках (переменная, низкий и высокий потомок);
+    таблица уникальности не допускает одинаковых вершин, а таблица вычисленных
+    результатов кэширует операции. Порядок переменных — порядок variable_names,
+    первая переменная соответствует старшему биту номера набора, как в таблице истинности.
+    """
+
+    gc_threshold = 1 << 20  # Число вершин, после которого build собирает мусор
+    cache_limit = 1 << 20  # Размер таблицы вычисленных результатов до её очистки
+
+    def __init__(self, variable_names: List[str]):
+        self.variables = list(variable_names)
+        n = len(self.variables)
+        self._var = [n, n]  # У терминалов «переменная» n — ниже всех настоящих
+        self._low = [FALSE, TRUE]
+        self._high = [FALSE, TRUE]
+        self._unique: Dict[Tuple[int, int, int], int] = {}
+        self._computed: Dict[Tuple[int, int, int], int] = {}
+        self._free: List[int] = []
+        self._handles = weakref.WeakValueDictionary()  # Живые BddFunction — корни сборки мусора
+        self._handle_ids = itertools.count()
+
+    @property
+    def node_count(self) -> int:
+        return len(self._var) - len(self._free)
+
+    def node(self, var: int, low: int, high: int) -> int:
+        """Вершина (var, low, high) из таблицы уникальности; одинаковые потомки сокращаются."""
+        if low == high:
+            return low
+        key = (var, low, high)
+        u = self._unique.get(key)
+        if u is None:
+            if self._free:
+                u = self._free.pop()
+                self._var[u], self._low[u], self._high[u] = key
+            else:
+                u = len(self._var)
+                self._var.append(var)
+                self._low.append(low)
+                self._high.append(high)
+            self._unique[key] = u
+        return u
+
+    def variable(self, name: str) -> int:
+        return self.node(self.variables.index(name), FALSE, TRUE)
+
+    def _remember(self, key, result):
+        if len(self._computed) >= self.cache_limit:
+            self._computed.clear()
+        self._computed[key] = result
+        return result
+
+    def negate(self, f: int) -> int:
+        if f <= TRUE:
+            return TRUE - f
+        key = (_NOT, f, f)
+        cached = self._computed.get(key)
+        if cached is not None:
+            return cached
+        return self._remember(key, self.node(self._var[f], self.negate(self._low[f]), self.negate(self._high[f])))
+
+    def apply(self, op: str, f: int, g: int) -> int:
+        """Двуместная операция из BINARY_OPERATORS над диаграммами f и g."""
+        return self._apply(OPERATOR_TABLES[op], f, g)
+
+    def _apply(self, table: int, f: int, g: int) -> int:
+        if f == g:
+            low, high = table & 1, (table >> 3) & 1
+            return low if low == high else (f if high else self.negate(f))
+        # Один аргумент константа: результат — константа, g или !g
+        if f <= TRUE or g <= TRUE:
+            const, other = (f, g) if f <= TRUE else (g, f)
+            shift = 2 * const if f <= TRUE else const
+            step = 1 if f <= TRUE else 2
+            r0, r1 = (table >> shift) & 1, (table >> (shift + step)) & 1
+            if other <= TRUE:
+                return r1 if other else r0
+            return r0 if r0 == r1 else (other if r1 else self.negate(other))
+
+        key = (table, f, g)
+        cached = self._computed.get(key)
+        if cached is not None:
+            return cached
+        vf, vg = self._var[f], self._var[g]
+        v = min(vf, vg)
+        f0, f1 = (self._low[f], self._high[f]) if vf == v else (f, f)
+        g0, g1 = (self._low[g], self._high[g]) if vg == v else (g, g)
+        return self._remember(key, self.node(v, self._apply(table, f0, g0), self._apply(table, f1, g1)))
+
+    def build(self, postfix: List[str]) -> 'BddFunction':
+        """Диаграмма по постфиксной записи ExpressionConverter.to_postfix."""
+        stack = []
+        for token in postfix:
+            if token == '!':
+                if not stack:
+                    raise ValueError("Invalid expression: missing operand for '!'")
+                stack.append(self.negate(stack.pop()))
+            elif token in OPERATOR_TABLES:
+                if len(stack) < 2:
+                    raise ValueError(f"Invalid expression: missing operands for '{token}'")
+                b = stack.pop()
+                stack.append(self._apply(OPERATOR_TABLES[token], stack.pop(), b))
+            elif token in self.variables:
+                stack.append(self.variable(token))
+            else:
+                raise ValueError(f"Unknown token: {token}")
+            if self.node_count > self.gc_threshold:
+                self.collect(stack)
+        if len(stack) != 1:
+            raise ValueError("Invalid expression: too many operands")
+        return BddFunction(self, stack[0])
+
+    def collect(self, roots: List[int] = ()) -> int:
+        """Сборка мусора: освобождает вершины, недостижимые из живых BddFunction и roots."""
+        live = {FALSE, TRUE}
+        stack = [h.node for h in self._handles.values()] + list(roots)
+        while stack:
+            u = stack.pop()
+            if u not in live:
+                live.add(u)
+                stack.append(self._low[u])
+                stack.append(self._high[u])
+        freed = 0
+        for key, u in list(self._unique.items()):
+            if u not in live:
+                del self._unique[key]
+                self._var[u] = -1
+                self._free.append(u)
+                freed += 1
+        self._computed.clear()  # Кэш мог ссылаться на освобождённые вершины
+        return freed
+
+    def sat_count(self, f: int) -> int:
+        """Число наборов всех переменных, на которых f истинна."""
+        memo = {FALSE: 0, TRUE: 1}
+
+        def count(u):  # Наборы переменных начиная с уровня вершины u
+            if u not in memo:
+                v = self._var[u]
+                low, high = self._low[u], self._high[u]
+                memo[u] = (count(low) << (self._var[low] - v - 1)) + (count(high) << (self._var[high] - v - 1))
+            return memo[u]
+
+        return count(f) << self._var[f]
+
+    def satisfy_one(self, f: int) -> Optional[int]:
+        """Наименьший по номеру набор, на котором f истинна, или None."""
+        if f == FALSE:
+            return None
+        index = 0
+        while f != TRUE:
+            v = self._var[f]
+            if self._low[f] != FALSE:
+                f = self._low[f]
+            else:
+                index |= 1 << (len(self.variables) - 1 - v)
+                f = self._high[f]
+        return index
+
+    def value(self, f: int, index: int) -> bool:
+        n = len(self.variables)
+        while f > TRUE:
+            f = self._high[f] if (index >> (n - 1 - self._var[f])) & 1 else self._low[f]
+        return f == TRUE
+
+    def minterms(self, f: int) -> Iterator[int]:
+        """Номера наборов, где f истинна, по возрастанию; ветвь TRUE разворачивается диапазоном."""
+        n = len(self.variables)
+        stack = [(f, 0, 0)]
+        while stack:
+            u, level, prefix = stack.pop()
+            if u == FALSE:
+                continue
+            if u == TRUE:
+                free = n - level
+                yield from range(prefix << free, (prefix + 1) << free)
+                continue
+            low, high = (self._low[u], self._high[u]) if self._var[u] == level else (u, u)
+            stack.append((high, level + 1, (prefix << 1) | 1))
+            stack.append((low, level + 1, prefix << 1))
+
+    def isop(self, f: int) -> List[Tuple[int, int]]:
+        """Неизбыточная ДНФ (алгоритм Минато — Морреале) кубами (value, mask), как у EspressoMinimizer."""
+        n = len(self.variables)
+        memo = {}
+
+        def cofactors(u, v):
+            return (self._low[u], self._high[u]) if self._var[u] == v else (u, u)
+
+        def rec(lower, upper):
+            if lower == FALSE:
+                return [], FALSE
+            if upper == TRUE:
+                return [(0, (1 << n) - 1)], TRUE
+            key = (lower, upper)
+            if key in memo:
+                return memo[key]
+            v = min(self._var[lower], self._var[upper])
+            l0, l1 = cofactors(lower, v)
+            u0, u1 = cofactors(upper, v)
+            c0, f0 = rec(self._apply(_AND, l0, self.negate(u1)), u0)
+            c1, f1 = rec(self._apply(_AND, l1, self.negate(u0)), u1)
+            rest = self._apply(_OR, self._apply(_AND, l0, self.negate(f0)), self._apply(_AND, l1, self.negate(f1)))
+            cd, fd = rec(rest, self._apply(_AND, u0, u1))
+            bit = 1 << (n - 1 - v)
+            cubes = [(value, mask & ~bit) for value, mask in c0]
+            cubes += [(value | bit, mask & ~bit) for value, mask in c1]
+            memo[key] = cubes + cd, self._apply(_OR, self.node(v, f0, f1), fd)
+            return memo[key]
+
+        return rec(f, f)[0]
+
+
+class BddFunction:
+    """Функция, заданная вершиной BDD, с интерфейсом TruthTable без хранения 2^n строк:
+    variables, size, value, row, minterms, maxterms, index_value."""
+
+    def __init__(self, manager: BDD, node: int):
+        self.manager = manager
+        self.node = node
+        self.variables = manager.variables
+        self.size = 1 << len(self.variables)
+        manager._handles[next(manager._handle_ids)] = self
+
+    @classmethod
+    def from_postfix(cls, variable_names: List[str], postfix: List[str]) -> 'BddFunction':
+        return BDD(variable_names).build(postfix)
+
+    def is_satisfiable(self) -> bool:
+        return self.node != FALSE
+
+    def is_tautology(self) -> bool:
+        return self.node == TRUE
+
+    def sat_count(self) -> int:
+        return self.manager.sat_count(self.node)
+
+    def satisfy_one(self) -> Optional[int]:
+        return self.manager.satisfy_one(self.node)
+
+    def value(self, index: int) -> bool:
+        return self.manager.value(self.node, index)
+
+    def row(self, index: int) -> List[bool]:
+        n = len(self.variables)
+        return [bool((index >> (n - 1 - j)) & 1) for j in range(n)] + [self.value(index)]
+
+    def minterms(self) -> Iterator[int]:
+        return self.manager.minterms(self.node)
+
+    def maxterms(self) -> Iterator[int]:
+        return self.manager.minterms(self.manager.negate(self.node))
+
+    @property
+    def index_value(self) -> int:
+        """Индексная форма, как у TruthTable: старший из 2^n битов — первая строка."""
+        column = bytearray((self.size + 7) // 8)
+        shift = len(column) * 8 - self.size  # Неиспользуемые младшие биты последнего байта
+        for m in self.minterms():
+            bit = self.size - 1 - m + shift
+            column[-1 - bit // 8] |= 1 << (bit % 8)
+        return int.from_bytes(column, 'big') >> shift
+
+    def isop(self, dnf: bool = True) -> List[Tuple[int, int]]:
+        """Кубы ДНФ функции или (dnf=False) кубы её нулей для КНФ."""
+        return self.manager.isop(self.node if dnf else self.manager.negate(self.node))
+
+    def __invert__(self) -> 'BddFunction':
+        return BddFunction(self.manager, self.manager.negate(self.node))
+
+    def __eq__(self, other):
+        if isinstance(other, BddFunction):
+            return self.manager is other.manager and self.node == other.node
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self.manager), self.node))
+
+    def __repr__(self) -> str:
+        return f"BddFunction({self.variables!r}, node={self.node})"
@@ -0,0 +1,61 @@
+# bench_espresso.py
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from minimizer import BooleanMinimizer
+from pla import read_pla, write_pla
+
+FIXTURES = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'fixtures'))
+
+
+def _weight_outputs(n, bits):
+    """Выходы rdXY: двоичная запись числа единиц во входном наборе (старший выход первым)."""
+    on = [set() for _ in range(bits)]
+    for m in range(1 << n):
+        weight = bin(m).count('1')
+        for k in range(bits):
+            if (weight >> (bits - 1 - k)) & 1:
+                on[k].add(m)
+    return on
+
+
+# Классические тестовые схемы MCNC/LGSynth, восстановленные по их функциональному определению
+CIRCUITS = {
+    'xor5': (5, lambda: [{m for m in range(32) if bin(m).count('1') % 2}], "нечётность 5 входов"),
+    'rd53': (5, lambda: _weight_outputs(5, 3), "число единиц среди 5 входов, 3 выхода"),
+    'rd73': (7, lambda: _weight_outputs(7, 3), "число единиц среди 7 входов, 3 выхода"),
+    'rd84': (8, lambda: _weight_outputs(8, 4), "число единиц среди 8 входов, 4 выхода"),
+    '9sym': (9, lambda: [{m for m in range(512) if 3 <= bin(m).count('1') <= 6}],
+             "симметрическая функция 9 входов: 1 при 3..6 единицах"),
+}
+
+
+def generate_fixtures(directory=FIXTURES):
+    os.makedirs(directory, exist_ok=True)
+    for name, (n, build, description) in CIRCUITS.items():
+        on = build()
+        write_pla(os.path.join(directory, f"{name}.pla"), [f"x{i}" for i in range(n)],
+                  [f"f{k}" for k in range(len(on))], on, f"{name}: {description}")
+
+
+def bench(names=tuple(CIRCUITS)):
+    """Espresso против Квайна — Мак-Класки на PLA-фикстурах: время и число кубов по каждому выходу."""
+    print(f"{'схема':>6} {'вых':>4} {'QMC куб.':>9} {'QMC, с':>8} {'espresso куб.':>14} {'espresso, с':>12}")
+    for name in names:
+        pla = read_pla(os.path.join(FIXTURES, f"{name}.pla"))
+        for k in range(len(pla.outputs)):
+            ones, n = sorted(pla.on[k]), len(pla.inputs)
+            qmc = BooleanMinimizer.minimize(ones, n, names=pla.inputs)[0].count('|') + 1
+            qmc_time = min(timeit.repeat(lambda: BooleanMinimizer.minimize(ones, n), number=1, repeat=3))
+            esp = BooleanMinimizer.minimize_espresso(ones, n)[0].count('|') + 1
+            esp_time = min(timeit.repeat(lambda: BooleanMinimizer.minimize_espresso(ones, n), number=1, repeat=3))
+            print(f"{name:>6} {k:>4} {qmc:>9} {qmc_time:8.3f} {esp:>14} {esp_time:12.3f}")
+
+
+if __name__ == "__main__":
+    if '--generate' in sys.argv:
+        generate_fixtures()
+    bench()
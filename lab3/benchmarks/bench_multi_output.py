@@ -0,0 +1,56 @@
+# bench_multi_output.py
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from minimizer import BooleanMinimizer
+from pla import read_pla
+
+FIXTURES = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'fixtures'))
+MULTI_OUTPUT = ('rd53', 'rd73', 'rd84')
+
+
+def _distinct_products(expressions):
+    return len({clause for expr in expressions for clause in expr.split(" | ")})
+
+
+def _mark(report):
+    return '' if report['complete'] else '*'
+
+
+def bench(names=MULTI_OUTPUT, node_limit=BooleanMinimizer.MULTI_NODE_LIMIT):
+    """Раздельная минимизация выходов против совместной: число различных импликант и время.
+
+    Точный перебор в обоих случаях ограничен node_limit узлами; '*' — перебор остановлен
+    на пределе, и покрытие может быть не минимальным.
+    """
+    print(f"{'схема':>6} {'вых':>4} {'раздельно':>10} {'раздельно, с':>13} {'совместно':>10} {'совместно, с':>13}")
+    for name in names:
+        path = os.path.join(FIXTURES, f"{name}.pla")
+        pla = read_pla(path)
+        n = len(pla.inputs)
+        single_report, joint_report = {}, {}
+
+        def separate():
+            results, single_report['complete'] = [], True
+            for on in pla.on:
+                report = {}
+                results.append(BooleanMinimizer.minimize(sorted(on), n, names=pla.inputs, cover='exact',
+                                                         node_limit=node_limit, report=report)[0])
+                single_report['complete'] = single_report['complete'] and report.get('complete', True)
+            return results
+
+        def joint():
+            return BooleanMinimizer.minimize_pla_multi(path, node_limit=node_limit, report=joint_report)[0]
+
+        single = f"{_distinct_products(separate())}{_mark(single_report)}"
+        single_time = min(timeit.repeat(separate, number=1, repeat=3))
+        shared = f"{_distinct_products(joint())}{_mark(joint_report)}"
+        joint_time = min(timeit.repeat(joint, number=1, repeat=3))
+        print(f"{name:>6} {len(pla.outputs):>4} {single:>10} {single_time:13.3f} {shared:>10} {joint_time:13.3f}")
+
+
+if __name__ == "__main__":
+    bench()
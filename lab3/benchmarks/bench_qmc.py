@@ -0,0 +1,26 @@
+# bench_qmc.py
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from minimizer import ImplicantReducer
+
+CASES = ((8, 128), (10, 500), (12, 2000), (12, 3000))
+
+
+def bench(cases=CASES, seed=0):
+    """Время склеивания Квайна — Мак-Класки на случайных функциях."""
+    rng = random.Random(seed)
+    print(f"{'n':>3} {'минтермов':>10} {'простых':>8} {'этапов':>7} {'с':>8}")
+    for n, count in cases:
+        ones = sorted(rng.sample(range(1 << n), count))
+        primes, history = ImplicantReducer.extract_implicants(ones, n)
+        seconds = min(timeit.repeat(lambda: ImplicantReducer.extract_implicants(ones, n), number=1, repeat=3))
+        print(f"{n:>3} {count:>10} {len(primes):>8} {len(history):>7} {seconds:8.3f}")
+
+
+if __name__ == "__main__":
+    bench()
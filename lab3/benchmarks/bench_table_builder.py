@@ -0,0 +1,71 @@
+# bench_table_builder.py
+import os
+import sys
+import timeit
+from itertools import product
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from log_parser import Scanner
+from evaluator import ExpressionConverter, PostfixEvaluator, ProgramCompiler, TableBuilder
+
+VARIABLE_COUNTS = (5, 10, 15)
+
+
+def make_postfix(n):
+    """Выражение над n переменными со всеми видами операций."""
+    names = [f"x{i}" for i in range(n)]
+    ops = ("&", "|", "->", "^", "~", "↑", "↓")
+    expr = names[0]
+    for i, name in enumerate(names[1:]):
+        expr = f"({expr}) {ops[i % len(ops)]} !{name}"
+    scanned = Scanner.scan(expr)
+    return scanned.variables, ExpressionConverter.to_postfix(scanned.tokens)
+
+
+def per_row_dict(variables, postfix):
+    # Прежний способ: словарь присваиваний и разбор строк на каждой строке таблицы
+    n = len(variables)
+    table = []
+    for i in range(2 ** n):
+        assignment = {var: bool((i >> (n - j - 1)) & 1) for j, var in enumerate(variables)}
+        row = [assignment[v] for v in variables]
+        row.append(PostfixEvaluator.evaluate(postfix, assignment))
+        table.append(row)
+    return table
+
+
+def opcode_interpreter(variables, postfix):
+    program = ProgramCompiler.compile(postfix, variables)
+    return [[*values, program.evaluate(values)] for values in product((False, True), repeat=len(variables))]
+
+
+def compiled_function(variables, postfix):
+    return TableBuilder.build(variables, postfix, backend='python')
+
+
+def bench(counts=VARIABLE_COUNTS):
+    """Сравнивает построение таблицы: словарь на строку, интерпретатор кодов и скомпилированную функцию.
+
+    Интерпретатор кодов (CompiledProgram.evaluate) оставлен только для проверки функции: он
+    быстрее словаря на строку лишь в 1.3–2.3 раза. Скомпилированная функция (backend='python')
+    в замерах дала 9.8–13.5x на 5 переменных, то есть цель 10x там достигается не всегда,
+    и 15–30x на 10–15 переменных. Столбец «auto» — построитель по умолчанию, который
+    с 10 переменных переходит на NumPy, если он установлен.
+    """
+    print(f"{'n':>3} {'словарь, мс':>12} {'коды, мс':>10} {'функция, мс':>12} {'ускорение':>10} "
+          f"{'auto, мс':>10} {'ускорение':>10}")
+    for n in counts:
+        variables, postfix = make_postfix(n)
+        expected = TableBuilder.build(variables, postfix)
+        assert per_row_dict(variables, postfix) == expected == opcode_interpreter(variables, postfix)
+        assert compiled_function(variables, postfix) == expected
+        number = max(1, 2 ** (12 - n))
+        timings = [min(timeit.repeat(lambda: build(variables, postfix), number=number, repeat=3)) / number * 1e3
+                   for build in (per_row_dict, opcode_interpreter, compiled_function, TableBuilder.build)]
+        print(f"{n:>3} {timings[0]:12.3f} {timings[1]:10.3f} {timings[2]:12.3f} {timings[0] / timings[2]:9.1f}x "
+              f"{timings[3]:10.3f} {timings[0] / timings[3]:9.1f}x")
+
+
+if __name__ == "__main__":
+    bench()
@@ -1,11 +1,36 @@
-from typing import List, Dict
+from array import array
+from collections.abc import Sequence as SequenceABC
+from functools import lru_cache
+from itertools import product
+from typing import Iterator, List, Dict, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # Векторный построитель таблиц необязателен
+    np = None
+
+# Двуместные операции над логическими значениями
+BINARY_OPERATORS = {
+    '~': lambda a, b: a == b,
+    '&': lambda a, b: a and b,
+    '↑': lambda a, b: not (a and b),
+    '|': lambda a, b: a or b,
+    '^': lambda a, b: a != b,
+    '↓': lambda a, b: not (a or b),
+    '->': lambda a, b: not a or b,
+}
+
 
 class ExpressionConverter:
+    # И-НЕ стоит в одном ряду с И, ИЛИ-НЕ и исключающее ИЛИ — с ИЛИ
     precedence = {
         '!': 5,
         '~': 4,
         '&': 3,
+        '↑': 3,
         '|': 2,
+        '^': 2,
+        '↓': 2,
         '->': 1,
         '(': 0
     }
@@ -21,6 +46,8 @@ class ExpressionConverter:
                 while ops and ops[-1] != '(':
                     output.append(ops.pop())
                 ops.pop()
+            elif token == '!':
+                ops.append(token)  # Унарная префиксная операция ничего не выталкивает: !!a
             elif token in ExpressionConverter.precedence:
                 while ops and ExpressionConverter.precedence.get(ops[-1], 0) >= ExpressionConverter.precedence[token]:
                     output.append(ops.pop())
@@ -33,60 +60,304 @@ class ExpressionConverter:
 
         return output
 
+    @staticmethod
+    def to_ids(postfix: List[str], variables: List[str]) -> List[Union[str, int]]:
+        """Заменяет имена переменных их номерами в variables (плотные целые идентификаторы)."""
+        ids = {var: i for i, var in enumerate(variables)}
+        return [ids.get(symbol, symbol) for symbol in postfix]
+
 
 class PostfixEvaluator:
     @staticmethod
-    def evaluate(postfix: List[str], assignments: Dict[str, bool]) -> bool:
+    def evaluate(postfix: List[Union[str, int]], assignments: Union[Dict[str, bool], Sequence[bool]]) -> bool:
+        """Вычисляет постфиксную запись; целые токены — номера переменных в последовательности assignments."""
         stack = []
         for symbol in postfix:
-            if symbol in assignments:
+            if type(symbol) is int:
                 stack.append(assignments[symbol])
+            elif symbol in BINARY_OPERATORS:
+                if len(stack) < 2:
+                    raise ValueError("Missing operands for binary operator")
+                b = stack.pop()
+                stack[-1] = BINARY_OPERATORS[symbol](stack[-1], b)
             elif symbol == '!':
                 if not stack:
                     raise ValueError("Missing operand for NOT")
                 stack.append(not stack.pop())
-            elif symbol in {'&', '|', '->'}:
+            elif isinstance(assignments, dict) and symbol in assignments:
+                stack.append(assignments[symbol])
+            else:
+                raise ValueError(f"Unknown token: {symbol}")
+
+        if len(stack) != 1:
+            raise ValueError("Malformed expression")
+        return stack[0]
+
+
+# Коды операций скомпилированной программы: пары (код, аргумент)
+OP_LOAD, OP_NOT = 0, 1
+OPCODES = {symbol: code for code, symbol in enumerate(BINARY_OPERATORS, start=2)}
+
+# Шаблоны кода Python для операций
+_SOURCE_TEMPLATES = {
+    '~': '{} == {}',
+    '&': '{} and {}',
+    '↑': 'not ({} and {})',
+    '|': '{} or {}',
+    '^': '{} != {}',
+    '↓': 'not ({} or {})',
+    '->': 'not {} or {}',
+}
+
+
+class CompiledProgram:
+    """Постфиксная запись, скомпилированная в массив кодов операций и в функцию Python."""
+
+    def __init__(self, code: array, source: str, variable_count: int):
+        self.code = code
+        self.source = source
+        self.variable_count = variable_count
+        namespace = {}
+        exec(compile(source, '<postfix>', 'exec'), namespace)
+        self.function = namespace['_compiled']
+
+    def evaluate(self, values: Sequence[bool]) -> bool:
+        """Интерпретирует массив кодов: эталон для проверки function, таблицы строятся только через function."""
+        stack = []
+        push, pop = stack.append, stack.pop
+        code = self.code
+        for i in range(0, len(code), 2):
+            op = code[i]
+            if op == OP_LOAD:
+                push(values[code[i + 1]])
+            elif op == OP_NOT:
+                stack[-1] = not stack[-1]
+            else:
+                b = pop()
+                a = stack[-1]
+                if op == 2:
+                    stack[-1] = a == b
+                elif op == 3:
+                    stack[-1] = a and b
+                elif op == 4:
+                    stack[-1] = not (a and b)
+                elif op == 5:
+                    stack[-1] = a or b
+                elif op == 6:
+                    stack[-1] = a != b
+                elif op == 7:
+                    stack[-1] = not (a or b)
+                else:
+                    stack[-1] = not a or b
+        return stack[0]
+
+    def __call__(self, values: Sequence[bool]) -> bool:
+        return self.function(values)
+
+
+class ProgramCompiler:
+    @staticmethod
+    def compile(postfix: List[str], variable_names: List[str]) -> CompiledProgram:
+        """Один раз проверяет постфиксную запись и строит из неё CompiledProgram.
+
+        Каждый узел записывается во временную переменную, поэтому длинные выражения
+        не упираются в ограничение вложенности компилятора Python. Результат кэшируется.
+        """
+        return ProgramCompiler._compile_cached(tuple(postfix), tuple(variable_names))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _compile_cached(postfix, variable_names):
+        ids = {var: i for i, var in enumerate(variable_names)}
+        code = array('i')
+        lines = []
+        loaded = {}
+        stack = []
+        for symbol in postfix:
+            if symbol in ids:
+                code.extend((OP_LOAD, ids[symbol]))
+                if symbol not in loaded:
+                    loaded[symbol] = f"t{len(lines)}"
+                    lines.append(f"    {loaded[symbol]} = _v[{ids[symbol]}]")
+                stack.append(loaded[symbol])
+                continue
+            if symbol == '!':
+                if not stack:
+                    raise ValueError("Missing operand for NOT")
+                code.extend((OP_NOT, 0))
+                expr = f"not {stack.pop()}"
+            elif symbol in OPCODES:
                 if len(stack) < 2:
                     raise ValueError("Missing operands for binary operator")
+                code.extend((OPCODES[symbol], 0))
                 b, a = stack.pop(), stack.pop()
-                if symbol == '&':
-                    stack.append(a and b)
-                elif symbol == '|':
-                    stack.append(a or b)
-                elif symbol == '->':
-                    stack.append(not a or b)
+                expr = _SOURCE_TEMPLATES[symbol].format(a, b)
             else:
                 raise ValueError(f"Unknown token: {symbol}")
+            name = f"t{len(lines)}"
+            lines.append(f"    {name} = {expr}")
+            stack.append(name)
 
         if len(stack) != 1:
             raise ValueError("Malformed expression")
-        return stack[0]
+        source = "def _compiled(_v):\n" + "\n".join(lines) + f"\n    return {stack[0]}\n"
+        return CompiledProgram(code, source, len(variable_names))
+
+
+_BIT_CHARS = ('0', '1')
+
+
+class TruthTable(SequenceABC):
+    """Таблица истинности, хранящая только столбец результата в виде целого-битсета.
+
+    Старший из 2^n битов — результат первой строки, поэтому само число и есть
+    индексная форма. Строки [x1, ..., xn, результат] строятся по запросу, и таблица
+    ведёт себя как прежний список списков: len, индексы, срезы, перебор, сравнение.
+    """
+
+    def __init__(self, variable_names: List[str], bits: int):
+        self.variables = list(variable_names)
+        self.size = 1 << len(self.variables)
+        self.bits = bits
+
+    @classmethod
+    def from_rows(cls, variable_names: List[str], rows: List[List[bool]]) -> 'TruthTable':
+        return cls(variable_names, int(''.join('1' if row[-1] else '0' for row in rows) or '0', 2))
+
+    @property
+    def index_value(self) -> int:
+        return self.bits
+
+    def output_string(self) -> str:
+        return format(self.bits, f'0{self.size}b')
+
+    def value(self, index: int) -> bool:
+        return bool((self.bits >> (self.size - 1 - index)) & 1)
+
+    def row(self, index: int) -> List[bool]:
+        n = len(self.variables)
+        return [bool((index >> (n - 1 - j)) & 1) for j in range(n)] + [self.value(index)]
+
+    def _rows_with(self, value: str) -> Iterator[int]:
+        # Столбец один раз форматируется в строку: O(2^n), но в C. Затем find переходит сразу
+        # к следующей нужной строке, так что Python-цикл делает O(число найденных строк) шагов
+        column = self.output_string()
+        pos = column.find(value)
+        while pos != -1:
+            yield pos
+            pos = column.find(value, pos + 1)
+
+    def minterms(self) -> Iterator[int]:
+        return self._rows_with('1')
+
+    def maxterms(self) -> Iterator[int]:
+        return self._rows_with('0')
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("truth table index out of range")
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[List[bool]]:
+        column = self.output_string()
+        for values, bit in zip(product((False, True), repeat=len(self.variables)), column):
+            yield [*values, bit == '1']
+
+    def __eq__(self, other):
+        if isinstance(other, TruthTable):
+            return self.variables == other.variables and self.bits == other.bits
+        if isinstance(other, list):
+            return len(other) == self.size and all(row == list(expected) for row, expected in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TruthTable({self.variables!r}, 0b{self.output_string()})"
+
+
+# Векторные операции над столбцами NumPy по кодам CompiledProgram
+_COLUMN_OPERATIONS = {
+    OPCODES['~']: lambda a, b: a == b,
+    OPCODES['&']: lambda a, b: a & b,
+    OPCODES['↑']: lambda a, b: ~(a & b),
+    OPCODES['|']: lambda a, b: a | b,
+    OPCODES['^']: lambda a, b: a ^ b,
+    OPCODES['↓']: lambda a, b: ~(a | b),
+    OPCODES['->']: lambda a, b: ~a | b,
+}
 
 
 class TableBuilder:
+    BACKENDS = ('auto', 'python', 'numpy', 'bdd')
+    numpy_min_variables = 10  # С меньшим числом переменных накладные расходы NumPy не окупаются
+    chunk_rows = 1 << 20  # Строк в одной порции векторного вычисления (кратно 8)
+
+    @staticmethod
+    def build(variable_names: List[str], postfix: List[str], backend: str = 'auto') -> TruthTable:
+        """Строит таблицу; backend: 'python', 'numpy' или 'auto' (NumPy для больших таблиц, если он есть).
+        Без установленного NumPy backend='numpy' строит таблицу на чистом Python.
+
+        backend='bdd' возвращает BddFunction: строки не хранятся, поэтому годится для 40+ переменных.
+        """
+        if backend not in TableBuilder.BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        if backend == 'bdd':
+            from bdd import BddFunction  # bdd сам импортирует evaluator
+            return BddFunction.from_postfix(variable_names, postfix)
+        program = ProgramCompiler.compile(postfix, variable_names)
+        if np is not None and (backend == 'numpy' or (backend == 'auto' and
+                                                      len(variable_names) >= TableBuilder.numpy_min_variables)):
+            return TruthTable(variable_names, TableBuilder._column_numpy(program))
+        # product перебирает наборы в порядке строк таблицы: первая переменная — старший бит
+        results = map(program.function, product((False, True), repeat=len(variable_names)))
+        return TruthTable(variable_names, int(''.join(map(_BIT_CHARS.__getitem__, results)), 2))
+
     @staticmethod
-    def build(variable_names: List[str], postfix: List[str]) -> List[List[bool]]:
-        rows = 2 ** len(variable_names)
-        table = []
+    def _column_numpy(program: CompiledProgram) -> int:
+        """Вычисляет столбец результата порциями: одна операция над массивом на каждый код программы."""
+        n = program.variable_count
+        size = 1 << n
+        code = program.code
+        packed = []
+        for start in range(0, size, TableBuilder.chunk_rows):
+            rows = np.arange(start, min(size, start + TableBuilder.chunk_rows), dtype=np.uint64)
+            columns = {}
+            stack = []
+            for i in range(0, len(code), 2):
+                op, arg = code[i], code[i + 1]
+                if op == OP_LOAD:
+                    if arg not in columns:
+                        columns[arg] = ((rows >> np.uint64(n - 1 - arg)) & np.uint64(1)).astype(bool)
+                    stack.append(columns[arg])
+                elif op == OP_NOT:
+                    stack.append(~stack.pop())
+                else:
+                    b = stack.pop()
+                    stack.append(_COLUMN_OPERATIONS[op](stack.pop(), b))
+            packed.append(np.packbits(stack[0]).tobytes())
+        data = b''.join(packed)
+        # packbits дополняет последний байт нулями справа, если строк меньше 8
+        return int.from_bytes(data, 'big') >> (8 * len(data) - size)
 
-        for i in range(rows):
-            assignment = {
-                var: bool((i >> (len(variable_names) - j - 1)) & 1)
-                for j, var in enumerate(variable_names)
-            }
-            row = [assignment[v] for v in variable_names]
-            result = PostfixEvaluator.evaluate(postfix, assignment)
-            row.append(result)
-            table.append(row)
 
-        return table
+def _rows_where(table: Union[TruthTable, List[List[bool]]], value: bool) -> Iterator[List[bool]]:
+    """Строки таблицы с заданным результатом; у TruthTable и BddFunction — без перебора остальных строк."""
+    if hasattr(table, 'minterms'):
+        return map(table.row, table.minterms() if value else table.maxterms())
+    return (row for row in table if bool(row[-1]) == value)
 
 
 class NormalForms:
     @staticmethod
     def dnf(variables: List[str], table: List[List[bool]]) -> str:
         terms = []
-        for row in table:
+        for row in _rows_where(table, True):
             if row[-1]:
                 clause = [var if val else f"!{var}" for var, val in zip(variables, row[:-1])]
                 terms.append(f"({' & '.join(clause)})")
@@ -95,7 +366,7 @@ class NormalForms:
     @staticmethod
     def cnf(variables: List[str], table: List[List[bool]]) -> str:
         clauses = []
-        for row in table:
+        for row in _rows_where(table, False):
             if not row[-1]:
                 clause = [f"!{var}" if val else var for var, val in zip(variables, row[:-1])]
                 clauses.append(f"({' | '.join(clause)})")
@@ -105,12 +376,18 @@ class NormalForms:
 class NumericRepresentation:
     @staticmethod
     def dnf_indices(table: List[List[bool]]) -> List[int]:
+        if hasattr(table, 'minterms'):
+            return list(table.minterms())
         return [i for i, row in enumerate(table) if row[-1]]
 
     @staticmethod
     def cnf_indices(table: List[List[bool]]) -> List[int]:
+        if hasattr(table, 'maxterms'):
+            return list(table.maxterms())
         return [i for i, row in enumerate(table) if not row[-1]]
 
     @staticmethod
     def index_value(table: List[List[bool]]) -> int:
+        if hasattr(table, 'index_value'):
+            return table.index_value
         return sum((1 << (len(table) - i - 1)) for i, row in enumerate(table) if row[-1])
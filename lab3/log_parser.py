@@ -1,5 +1,5 @@
 import re
-from typing import List
+from typing import List, NamedTuple
 
 class InputCleaner:
     @staticmethod
@@ -8,61 +8,148 @@ class InputCleaner:
 
 
 class ExpressionValidator:
-    allowed_vars = set("abcde")
-    allowed_ops = set("&|!()")
+    """Прежний интерфейс проверки выражения; грамматику задаёт Scanner."""
 
     @staticmethod
     def is_valid(expression: str) -> bool:
-        pos = 0
-        while pos < len(expression):
-            char = expression[pos]
-            if char.isspace():
-                pos += 1
-                continue
-            if char in ExpressionValidator.allowed_vars | ExpressionValidator.allowed_ops:
-                pos += 1
-            elif char == '-' and pos + 1 < len(expression) and expression[pos + 1] == '>':
-                pos += 2
-            else:
-                return False
+        try:
+            Scanner.scan(expression)
+        except ParseError as error:
+            return error.kind != ParseError.SYMBOLS
         return True
 
     @staticmethod
     def has_balanced_parentheses(expression: str) -> bool:
-        balance = 0
-        for ch in expression:
-            if ch == '(': balance += 1
-            elif ch == ')': balance -= 1
-            if balance < 0:
-                return False
-        return balance == 0
+        try:
+            Scanner.scan(''.join(ch for ch in expression if ch in '()'))
+        except ParseError:
+            return False
+        return True
 
 
 class VariableExtractor:
     @staticmethod
     def get_variables(expression: str) -> List[str]:
-        return sorted(set(filter(lambda c: c in "abcde", expression)))
+        """Переменные в естественном порядке; скобки не проверяются, при недопустимых символах — пустой список."""
+        try:
+            return Scanner.scan(expression, check_parentheses=False).variables
+        except ParseError:
+            return []
 
 
 class Lexer:
     @staticmethod
     def tokenize(expression: str) -> List[str]:
-        tokens = []
-        pos = 0
-        while pos < len(expression):
-            ch = expression[pos]
-            if ch.isspace():
-                pos += 1
-            elif ch == '-' and pos + 1 < len(expression) and expression[pos + 1] == '>':
-                tokens.append('->')
-                pos += 2
-            elif ch in "!&|()":
-                tokens.append(ch)
-                pos += 1
-            elif ch in "abcde":
-                tokens.append(ch)
-                pos += 1
-            else:
-                return []
-        return tokens
-    
\ No newline at end of file
+        """Токены Scanner; скобки не проверяются, при недопустимых символах — пустой список."""
+        try:
+            return Scanner.scan(expression, check_parentheses=False).tokens
+        except ParseError:
+            return []
+
+
+def natural_key(name: str) -> tuple:
+    """Ключ естественной сортировки: x2 раньше x10."""
+    return tuple(int(part) if part.isdigit() else part for part in re.split(r'([0-9]+)', name))
+
+
+class ParseError(ValueError):
+    """Ошибка разбора выражения с позицией в исходной строке."""
+
+    SYMBOLS = 'symbols'
+    PARENTHESES = 'parentheses'
+
+    def __init__(self, kind: str, position: int, message: str):
+        super().__init__(f"{message} (позиция {position})")
+        self.kind = kind
+        self.position = position
+
+
+class ScanResult(NamedTuple):
+    tokens: List[str]
+    positions: List[int]
+    variables: List[str]
+
+
+class Scanner:
+    """Однопроходный разбор: проверка символов и скобок, переменные и токены с позициями.
+
+    Переменные — идентификаторы из букв, цифр и '_' (не с цифры). Операции:
+    ! (НЕ), ~ или <-> (эквивалентность), & (И), ↑ (И-НЕ), | (ИЛИ), ^ (исключающее ИЛИ),
+    ↓ (ИЛИ-НЕ), -> (импликация).
+    """
+
+    NAME, DIGIT, OPERATOR, OPEN, CLOSE, ARROW, SPACE, OTHER = range(8)
+    operators = "!~&↑|^↓"
+    arrows = {'->': '->', '<->': '~'}
+    arrow_prefixes = {'-', '<', '<-'}
+    symbols = set(operators) | {'->', '(', ')'}
+    # Таблица классов символов: один поиск в словаре на символ вместо цепочки проверок
+    classes = {
+        **dict.fromkeys("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_", NAME),
+        **dict.fromkeys("0123456789", DIGIT),
+        **dict.fromkeys(operators, OPERATOR),
+        '(': OPEN, ')': CLOSE, '-': ARROW, '<': ARROW,
+        **dict.fromkeys(" \t\n\r\f\v", SPACE),
+    }
+
+    @staticmethod
+    def scan(expression: str, check_parentheses: bool = True) -> ScanResult:
+        tokens, positions = [], []
+        add_token, add_position = tokens.append, positions.append
+        classes, other = Scanner.classes, Scanner.OTHER
+        opened = []  # Позиции незакрытых '('
+        unmatched = None  # Позиция первой лишней ')'
+        name = -1  # Начало читаемого идентификатора
+        arrow, arrow_start = '', -1  # Прочитанная часть '->' или '<->'
+        for position, ch in enumerate(expression):
+            kind = classes.get(ch, other)
+            if kind == other and ch.isalpha():
+                kind = Scanner.NAME
+            if name >= 0:
+                if kind <= Scanner.DIGIT:
+                    continue
+                add_token(expression[name:position])
+                add_position(name)
+                name = -1
+            if arrow:
+                arrow += ch
+                if arrow in Scanner.arrows:
+                    add_token(Scanner.arrows[arrow])
+                    add_position(arrow_start)
+                    arrow = ''
+                elif arrow not in Scanner.arrow_prefixes:
+                    raise ParseError(ParseError.SYMBOLS, arrow_start, f"Недопустимый символ: {arrow[0]}")
+            elif kind == Scanner.NAME:
+                name = position
+            elif kind == Scanner.OPERATOR:
+                add_token(ch)
+                add_position(position)
+            elif kind == Scanner.SPACE:
+                continue
+            elif kind == Scanner.OPEN:
+                opened.append(position)
+                add_token(ch)
+                add_position(position)
+            elif kind == Scanner.CLOSE:
+                if opened:
+                    opened.pop()
+                elif unmatched is None:
+                    unmatched = position
+                add_token(ch)
+                add_position(position)
+            elif kind == Scanner.ARROW:
+                arrow, arrow_start = ch, position
+            elif not ch.isspace():
+                # Недопустимый символ важнее несбалансированных скобок, как и в прежнем порядке проверок
+                raise ParseError(ParseError.SYMBOLS, position, f"Недопустимый символ: {ch}")
+
+        if name >= 0:
+            add_token(expression[name:])
+            add_position(name)
+        if arrow:
+            raise ParseError(ParseError.SYMBOLS, arrow_start, f"Недопустимый символ: {arrow[0]}")
+        if unmatched is None and opened:
+            unmatched = opened[-1]
+        if unmatched is not None and check_parentheses:
+            raise ParseError(ParseError.PARENTHESES, unmatched, "Несбалансированные скобки")
+        return ScanResult(tokens, positions, sorted(set(tokens).difference(Scanner.symbols), key=natural_key))
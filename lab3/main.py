@@ -1,100 +1,219 @@
-from log_parser import InputCleaner, ExpressionValidator, VariableExtractor, Lexer
+import argparse
+import io
+import json
+import os
+import sys
+from decimal import Decimal
+from log_parser import Scanner, ParseError
 from evaluator import ExpressionConverter, TableBuilder, NormalForms, NumericRepresentation
 from minimizer import BooleanMinimizer
 
-def run():
-    expr = input("Введите логическое выражение: ").strip()
-    cleaned = InputCleaner.remove_spaces(expr)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from expression_cache import canonical_key, default_cache
 
-    if not ExpressionValidator.is_valid(cleaned):
-        print("Ошибка: недопустимые символы в выражении.")
-        return
-
-    if not ExpressionValidator.has_balanced_parentheses(cleaned):
-        print("Ошибка: несбалансированные скобки.")
-        return
-
-    variables = VariableExtractor.get_variables(cleaned)
-    tokens = Lexer.tokenize(cleaned)
-    if not tokens:
-        print("Ошибка: не удалось разобрать выражение.")
-        return
+ANALYSIS_CACHE = default_cache()
 
-    postfix = ExpressionConverter.to_postfix(tokens)
-    table = TableBuilder.build(variables, postfix)
+SECTIONS = ('table', 'forms', 'calc', 'qmc', 'karnaugh')
+MINIMIZATION_SECTIONS = ('calc', 'qmc', 'karnaugh')
+CHUNK_PIECES = 4096  # Сколько кусков вывода копится в буфере перед записью
 
-    print("\nТаблица истинности:")
-    header = " ".join(variables) + " | Выход"
-    print(header)
-    print("-" * len(header))
-    for row in table:
-        values = " ".join("1" if val else "0" for val in row[:-1])
-        print(f"{values} | {'1' if row[-1] else '0'}")
-
-    dnf_expr = NormalForms.dnf(variables, table)
-    cnf_expr = NormalForms.cnf(variables, table)
-    print(f"\nDNF: {dnf_expr}")
-    print(f"CNF: {cnf_expr}")
-
-    dnf_indices = NumericRepresentation.dnf_indices(table)
-    cnf_indices = NumericRepresentation.cnf_indices(table)
-    print(f"Миндексы DNF: {', '.join(map(str, dnf_indices)) or 'null'}")
-    print(f"Миндексы CNF: {', '.join(map(str, cnf_indices)) or 'null'}")
-
-    index_value = NumericRepresentation.index_value(table)
-    binary_str = ''.join(['1' if row[-1] else '0' for row in table])
-    print(f"Индекс: {binary_str} (двоичное) = {index_value} (десятичное)")
-
-    # Расчётная минимизация
-    dnf_min, dnf_steps = BooleanMinimizer.minimize(dnf_indices, len(variables), dnf=True)
-    cnf_min, cnf_steps = BooleanMinimizer.minimize(cnf_indices, len(variables), dnf=False)
-
-    print("\nМинимизация (расчётная):")
-    print("Минимизированная DNF:", dnf_min)
-    for i, step in enumerate(dnf_steps, 1):
-        print(f"  Этап {i}:")
-        for line in step:
-            print("   ", line)
+_MINIMIZERS = {
+    'calc': BooleanMinimizer.minimize,
+    'qmc': BooleanMinimizer.minimize_qmc,
+    'karnaugh': BooleanMinimizer.minimize_karnaugh,
+}
 
-    print("\nМинимизированная CNF:", cnf_min)
-    for i, step in enumerate(cnf_steps, 1):
-        print(f"  Этап {i}:")
-        for line in step:
-            print("   ", line)
+# Заголовок раздела, отступ строк этапов и разделитель перед CNF — как в прежнем выводе
+_MINIMIZATION_TITLES = {
+    'calc': ("Минимизация (расчётная)", "    ", "\n"),
+    'qmc': ("Минимизация (таблично-расчётная, Квайна-МакКласки)", "     ", "\n"),
+    'karnaugh': ("Минимизация (табличная, Карно)", "    ", ""),
+}
 
-    # Таблично-расчётная минимизация (Квайна-МакКласки)
-    dnf_qmc, qmc_dnf_steps = BooleanMinimizer.minimize_qmc(dnf_indices, len(variables))
-    cnf_qmc, qmc_cnf_steps = BooleanMinimizer.minimize_qmc(cnf_indices, len(variables), dnf=False)
 
-    print("\nМинимизация (таблично-расчётная, Квайна-МакКласки):")
-    print("Минимизированная DNF:", dnf_qmc)
-    for i, step in enumerate(qmc_dnf_steps, 1):
-        print(f"  Этап {i}:")
+def _compute(variables, postfix, dont_cares=(), sections=SECTIONS):
+    """Вычисляет только нужные разделы: минимизации без запроса не запускаются вовсе."""
+    table = TableBuilder.build(variables, postfix)
+    result = {
+        'mask': NumericRepresentation.index_value(table),
+        'minimized': {},
+    }
+    if 'forms' not in sections and not any(name in sections for name in MINIMIZATION_SECTIONS):
+        return result  # Только таблица: списки номеров наборов не строятся
+    free = set(dont_cares)
+    # Безразличные наборы не обязательны ни для DNF, ни для CNF, но участвуют в склеивании
+    dnf_indices = [i for i in NumericRepresentation.dnf_indices(table) if i not in free]
+    cnf_indices = [i for i in NumericRepresentation.cnf_indices(table) if i not in free]
+    dc = sorted(free)
+    n = len(variables)
+    result.update(dnf_indices=dnf_indices, cnf_indices=cnf_indices)
+    if 'forms' in sections:
+        result['dnf'] = NormalForms.dnf(variables, table)
+        result['cnf'] = NormalForms.cnf(variables, table)
+    for name, minimize in _MINIMIZERS.items():
+        if name in sections:
+            result['minimized'][name] = (minimize(dnf_indices, n, dnf=True, names=variables, dont_cares=dc),
+                                         minimize(cnf_indices, n, dnf=False, names=variables, dont_cares=dc))
+    return result
+
+
+def analyze(variables, postfix, dont_cares=(), sections=SECTIONS):
+    """Таблица истинности (битовая маска), формы и минимизации; кэшируется по постфиксной записи.
+
+    Неполный набор разделов входит в ключ, поэтому запись без минимизаций не выдаётся за полную.
+    """
+    dont_cares = tuple(sorted(set(dont_cares)))
+    sections = tuple(name for name in SECTIONS if name in sections)
+    payload = (tuple(postfix), dont_cares) if dont_cares else postfix
+    if sections != SECTIONS:
+        payload = (tuple(payload), sections)
+    key = canonical_key('lab3', payload, variables)
+    return ANALYSIS_CACHE.get_or_compute(key, lambda: _compute(variables, postfix, dont_cares, sections))
+
+
+def parse_dont_cares(text):
+    """Номера безразличных наборов через запятую или пробел; None, если запись некорректна."""
+    parts = text.replace(',', ' ').split()
+    if not all(part.isdigit() for part in parts):
+        return None
+    return sorted({int(part) for part in parts})
+
+
+def write_pieces(sink, pieces):
+    """Пишет куски текста в sink через один буфер, сбрасывая его каждые CHUNK_PIECES кусков."""
+    buffer = io.StringIO()
+    for count, piece in enumerate(pieces, 1):
+        buffer.write(piece)
+        if count % CHUNK_PIECES == 0:
+            sink.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+    sink.write(buffer.getvalue())
+
+
+def _step_lines(steps, indent):
+    for i, step in enumerate(steps, 1):
+        yield f"  Этап {i}:\n"
         for line in step:
-            print("    ", line)
+            yield f"{indent}{line}\n"
+
+
+def iter_text(variables, analysis, dont_cares, sections=SECTIONS):
+    """Генерирует текстовый вывод по разделам; строки таблицы строятся по одной при записи."""
+    rows = 1 << len(variables)
+    binary_str = format(analysis['mask'], f'0{rows}b')
+
+    if 'table' in sections:
+        header = " ".join(variables) + " | Выход"
+        yield f"\nТаблица истинности:\n{header}\n{'-' * len(header)}\n"
+        widths = [len(var) for var in variables]  # Столбцы по ширине имён переменных
+        for i in range(rows):
+            values = " ".join(bit.rjust(w) for bit, w in zip(format(i, f'0{len(variables)}b'), widths)) if variables else ""
+            yield f"{values} | {binary_str[i]}\n"
+
+    if 'forms' in sections:
+        yield f"\nDNF: {analysis['dnf']}\nCNF: {analysis['cnf']}\n"
+        yield f"Миндексы DNF: {', '.join(map(str, analysis['dnf_indices'])) or 'null'}\n"
+        yield f"Миндексы CNF: {', '.join(map(str, analysis['cnf_indices'])) or 'null'}\n"
+        # Decimal не ограничен int_max_str_digits, поэтому индекс печатается и для 16+ переменных
+        yield f"Индекс: {binary_str} (двоичное) = {Decimal(analysis['mask'])} (десятичное)\n"
+        if dont_cares:
+            yield f"Безразличные наборы: {', '.join(map(str, dont_cares))}\n"
+
+    minimized = analysis['minimized']
+    for name in MINIMIZATION_SECTIONS:
+        if name not in minimized:
+            continue
+        title, indent, gap = _MINIMIZATION_TITLES[name]
+        (dnf_min, dnf_steps), (cnf_min, cnf_steps) = minimized[name]
+        yield f"\n{title}:\nМинимизированная DNF: {dnf_min}\n"
+        yield from _step_lines(dnf_steps, indent)
+        yield f"{gap}Минимизированная CNF: {cnf_min}\n"
+        yield from _step_lines(cnf_steps, indent)
+
+
+def iter_json(variables, analysis, dont_cares, sections=SECTIONS):
+    """Тот же результат одним JSON-документом для машинной обработки; кодируется по кускам.
+
+    Индекс записывается строкой десятичных цифр: для больших таблиц он не помещается в число JSON-парсеров.
+    """
+    document = {'variables': variables, 'dont_cares': list(dont_cares)}
+    if 'table' in sections:
+        document['outputs'] = format(analysis['mask'], f'0{1 << len(variables)}b')
+    if 'forms' in sections:
+        document.update(dnf=analysis['dnf'], cnf=analysis['cnf'], dnf_indices=analysis['dnf_indices'],
+                        cnf_indices=analysis['cnf_indices'], index=str(Decimal(analysis['mask'])))
+    minimized = analysis['minimized']
+    if minimized:
+        document['minimized'] = {
+            name: {'dnf': dnf_min, 'dnf_steps': dnf_steps, 'cnf': cnf_min, 'cnf_steps': cnf_steps}
+            for name, ((dnf_min, dnf_steps), (cnf_min, cnf_steps)) in minimized.items()
+        }
+    yield from json.JSONEncoder(ensure_ascii=False).iterencode(document)
+    yield "\n"
+
+
+def _error(message, output_format):
+    if output_format == 'json':
+        return json.dumps({'error': message}, ensure_ascii=False) + "\n"
+    return message + "\n"
+
+
+def run(sections=SECTIONS, output_format='text'):
+    """Читает выражение и выводит выбранные разделы (SECTIONS) текстом или JSON (output_format='json')."""
+    sink = sys.stdout
+    # После ';' можно перечислить безразличные наборы: a & b | c ; 1, 5
+    expr, _, dc_text = input("Введите логическое выражение: ").partition(';')
+    expr = expr.strip()
+    dont_cares = parse_dont_cares(dc_text)
+    try:
+        scanned = Scanner.scan(expr)
+    except ParseError as error:
+        if error.kind == ParseError.SYMBOLS:
+            sink.write(_error(f"Ошибка: недопустимые символы в выражении. Позиция: {error.position + 1}", output_format))
+        else:
+            sink.write(_error(f"Ошибка: несбалансированные скобки. Позиция: {error.position + 1}", output_format))
+        return
 
-    print("\nМинимизированная CNF:", cnf_qmc)
-    for i, step in enumerate(qmc_cnf_steps, 1):
-        print(f"  Этап {i}:")
-        for line in step:
-            print("    ", line)
+    variables, tokens = scanned.variables, scanned.tokens
+    if not tokens:
+        sink.write(_error("Ошибка: не удалось разобрать выражение.", output_format))
+        return
 
-       # Табличная минимизация (Карно)
-    minimized_dnf, kmap_dnf_steps = BooleanMinimizer.minimize_karnaugh(dnf_indices, len(variables))
-    minimized_cnf, kmap_cnf_steps = BooleanMinimizer.minimize_karnaugh(cnf_indices, len(variables), dnf=False)
+    if dont_cares is None or any(i >= 1 << len(variables) for i in dont_cares):
+        sink.write(_error("Ошибка: некорректные безразличные наборы.", output_format))
+        return
 
-    print("\nМинимизация (табличная, Карно):")
-    print("Минимизированная DNF:", dnf_min)
-    for i, step in enumerate(kmap_dnf_steps, 1):
-        print(f"  Этап {i}:")
-        for line in step:
-            print("   ", line)
+    postfix = ExpressionConverter.to_postfix(tokens)
+    analysis = analyze(variables, postfix, dont_cares, sections)
+    render = iter_json if output_format == 'json' else iter_text
+    write_pieces(sink, render(variables, analysis, dont_cares, sections))
+
+
+def cli(argv=None):
+    parser = argparse.ArgumentParser(description="Таблица истинности, нормальные формы и минимизация (lab3).")
+    parser.add_argument('--sections', default=','.join(SECTIONS),
+                        help="разделы через запятую: " + ','.join(SECTIONS))
+    parser.add_argument('--table-only', action='store_true', help="только таблица истинности")
+    parser.add_argument('--minimize-only', action='store_true', help="только минимизации")
+    parser.add_argument('--json', action='store_true', help="вывод одним JSON-документом")
+    args = parser.parse_args(argv)
+
+    sections = [name for name in args.sections.split(',') if name]
+    for name in sections:
+        if name not in SECTIONS:
+            parser.error(f"неизвестный раздел: {name}")
+    if args.table_only:
+        sections = ['table']
+    elif args.minimize_only:
+        sections = list(MINIMIZATION_SECTIONS)
+    run(tuple(sections), 'json' if args.json else 'text')
+    sys.stdout.flush()
+    return 0
 
-    print("Минимизированная CNF:", cnf_min)
-    for i, step in enumerate(kmap_cnf_steps, 1):
-        print(f"  Этап {i}:")
-        for line in step:
-            print("   ", line)
 
 if __name__ == "__main__":
+    # С аргументами — выбор разделов и формата (python main.py --minimize-only --json), без — полный вывод
+    if len(sys.argv) > 1:
+        sys.exit(cli(sys.argv[1:]))
     run()
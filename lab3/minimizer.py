@@ -1,7 +1,11 @@
-from typing import List, Tuple, Set
-from itertools import combinations
+import heapq
+import time
+from typing import Dict, List, Tuple, Set
 from collections import defaultdict
 
+from bdd import BddFunction
+from pla import read_pla
+
 class BinaryUtils:
     @staticmethod
     def to_binary(n: int, width: int) -> str:
@@ -27,37 +31,101 @@ class BinaryUtils:
 
 class ImplicantReducer:
     @staticmethod
-    def extract_implicants(ones: List[int], bit_width: int) -> Tuple[List[Tuple[str, Set[int]]], List[List[str]]]:
-        groups = {}
+    def extract_implicants(ones: List[int], bit_width: int, dont_cares: List[int] = (),
+                           output_masks: Dict[int, int] = None) -> Tuple[List[Tuple[str, Set[int]]], List[List[str]]]:
+        """Склеивание Квайна — Мак-Класки над импликантами (value, mask) в целых числах.
+
+        Биты mask — склеенные позиции ('-'). Партнёры импликанты ищутся по словарю
+        (mask, value) соседней группы, а не перебором всех пар; повторы и простые
+        импликанты отсекаются множествами. Порядок шагов в журнале прежний.
+
+        Безразличные наборы dont_cares участвуют в склеивании, но импликанта, целиком
+        состоящая из них, в простые не попадает.
+
+        output_masks (минтерм -> маска выходов, где он равен 1 или безразличен) включает
+        режим нескольких выходов: склеиваются только импликанты с общими выходами, маска
+        склейки — пересечение масок, а простая импликанта возвращается тройкой
+        (строка, минтермы, маска выходов).
+        """
+        tag_of = output_masks or {}
+        # Битсет безразличных наборов: принадлежность проверяется сдвигом, без поиска во множестве
+        dc_bits = 0
+        for val in dont_cares:
+            dc_bits |= 1 << val
         for val in ones:
-            b = BinaryUtils.to_binary(val, bit_width)
-            ones_count = BinaryUtils.count_ones(b)
-            groups.setdefault(ones_count, []).append((b, {val}))
+            dc_bits &= ~(1 << val)
+        extra = [val for val in dict.fromkeys(dont_cares) if (dc_bits >> val) & 1]
+
+        # Импликанта: (value, mask, строка, множество минтермов, есть ли в ней обязательный минтерм,
+        # маска выходов; без output_masks выход один)
+        groups = {}
+        for val in list(ones) + extra:
+            groups.setdefault(bin(val).count('1'), []).append(
+                (val, 0, BinaryUtils.to_binary(val, bit_width), {val}, not (dc_bits >> val) & 1, tag_of.get(val, 1)))
 
         primes = []
+        prime_keys = set()
         history = []
-        
+
         while groups:
             merged = {}
+            merged_keys = set()
             step_log = []
-            used = set()
+            used_keys = set()  # Склеенные импликанты (с несколькими выходами — без сужения маски выходов)
             keys = sorted(groups.keys())
 
             for i in range(len(keys) - 1):
-                for a, ta in groups[keys[i]]:
-                    for b, tb in groups[keys[i + 1]]:
-                        ok, merged_bits = BinaryUtils.can_merge(a, b)
-                        if ok:
-                            if merged_bits not in [x[0] for x in merged.get(BinaryUtils.count_ones(merged_bits), [])]:
-                                merged.setdefault(BinaryUtils.count_ones(merged_bits), []).append((merged_bits, ta | tb))
-                                used.update(ta)
-                                used.update(tb)
-                                step_log.append(f"{a} + {b} => {merged_bits} :: {ta | tb}")
+                if keys[i + 1] != keys[i] + 1:
+                    continue  # Группы, различающиеся больше чем на одну единицу, не склеиваются
+                upper = groups[keys[i + 1]]
+                positions = {}
+                for index, (value, mask, *_) in enumerate(upper):
+                    positions.setdefault((value, mask), []).append(index)
+
+                for value, mask, a, ta, ca, ga in groups[keys[i]]:
+                    # Партнёр отличается одной единицей в позиции, которая в a равна 0 и не склеена
+                    free = ~(value | mask) & ((1 << bit_width) - 1)
+                    partners = []
+                    while free:
+                        bit = free & -free
+                        free ^= bit
+                        for index in positions.get((value | bit, mask), ()):
+                            partners.append((index, bit))
+                    partners.sort()
+
+                    for index, bit in partners:
+                        _, _, b, tb, cb, gb = upper[index]
+                        tag = ga & gb
+                        if not tag:
+                            continue
+                        # Импликанта не простая, только если сама склеилась (без потери выходов);
+                        # покрытость её минтермов другими склейками простоту не отменяет
+                        if tag == ga:
+                            used_keys.add((value, mask, ga))
+                        if tag == gb:
+                            used_keys.add((value | bit, mask, gb))
+                        key = (value, mask | bit, tag)
+                        if key in merged_keys:
+                            continue
+                        merged_keys.add(key)
+                        pos = bit_width - bit.bit_length()
+                        merged_bits = a[:pos] + '-' + a[pos + 1:]
+                        merged.setdefault(keys[i], []).append((value, mask | bit, merged_bits, ta | tb, ca or cb, tag))
+                        if output_masks is None:
+                            step_log.append(f"{a} + {b} => {merged_bits} :: {ta | tb}")
+                            continue
+                        step_log.append(f"{a} + {b} => {merged_bits} :: {ta | tb} :: "
+                                        f"выходы {ImplicantReducer.outputs(tag)}")
 
             for lst in groups.values():
-                for bits, tset in lst:
-                    if not tset <= used and (bits, tset) not in primes:
-                        primes.append((bits, tset))
+                for value, mask, bits, tset, care, tag in lst:
+                    key = (value, mask, tag)
+                    if not care or key in prime_keys:
+                        continue
+                    if key in used_keys:
+                        continue
+                    prime_keys.add(key)
+                    primes.append((bits, tset) if output_masks is None else (bits, tset, tag))
 
             if not step_log:
                 break
@@ -67,9 +135,31 @@ class ImplicantReducer:
 
         return primes, history
 
+    @staticmethod
+    def outputs(tag: int) -> List[int]:
+        """Номера выходов в маске (младший бит — выход 0)."""
+        return [k for k in range(tag.bit_length()) if (tag >> k) & 1]
+
 class EssentialFinder:
     @staticmethod
-    def filter_essentials(primes: List[Tuple[str, Set[int]]], targets: Set[int]) -> List[Tuple[str, Set[int]]]:
+    def filter_essentials(primes: List[Tuple[str, Set[int]]], targets: Set[int], mode: str = 'greedy',
+                          time_budget: float = 1.0, dont_cares: Set[int] = (), node_limit: int = None,
+                          report: dict = None) -> List[Tuple[str, Set[int]]]:
+        """Существенные импликанты и добор покрытия.
+
+        mode: 'greedy' — прежний жадный добор, 'incremental' — тот же выбор со счётчиками
+        выигрыша, 'exact' — минимальное покрытие (число импликант, затем литералов);
+        если за time_budget секунд (None — без ограничения) или за node_limit узлов перебора
+        точный поиск не завершён, берётся лучшее найденное или жадное покрытие, а в
+        report['complete'] записывается False. Безразличные наборы dont_cares покрывать не требуется.
+        Строки primes — кортежи (bits, минтермы, ...); остальные поля не используются.
+        """
+        if mode not in EssentialFinder.MODES:
+            raise ValueError(f"Unknown cover mode: {mode}")
+        if report is not None:
+            report['complete'] = True
+        if dont_cares:
+            targets = set(targets) - set(dont_cares)
         if not targets:
             return []
         
@@ -83,7 +173,7 @@ class EssentialFinder:
         remaining = set(targets)
         
         for p in primes:
-            if p[1] == targets:
+            if targets <= p[1]:
                 return [p]
         
         for m in list(remaining):
@@ -92,6 +182,15 @@ class EssentialFinder:
                 if imp not in essentials:
                     essentials.append(imp)
                     remaining -= imp[1]
+
+        if mode == 'incremental':
+            return essentials + EssentialFinder._greedy_incremental(primes, essentials, remaining)
+        if mode == 'exact':
+            rest, complete = EssentialFinder._exact_cover(primes, essentials, remaining & targets,
+                                                          time_budget, node_limit)
+            if report is not None:
+                report['complete'] = complete
+            return essentials + rest
         
         while remaining:
             best = max((p for p in primes if p not in essentials), 
@@ -103,6 +202,121 @@ class EssentialFinder:
         
         return essentials
 
+    MODES = ('greedy', 'incremental', 'exact')
+
+    @staticmethod
+    def _greedy_incremental(primes, chosen, remaining):
+        """Жадный выбор с счётчиками покрытия: после выбора уменьшаются только затронутые счётчики."""
+        taken = {id(p) for p in chosen}
+        candidates = [p for p in primes if id(p) not in taken]
+        remaining = set(remaining)
+        gain = [len(p[1] & remaining) for p in candidates]
+        owners = defaultdict(list)  # минтерм -> номера кандидатов, которые его покрывают
+        for i, p in enumerate(candidates):
+            for m in p[1] & remaining:
+                owners[m].append(i)
+
+        # Куча с ленивым обновлением; при равном выигрыше выигрывает более ранний кандидат, как у max()
+        heap = [(-g, i) for i, g in enumerate(gain)]
+        heapq.heapify(heap)
+        picked = []
+        while remaining and heap:
+            g, i = heapq.heappop(heap)
+            if -g != gain[i]:
+                heapq.heappush(heap, (-gain[i], i))
+                continue
+            if gain[i] == 0:
+                break
+            picked.append(candidates[i])
+            for m in candidates[i][1] & remaining:
+                remaining.discard(m)
+                for j in owners[m]:
+                    gain[j] -= 1
+        return picked
+
+    @staticmethod
+    def _exact_cover(primes, chosen, remaining, time_budget, node_limit=None):
+        """Минимальное покрытие оставшихся минтермов: доминирование строк и столбцов, затем ветви и границы.
+
+        Возвращает покрытие и признак того, что перебор завершён в пределах бюджета.
+        """
+        if not remaining:
+            return [], True
+        taken = {id(p) for p in chosen}
+        candidates = [p for p in primes if id(p) not in taken]
+        column = {m: 1 << k for k, m in enumerate(sorted(remaining))}
+        rows = {}
+        for i, p in enumerate(candidates):
+            bits, mask = p[0], 0
+            for m in p[1]:
+                mask |= column.get(m, 0)
+            if mask:
+                rows[i] = (mask, (1, len(bits) - bits.count('-')))
+
+        # Доминирование строк: строку, покрывающую подмножество другой не дешевле неё, отбрасываем
+        order = sorted(rows, key=lambda i: (-bin(rows[i][0]).count('1'), rows[i][1], i))
+        kept = []
+        for i in order:
+            mask, cost = rows[i]
+            if not any(mask & ~rows[j][0] == 0 and rows[j][1] <= cost for j in kept):
+                kept.append(i)
+
+        # Доминирование столбцов: если каждый покрывающий столбец c покрывает и d, столбец d лишний
+        covering = {bit: frozenset(i for i in kept if rows[i][0] & bit) for bit in column.values()}
+        if not all(covering.values()):
+            return EssentialFinder._greedy_incremental(primes, chosen, remaining), True
+        required = 0
+        for bit, owners in covering.items():
+            if not any(other != bit and covering[other] <= owners and
+                       (covering[other] != owners or other < bit) for other in covering):
+                required |= bit
+
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        nodes = [0]
+        best = [None, None]  # [стоимость, выбранные строки]
+
+        def total(selection):
+            return (len(selection), sum(rows[i][1][1] for i in selection))
+
+        def search(uncovered, selection):
+            nodes[0] += 1
+            if (node_limit is not None and nodes[0] > node_limit or
+                    deadline is not None and time.perf_counter() > deadline):
+                raise TimeoutError
+            if not uncovered:
+                cost = total(selection)
+                if best[0] is None or cost < best[0]:
+                    best[0], best[1] = cost, list(selection)
+                return
+            # Нижняя граница: каждая следующая строка закрывает не больше самой широкой
+            widest = max(bin(rows[i][0] & uncovered).count('1') for i in kept)
+            if widest == 0:
+                return
+            lower = len(selection) + -(-bin(uncovered).count('1') // widest)
+            if best[0] is not None and (lower, 0) >= best[0]:
+                return
+            # Ветвимся по столбцу с наименьшим числом покрывающих строк
+            bit = min(EssentialFinder._bits(uncovered), key=lambda b: len(covering[b]))
+            for i in sorted(covering[bit], key=lambda i: (-bin(rows[i][0] & uncovered).count('1'), rows[i][1], i)):
+                selection.append(i)
+                search(uncovered & ~rows[i][0], selection)
+                selection.pop()
+
+        try:
+            search(required, [])
+        except TimeoutError:
+            if best[1] is None:
+                return EssentialFinder._greedy_incremental(primes, chosen, remaining), False
+            return [candidates[i] for i in sorted(best[1])], False
+        return [candidates[i] for i in sorted(best[1])], True
+
+    @staticmethod
+    def _bits(mask):
+        while mask:
+            bit = mask & -mask
+            yield bit
+            mask ^= bit
+
 class ExpressionFormatter:
     @staticmethod
     def to_logical(pattern: str, vars: List[str], conjunctive: bool) -> str:
@@ -129,19 +343,215 @@ class ExpressionFormatter:
 
 
 
+class EspressoMinimizer:
+    """Эвристика в духе espresso над покрытием кубами (value, mask): расширение, удаление
+    избыточных кубов и сужение, пока стоимость (кубы, литералы) уменьшается.
+
+    Все шаги работают с кубами (пересечение, кофактор, проверка тавтологии, дополнение),
+    минтермы не перечисляются, поэтому подходит для функций, на которых склеивание
+    Квайна — Мак-Класки уже не справляется.
+    """
+
+    max_iterations = 16
+
+    @staticmethod
+    def cube_minterms(value: int, mask: int) -> List[int]:
+        result = []
+        sub = mask
+        while True:
+            result.append(value | sub)
+            if sub == 0:
+                return result
+            sub = (sub - 1) & mask
+
+    @staticmethod
+    def pattern(value: int, mask: int, width: int) -> str:
+        return ''.join('-' if (mask >> (width - 1 - i)) & 1 else str((value >> (width - 1 - i)) & 1)
+                       for i in range(width))
+
+    @staticmethod
+    def cost(cover: List[Tuple[int, int]], width: int) -> Tuple[int, int]:
+        return len(cover), sum(width - bin(mask).count('1') for _, mask in cover)
+
+    @staticmethod
+    def contains(a: Tuple[int, int], b: Tuple[int, int]) -> bool:
+        return b[1] & ~a[1] == 0 and (a[0] ^ b[0]) & ~a[1] == 0
+
+    @staticmethod
+    def cofactor(cover, cube, width):
+        """Кофактор покрытия по кубу: заданные в кубе позиции становятся безразличными."""
+        value, mask = cube
+        free = ((1 << width) - 1) & ~mask
+        return [(v & mask, m | free) for v, m in cover if not (v ^ value) & ~m & free]
+
+    @staticmethod
+    def _split(cover, width):
+        """Переменная (её бит), заданная в наибольшем числе кубов, и числа её прямых и инверсных литералов."""
+        best = (0, 0, 0, 0)
+        for i in range(width):
+            bit = 1 << i
+            ones = sum(1 for v, m in cover if v & bit)
+            zeros = sum(1 for v, m in cover if not (v | m) & bit)
+            best = max(best, (ones + zeros, bit, ones, zeros))
+        return best[1:]
+
+    @staticmethod
+    def tautology(cover, width) -> bool:
+        """Покрывают ли кубы всё пространство: разбиение по переменным с отсечением по объёму."""
+        full = (1 << width) - 1
+        if any(m == full for _, m in cover):
+            return True
+        if sum(1 << bin(m).count('1') for _, m in cover) < 1 << width:
+            return False
+        bit, ones, zeros = EspressoMinimizer._split(cover, width)
+        # Унатная переменная: достаточно проверить кофактор, в который её литералы не попадают
+        polarities = [(bit, bit)] if not ones else [(0, bit)] if not zeros else [(0, bit), (bit, bit)]
+        return all(EspressoMinimizer.tautology(EspressoMinimizer.cofactor(cover, (value, full & ~bit), width), width)
+                   for value, bit in polarities)
+
+    @staticmethod
+    def complement(cover, width):
+        """Дополнение покрытия: рекурсивное разбиение, одиночный куб — по закону де Моргана."""
+        full = (1 << width) - 1
+        if not cover:
+            return [(0, full)]
+        if any(m == full for _, m in cover):
+            return []
+        if len(cover) == 1:
+            value, mask = cover[0]
+            return [(~value & bit, full & ~bit) for bit in EspressoMinimizer._bits_of(full & ~mask)]
+        bit = EspressoMinimizer._split(cover, width)[0]
+        low = EspressoMinimizer.complement(EspressoMinimizer.cofactor(cover, (0, full & ~bit), width), width)
+        high = EspressoMinimizer.complement(EspressoMinimizer.cofactor(cover, (bit, full & ~bit), width), width)
+        # Кубы, общие для обеих половин, от переменной не зависят
+        common = set(low) & set(high)
+        return ([c for c in low if c in common] + [(v, m & ~bit) for v, m in low if (v, m) not in common] +
+                [(v | bit, m & ~bit) for v, m in high if (v, m) not in common])
+
+    @staticmethod
+    def _bits_of(mask):
+        while mask:
+            bit = mask & -mask
+            yield bit
+            mask ^= bit
+
+    @staticmethod
+    def covered(cube, cover, width) -> bool:
+        """Куб целиком покрыт объединением кубов cover."""
+        return EspressoMinimizer.tautology(EspressoMinimizer.cofactor(cover, cube, width), width)
+
+    @staticmethod
+    def expand(cover, off, width):
+        """Расширяет каждый куб, пока он не задевает OFF-множество; поглощённые кубы удаляются."""
+        cover = sorted(cover, key=lambda c: -bin(c[1]).count('1'))
+        # Сколько кубов содержит литерал x_i (ones) и !x_i (zeros): по ним выбирается порядок расширения
+        ones, zeros = [0] * width, [0] * width
+        for v, m in cover:
+            for i in range(width):
+                if not (m >> i) & 1:
+                    if (v >> i) & 1:
+                        ones[i] += 1
+                    else:
+                        zeros[i] += 1
+
+        result = []
+        for value, mask in cover:
+            if result and EspressoMinimizer.covered((value, mask), result, width):
+                continue  # Уже поглощён расширенными кубами
+            # Первыми поднимаем литералы, в которых куб расходится с большинством остальных
+            weights = sorted((-(zeros[i] if (value >> i) & 1 else ones[i]), i)
+                             for i in range(width) if not (mask >> i) & 1)
+            for _, i in weights:
+                bit = 1 << i
+                raised, fixed = value & ~bit, ~(mask | bit)
+                if all((raised ^ v) & fixed & ~m for v, m in off):  # Ни с одним кубом OFF не пересекается
+                    value, mask = raised, mask | bit
+            result.append((value, mask))
+        # Кубы, поглощённые расширенными позже, отбрасываем (после сортировки по размеру их немного)
+        return [c for k, c in enumerate(result)
+                if not any(EspressoMinimizer.contains(d, c) for d in result[k + 1:])]
+
+    @staticmethod
+    def irredundant(cover, dc, width):
+        """Один детерминированный проход: начиная с самых узких, удаляет кубы, покрытые остальными и dc."""
+        alive = [True] * len(cover)
+        for i in sorted(range(len(cover)), key=lambda i: (bin(cover[i][1]).count('1'), i)):
+            rest = [c for j, c in enumerate(cover) if alive[j] and j != i]
+            if EspressoMinimizer.covered(cover[i], rest + list(dc), width):
+                alive[i] = False
+        return [c for c, keep in zip(cover, alive) if keep]
+
+    @staticmethod
+    def reduce(cover, dc, width):
+        """Сужает каждый куб до наименьшего куба, содержащего всё, что не покрыто остальными кубами и dc."""
+        result = list(cover)
+        for i, (value, mask) in enumerate(cover):
+            rest = [c for j, c in enumerate(result) if j != i and c is not None] + list(dc)
+            uncovered = EspressoMinimizer.complement(EspressoMinimizer.cofactor(rest, (value, mask), width), width)
+            if not uncovered:
+                result[i] = None
+                continue
+            # Наименьший куб над непокрытой частью, пересечённый с исходным кубом
+            first = uncovered[0][0]
+            spread = 0
+            for v, m in uncovered:
+                spread |= m | (v ^ first)
+            result[i] = (value | (first & ~spread), mask & spread)
+        return [c for c in result if c is not None]
+
+    @staticmethod
+    def run(on: List[Tuple[int, int]], dc: List[Tuple[int, int]], width: int,
+            off: List[Tuple[int, int]] = None) -> Tuple[List[Tuple[int, int]], List[List[str]]]:
+        """Минимизирует покрытие кубов on; OFF-множество — дополнение on и dc, если не задано явно
+        (тогда безразлично всё, что не входит ни в on, ни в off)."""
+        if off is None:
+            off = EspressoMinimizer.complement(list(on) + list(dc), width)
+        else:
+            dc = EspressoMinimizer.complement(list(on) + list(off), width)
+        cover = list(on)
+        best = None
+        steps = []
+        for iteration in range(1, EspressoMinimizer.max_iterations + 1):
+            step = [f"Итерация {iteration}:"]
+            cover = EspressoMinimizer.expand(cover, off, width)
+            step.append("Расширение: {} кубов, {} литералов".format(*EspressoMinimizer.cost(cover, width)))
+            cover = EspressoMinimizer.irredundant(cover, dc, width)
+            cost = EspressoMinimizer.cost(cover, width)
+            step.append("Удаление избыточных: {} кубов, {} литералов".format(*cost))
+            steps.append(step)
+            if best is not None and cost >= best[0]:
+                break
+            best = (cost, cover)
+            cover = EspressoMinimizer.reduce(cover, dc, width)
+            step.append("Сужение: {} кубов, {} литералов".format(*EspressoMinimizer.cost(cover, width)))
+        return best[1], steps
+
+
 class BooleanMinimizer:
+    MULTI_NODE_LIMIT = 10000  # Предел узлов точного перебора в совместной минимизации
+
     @staticmethod
-    def minimize(minterms: List[int], var_count: int, dnf: bool = True) -> Tuple[str, List[List[str]]]:
+    def variable_names(var_count: int, names: List[str] = None) -> List[str]:
+        # По умолчанию переменные называются a, b, c, ...
+        return list(names) if names else [chr(97 + i) for i in range(var_count)]
+
+    @staticmethod
+    def minimize(minterms: List[int], var_count: int, dnf: bool = True, names: List[str] = None,
+                 cover: str = 'greedy', dont_cares: List[int] = (), node_limit: int = None,
+                 report: dict = None) -> Tuple[str, List[List[str]]]:
         if not minterms:
             return ("Contradiction" if dnf else "Tautology", [])
 
-        primes, steps = ImplicantReducer.extract_implicants(minterms, var_count)
-        essentials = EssentialFinder.filter_essentials(primes, set(minterms))
+        primes, steps = ImplicantReducer.extract_implicants(minterms, var_count, dont_cares)
+        # С явным пределом узлов точный поиск детерминирован и по времени не ограничивается
+        essentials = EssentialFinder.filter_essentials(primes, set(minterms), cover,
+                                                       time_budget=1.0 if node_limit is None else None,
+                                                       node_limit=node_limit, report=report)
 
         if not essentials:
             return ("Contradiction" if dnf else "Tautology", steps)
 
-        variables = [chr(97 + i) for i in range(var_count)]
+        variables = BooleanMinimizer.variable_names(var_count, names)
         clauses = []
         for p in essentials:
             expr = ExpressionFormatter.to_logical(p[0], variables, dnf)
@@ -152,11 +562,130 @@ class BooleanMinimizer:
         return (" | ".join(clauses) if dnf else " & ".join(clauses), steps)
 
     @staticmethod
-    def minimize_qmc(minterms: List[int], var_count: int, dnf: bool = True) -> Tuple[str, List[List[str]]]:
+    def minimize_espresso(minterms: List[int], var_count: int, dnf: bool = True, names: List[str] = None,
+                          dont_cares: List[int] = ()) -> Tuple[str, List[List[str]]]:
         if not minterms:
             return ("Contradiction" if dnf else "Tautology", [])
 
-        primes, steps = ImplicantReducer.extract_implicants(minterms, var_count)
+        cover, steps = EspressoMinimizer.run([(m, 0) for m in sorted(set(minterms))],
+                                             [(m, 0) for m in sorted(set(dont_cares) - set(minterms))], var_count)
+        return BooleanMinimizer._cover_result(cover, steps, var_count, dnf, names)
+
+    @staticmethod
+    def _cover_result(cover: List[Tuple[int, int]], steps: List[List[str]], var_count: int, dnf: bool,
+                      names: List[str]) -> Tuple[str, List[List[str]]]:
+        """Формула по покрытию кубами (value, mask); в журнал добавляется само покрытие."""
+        variables = BooleanMinimizer.variable_names(var_count, names)
+        clauses = []
+        for value, mask in cover:
+            expr = ExpressionFormatter.to_logical(EspressoMinimizer.pattern(value, mask, var_count), variables, dnf)
+            if ('&' in expr and dnf) or ('|' in expr and not dnf):
+                expr = f"({expr})"
+            clauses.append(expr)
+        steps.append(["Покрытие:"] + [EspressoMinimizer.pattern(v, m, var_count) for v, m in cover])
+
+        return (" | ".join(clauses) if dnf else " & ".join(clauses), steps)
+
+    @staticmethod
+    def minimize_bdd(function: BddFunction, dnf: bool = True, names: List[str] = None) -> Tuple[str, List[List[str]]]:
+        """Неизбыточная ДНФ/КНФ по BDD (покрытие ISOP) без построения таблицы истинности."""
+        var_count = len(function.variables)
+        if not (function.is_satisfiable() if dnf else not function.is_tautology()):
+            return ("Contradiction" if dnf else "Tautology", [])
+
+        return BooleanMinimizer._cover_result(function.isop(dnf), [], var_count, dnf, names or function.variables)
+
+    @staticmethod
+    def minimize_pla(source: str, output: int = 0, dnf: bool = True) -> Tuple[str, List[List[str]]]:
+        """Espresso для одного выхода PLA-описания (файл или текст) прямо над кубами описания."""
+        pla = read_pla(source)
+        if not pla.on_cubes[output]:
+            return ("Contradiction" if dnf else "Tautology", [])
+        off = pla.off_cubes[output] if pla.off_cubes is not None else None
+        cover, steps = EspressoMinimizer.run(pla.on_cubes[output], pla.dc_cubes[output], len(pla.inputs), off)
+        return BooleanMinimizer._cover_result(cover, steps, len(pla.inputs), dnf, pla.inputs)
+
+    @staticmethod
+    def minimize_multi(minterm_lists: List[List[int]], var_count: int, dnf: bool = True, names: List[str] = None,
+                       cover: str = 'exact', dont_cares: List[List[int]] = None, node_limit: int = MULTI_NODE_LIMIT,
+                       report: dict = None) -> Tuple[List[str], List[List[str]]]:
+        """Совместная минимизация нескольких функций одних и тех же переменных.
+
+        Импликанты склеиваются с масками выходов, затем решается одно покрытие пар
+        (выход, минтерм): общая для нескольких выходов импликанта считается один раз,
+        поэтому минимизируется общее число различных импликант. Для каждого выхода
+        из выбранных импликант оставляется неизбыточное подмножество.
+
+        Точный перебор ограничен node_limit узлами, а не временем, поэтому результат
+        не зависит от машины. Если перебор остановлен на пределе, в журнал добавляется
+        предупреждение, а в report['complete'] записывается False.
+        """
+        dont_cares = dont_cares or [()] * len(minterm_lists)
+        empty = "Contradiction" if dnf else "Tautology"
+        output_masks = {}
+        for k, (ones, dc) in enumerate(zip(minterm_lists, dont_cares)):
+            for m in set(ones) | set(dc):
+                output_masks[m] = output_masks.get(m, 0) | (1 << k)
+        on_sets = [set(ones) for ones in minterm_lists]
+        if not any(on_sets):
+            return [empty] * len(minterm_lists), []
+
+        primes, steps = ImplicantReducer.extract_implicants(sorted(output_masks), var_count,
+                                                            output_masks=output_masks)
+
+        # Цель покрытия — пара (выход k, минтерм m), записанная числом k * 2^n + m
+        size = 1 << var_count
+        rows = []
+        for bits, tset, tag in primes:
+            pairs = {k * size + m for k in ImplicantReducer.outputs(tag) for m in tset & on_sets[k]}
+            if pairs:
+                rows.append((bits, pairs, tag))
+        targets = {k * size + m for k, on in enumerate(on_sets) for m in on}
+        search = {}
+        shared = EssentialFinder.filter_essentials(rows, targets, cover, time_budget=None,
+                                                   node_limit=node_limit, report=search)
+        complete = search['complete']
+
+        variables = BooleanMinimizer.variable_names(var_count, names)
+        results = []
+        for k, on in enumerate(on_sets):
+            own = [(bits, {pair - k * size for pair in pairs if pair // size == k})
+                   for bits, pairs, _ in shared]
+            own = [p for p in own if p[1]]
+            clauses = []
+            for bits, _ in EssentialFinder.filter_essentials(own, on, 'exact', time_budget=None,
+                                                             node_limit=node_limit, report=search):
+                expr = ExpressionFormatter.to_logical(bits, variables, dnf)
+                if ('&' in expr and dnf) or ('|' in expr and not dnf):
+                    expr = f"({expr})"
+                clauses.append(expr)
+            results.append((" | ".join(clauses) if dnf else " & ".join(clauses)) or empty)
+            complete = complete and search['complete']
+
+        if not complete:
+            steps.append([f"Точный перебор остановлен на пределе {node_limit} узлов: покрытие может быть не минимальным"])
+        steps.append(["Совместное покрытие:"] +
+                     [f"{bits} -> выходы {ImplicantReducer.outputs(tag)}" for bits, _, tag in shared])
+        if report is not None:
+            report['complete'] = complete
+        return results, steps
+
+    @staticmethod
+    def minimize_pla_multi(source: str, dnf: bool = True, node_limit: int = MULTI_NODE_LIMIT,
+                           report: dict = None) -> Tuple[List[str], List[List[str]]]:
+        """minimize_multi для всех выходов PLA-описания (файл или текст)."""
+        pla = read_pla(source)
+        return BooleanMinimizer.minimize_multi([sorted(on) for on in pla.on], len(pla.inputs), dnf, pla.inputs,
+                                               dont_cares=[sorted(dc) for dc in pla.dc], node_limit=node_limit,
+                                               report=report)
+
+    @staticmethod
+    def minimize_qmc(minterms: List[int], var_count: int, dnf: bool = True, names: List[str] = None,
+                     cover: str = 'greedy', dont_cares: List[int] = ()) -> Tuple[str, List[List[str]]]:
+        if not minterms:
+            return ("Contradiction" if dnf else "Tautology", [])
+
+        primes, steps = ImplicantReducer.extract_implicants(minterms, var_count, dont_cares)
         
         targets = set(minterms)
         covers = {t: [] for t in targets}
@@ -176,15 +705,15 @@ class BooleanMinimizer:
         
         steps.append(cover_table)
         
-        essentials = EssentialFinder.filter_essentials(primes, targets)
+        essentials = EssentialFinder.filter_essentials(primes, targets, cover)
         
+        variables = BooleanMinimizer.variable_names(var_count, names)
         essential_step = ["Существенные импликанты:" if dnf else "Существенные импликаты:"]
         for idx, (bits, tset) in enumerate(essentials):
-            expr = ExpressionFormatter.to_logical(bits, [chr(97 + i) for i in range(var_count)], dnf)
+            expr = ExpressionFormatter.to_logical(bits, variables, dnf)
             essential_step.append(f"{bits} покрывает {sorted(tset)} ({expr})")
         steps.append(essential_step)
         
-        variables = [chr(97 + i) for i in range(var_count)]
         clauses = []
         for p in essentials:
             expr = ExpressionFormatter.to_logical(p[0], variables, dnf)
@@ -196,68 +725,58 @@ class BooleanMinimizer:
         return result, steps
 
     @staticmethod
-    def minimize_karnaugh(indices: List[int], var_count: int, dnf: bool = True) -> Tuple[str, List[List[str]]]:
+    def minimize_karnaugh(indices: List[int], var_count: int, dnf: bool = True, names: List[str] = None,
+                          dont_cares: List[int] = ()) -> Tuple[str, List[List[str]]]:
         def gray_code(n):
             return [i ^ (i >> 1) for i in range(1 << n)]
 
-        if not indices:
-            return ("Contradiction" if dnf else "Tautology", [["Карта Карно:"], ["0 0 0 0", "0 0 0 0"], ["Группы не найдены"]])
-
         rows = 1 << (var_count // 2)
         cols = 1 << ((var_count + 1) // 2)
         grid = [[0] * cols for _ in range(rows)]
-        row_gray = [format(g, f'0{var_count//2}b') for g in gray_code(var_count//2)]
+        row_gray = [format(g, f'0{var_count//2}b') if var_count // 2 else '' for g in gray_code(var_count//2)]
         col_gray = [format(g, f'0{(var_count+1)//2}b') for g in gray_code((var_count+1)//2)]
 
-        cell_to_bits = {}
-        bit_index_map = {}
+        targets = set(indices)
+        free = set(dont_cares) - targets  # Безразличные клетки отмечаются 'X'
         for i in range(rows):
             for j in range(cols):
-                bits = (row_gray[i] + col_gray[j])[:var_count]
-                index = int(bits, 2)
-                cell_to_bits[(i, j)] = bits
-                bit_index_map[index] = bits
-                if index in indices:
+                index = int((row_gray[i] + col_gray[j])[:var_count], 2)
+                if index in targets:
                     grid[i][j] = 1
+                elif index in free:
+                    grid[i][j] = 'X'
 
         steps = [["Карта Карно:"]]
         steps.append([" ".join(map(str, row)) for row in grid])
-
-        # Группировка по переменным: если переменная одинаково во всех индексах
-        var_values = defaultdict(set)
-        for index in indices:
-            bits = bit_index_map[index]
-            for i, bit in enumerate(bits):
-                var_values[i].add(bit)
-
-        global_groups = []
-        for i, values in var_values.items():
-            if len(values) == 1:
-                pattern = ['-' for _ in range(var_count)]
-                pattern[i] = values.pop()
-                global_groups.append(("".join(pattern), set(filter(lambda idx: bit_index_map[idx][i] == pattern[i], indices))))
-
-        # Если осталось что-то непокрытое — добавляем явно
-        covered = set()
-        for _, group_indices in global_groups:
-            covered |= group_indices
-        for idx in indices:
-            if idx not in covered:
-                global_groups.append((bit_index_map[idx], {idx}))
-
-        # Минимальное покрытие
-        targets = set(indices)
-        best_cover = None
-        for r in range(1, len(global_groups)+1):
-            for combo in combinations(global_groups, r):
-                covered_now = set().union(*(g[1] for g in combo))
-                if covered_now == targets:
-                    if best_cover is None or sum(p.count('0') + p.count('1') for p, _ in combo) < sum(p.count('0') + p.count('1') for p, _ in best_cover):
-                        best_cover = combo
-            if best_cover:
-                break
-
-        variables = [chr(97 + i) for i in range(var_count)]
+        if not targets:
+            return ("Contradiction" if dnf else "Tautology", steps + [["Группы не найдены"]])
+
+        # Группы растут удвоением: группа склеивается со своей копией, отражённой по одной из осей
+        # карты. До 4 переменных это прямоугольники на торе; на картах из 5–6 переменных
+        # добавляется соседство через ось симметрии, иначе группы вроде «e = 0» не находятся.
+        # Группы составляются из единиц и безразличных клеток; кандидаты покрытия — максимальные
+        # группы хотя бы с одной единицей, крупные первыми.
+        allowed = targets | free
+        full = (1 << var_count) - 1
+        level = {(x, 0) for x in allowed}
+        maximal = []
+        while level:
+            merged, grown = set(), set()
+            for value, mask in level:
+                for bit in EssentialFinder._bits(full & ~mask & ~value):
+                    if (value | bit, mask) in level:
+                        grown.add((value, mask | bit))
+                        merged.update(((value, mask), (value | bit, mask)))
+            maximal = sorted(g for g in level - merged
+                             if any(x in targets for x in EspressoMinimizer.cube_minterms(*g))) + maximal
+            level = grown
+        primes = [(EspressoMinimizer.pattern(v, m, var_count), set(EspressoMinimizer.cube_minterms(v, m)))
+                  for v, m in maximal]
+        best_cover = EssentialFinder.filter_essentials(primes, targets, 'exact')
+
+        variables = BooleanMinimizer.variable_names(var_count, names)
         expressions = [ExpressionFormatter.to_logical(p, variables, dnf) for p, _ in best_cover] if best_cover else []
-        minimized_expr = " | ".join(f"({e})" for e in expressions) if dnf else " & ".join(f"({e})" for e in expressions)
+        # Группы берутся в скобки; константа из группы во всю карту печатается как у ExpressionFormatter
+        expressions = [e if e in ("1", "0") else f"({e})" for e in expressions]
+        minimized_expr = " | ".join(expressions) if dnf else " & ".join(expressions)
         return minimized_expr if expressions else ("Contradiction" if dnf else "Tautology"), steps
\ No newline at end of file
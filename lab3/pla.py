@@ -0,0 +1,124 @@
+import os
+from typing import List, NamedTuple, Optional, Set, Tuple
+
+Cube = Tuple[int, int]  # (value, mask): биты mask — позиции '-', первый символ — старший бит
+
+
+class Pla(NamedTuple):
+    """PLA-описание в кубах, как в файле; минтермы (on, dc) разворачиваются только по запросу."""
+    inputs: List[str]
+    outputs: List[str]
+    on_cubes: List[List[Cube]]  # Для каждого выхода: кубы, где он равен 1
+    dc_cubes: List[List[Cube]]  # Для каждого выхода: безразличные кубы
+    off_cubes: Optional[List[List[Cube]]] = None  # Для .type fr: кубы, где выход равен 0
+
+    def _minterms(self, cubes: List[Cube]) -> Set[int]:
+        return {m for value, mask in cubes for m in _cube_minterms(value, mask)}
+
+    @property
+    def on(self) -> List[Set[int]]:
+        """Для каждого выхода: минтермы, где он равен 1."""
+        return [self._minterms(cubes) for cubes in self.on_cubes]
+
+    @property
+    def dc(self) -> List[Set[int]]:
+        """Для каждого выхода: безразличные наборы (для .type fr — всё, что не в ON и не в OFF)."""
+        on = self.on
+        if self.off_cubes is not None:
+            everything = set(range(1 << len(self.inputs)))
+            return [everything - on[k] - self._minterms(off) for k, off in enumerate(self.off_cubes)]
+        return [self._minterms(cubes) - on[k] for k, cubes in enumerate(self.dc_cubes)]
+
+
+def parse_cube(cube: str) -> Cube:
+    """Куб вида '1-0' как (value, mask)."""
+    value = int(cube.replace('-', '0'), 2) if cube else 0
+    mask = int(''.join('1' if ch == '-' else '0' for ch in cube), 2) if cube else 0
+    return value, mask
+
+
+def _cube_minterms(value: int, mask: int) -> List[int]:
+    result = []
+    sub = mask
+    while True:
+        result.append(value | sub)
+        if sub == 0:
+            return result
+        sub = (sub - 1) & mask
+
+
+def cube_minterms(cube: str) -> List[int]:
+    """Все минтермы куба вида '1-0' (первый символ — старший бит)."""
+    return sorted(_cube_minterms(*parse_cube(cube)))
+
+
+def read_pla(source: str) -> Pla:
+    """Читает PLA-описание (формат espresso: .i, .o, .ilb, .ob, .p, .type f/fd/fr, .e) из файла или строки.
+
+    Кубы не разворачиваются в минтермы. Для .type fr нули выхода задают OFF-множество,
+    а всё неупомянутое считается безразличным.
+    """
+    if os.path.exists(source):
+        with open(source, encoding='utf-8') as f:
+            text = f.read()
+    else:
+        text = source
+
+    n_in = n_out = None
+    inputs, outputs = None, None
+    kind = 'fd'
+    cubes = []
+    for line in text.splitlines():
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith('.'):
+            key, *args = line.split()
+            if key == '.i':
+                n_in = int(args[0])
+            elif key == '.o':
+                n_out = int(args[0])
+            elif key == '.ilb':
+                inputs = args
+            elif key == '.ob':
+                outputs = args
+            elif key == '.type':
+                kind = args[0]
+            elif key == '.e':
+                break
+            continue
+        cube, out = line.split()
+        if len(cube) != n_in or len(out) != n_out:
+            raise ValueError(f"Куб не соответствует .i/.o: {line}")
+        cubes.append((cube, out))
+
+    if n_in is None or n_out is None:
+        raise ValueError("В PLA нет .i или .o")
+    on = [[] for _ in range(n_out)]
+    dc = [[] for _ in range(n_out)]
+    off = [[] for _ in range(n_out)] if 'r' in kind else None
+    for cube, out in cubes:
+        cube = parse_cube(cube)
+        for k, ch in enumerate(out):
+            if ch in '14':
+                on[k].append(cube)
+            elif ch in '-2' and 'd' in kind:
+                dc[k].append(cube)
+            elif ch == '0' and off is not None:
+                off[k].append(cube)
+    return Pla(inputs or [f"x{i}" for i in range(n_in)], outputs or [f"f{k}" for k in range(n_out)], on, dc, off)
+
+
+def write_pla(path: str, inputs: List[str], outputs: List[str], on: List[Set[int]], comment: str = '') -> None:
+    """Записывает функцию минтермами (.type f): одна строка на набор, где хотя бы один выход равен 1."""
+    n = len(inputs)
+    rows = sorted(set().union(*on))
+    with open(path, 'w', encoding='utf-8') as f:
+        for line in comment.splitlines():
+            f.write(f"# {line}\n")
+        f.write(f".i {n}\n.o {len(outputs)}\n")
+        f.write(f".ilb {' '.join(inputs)}\n.ob {' '.join(outputs)}\n")
+        f.write(f".p {len(rows)}\n")
+        for m in rows:
+            f.write(f"{format(m, f'0{n}b')} {''.join('1' if m in s else '0' for s in on)}\n")
+        f.write(".e\n")
@@ -2,11 +2,18 @@ import unittest
 from typing import List, Set, Tuple, Dict
 from unittest.mock import patch, MagicMock
 from io import StringIO
-from log_parser import InputCleaner, ExpressionValidator, VariableExtractor, Lexer
-from evaluator import ExpressionConverter, PostfixEvaluator, TableBuilder, NormalForms, NumericRepresentation
-from minimizer import BinaryUtils, ImplicantReducer, EssentialFinder, ExpressionFormatter, BooleanMinimizer
+from log_parser import InputCleaner, ExpressionValidator, VariableExtractor, Lexer, Scanner, ParseError
+from evaluator import (ExpressionConverter, PostfixEvaluator, ProgramCompiler, TableBuilder, TruthTable, NormalForms,
+                       NumericRepresentation, OP_LOAD, OP_NOT, OPCODES)
+from minimizer import BinaryUtils, ImplicantReducer, EssentialFinder, ExpressionFormatter, EspressoMinimizer, BooleanMinimizer
+from pla import read_pla, cube_minterms
+from bdd import BDD, BddFunction
+import os
+import evaluator
 import main
 
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
 class TestLogicFunctions(unittest.TestCase):
     def test_input_cleaner_remove_spaces(self):
         self.assertEqual(InputCleaner.remove_spaces("a & b | c"), "a&b|c")
@@ -17,7 +24,8 @@ class TestLogicFunctions(unittest.TestCase):
     def test_expression_validator_is_valid(self):
         self.assertTrue(ExpressionValidator.is_valid("a & b | c"))
         self.assertTrue(ExpressionValidator.is_valid("!a -> (b & c)"))
-        self.assertFalse(ExpressionValidator.is_valid("a & x | y"))
+        self.assertTrue(ExpressionValidator.is_valid("a & x | y"))  # Та же грамматика, что у Scanner
+        self.assertTrue(ExpressionValidator.is_valid("(a & b"))  # Скобки проверяются отдельно
         self.assertFalse(ExpressionValidator.is_valid("a + b"))
         self.assertTrue(ExpressionValidator.is_valid(""))  # Пустая строка валидна
 
@@ -33,6 +41,7 @@ class TestLogicFunctions(unittest.TestCase):
         self.assertEqual(VariableExtractor.get_variables("!a -> (b & c)"), ["a", "b", "c"])
         self.assertEqual(VariableExtractor.get_variables("a & a & a"), ["a"])
         self.assertEqual(VariableExtractor.get_variables(""), [])
+        self.assertEqual(VariableExtractor.get_variables("(a & b"), ["a", "b"])  # Скобки здесь не проверяются
 
     def test_lexer_tokenize(self):
         self.assertEqual(Lexer.tokenize("a & b | c"), ["a", "&", "b", "|", "c"])
@@ -40,6 +49,47 @@ class TestLogicFunctions(unittest.TestCase):
         self.assertEqual(Lexer.tokenize("(a)"), ["(", "a", ")"])
         self.assertEqual(Lexer.tokenize(""), [])
         self.assertEqual(Lexer.tokenize("a + b"), [])  # Недопустимый символ '+'
+        # Как и прежде, баланс скобок проверяет только валидатор
+        self.assertEqual(Lexer.tokenize("(a&b"), ["(", "a", "&", "b"])
+        self.assertEqual(Lexer.tokenize("a)"), ["a", ")"])
+        with self.assertRaises(ParseError):
+            Scanner.scan("(a&b")
+
+    def test_scanner_scan(self):
+        for expr in ("a & b | c", "!a -> (b & c)", "(a)", "", "((e->d) | !c)&a"):
+            result = Scanner.scan(expr)
+            self.assertEqual(result.tokens, Lexer.tokenize(expr))
+            self.assertEqual(result.variables, VariableExtractor.get_variables(expr))
+        self.assertEqual(Scanner.scan(" !a -> (b)").positions, [1, 2, 4, 7, 8, 9])
+        # Естественный порядок: x2 раньше x10
+        self.assertEqual(Scanner.scan("x10 & x2 | x1").variables, ["x1", "x2", "x10"])
+        self.assertEqual(VariableExtractor.get_variables("x10 & x2 | x1"), ["x1", "x2", "x10"])
+
+    def test_scanner_identifiers_and_operators(self):
+        result = Scanner.scan("x1 ^ !y_2 <-> (x1 ↑ z) ↓ w -> alpha ~ beta")
+        self.assertEqual(result.tokens, ["x1", "^", "!", "y_2", "~", "(", "x1", "↑", "z", ")", "↓", "w", "->",
+                                         "alpha", "~", "beta"])
+        self.assertEqual(result.positions[:5], [0, 3, 5, 6, 10])
+        self.assertEqual(result.variables, ["alpha", "beta", "w", "x1", "y_2", "z"])
+        with self.assertRaises(ParseError) as ctx:
+            Scanner.scan("a & 1b")
+        self.assertEqual(ctx.exception.position, 4)
+        with self.assertRaises(ParseError):
+            Scanner.scan("a <- b")
+
+    def test_scanner_errors(self):
+        cases = {
+            "a + b": (ParseError.SYMBOLS, 2),
+            "a - b": (ParseError.SYMBOLS, 2),
+            "a)+b": (ParseError.SYMBOLS, 2),  # Недопустимый символ проверяется раньше скобок
+            "(a & b": (ParseError.PARENTHESES, 0),
+            "a & )b(": (ParseError.PARENTHESES, 4),
+            "(a) & ((b)": (ParseError.PARENTHESES, 6),
+        }
+        for expr, (kind, position) in cases.items():
+            with self.assertRaises(ParseError) as ctx:
+                Scanner.scan(expr)
+            self.assertEqual((ctx.exception.kind, ctx.exception.position), (kind, position), expr)
 
     def test_expression_converter_to_postfix(self):
         self.assertEqual(ExpressionConverter.to_postfix(["a", "&", "b", "|", "c"]), ["a", "b", "&", "c", "|"])
@@ -67,6 +117,49 @@ class TestLogicFunctions(unittest.TestCase):
         with self.assertRaises(ValueError):
             PostfixEvaluator.evaluate(["x"], {"a": True})  # Неизвестный токен
 
+    def test_postfix_evaluator_operators(self):
+        cases = {
+            "~": [True, False, False, True],
+            "&": [False, False, False, True],
+            "↑": [True, True, True, False],
+            "|": [False, True, True, True],
+            "^": [False, True, True, False],
+            "↓": [True, False, False, False],
+            "->": [True, True, False, True],
+        }
+        for op, expected in cases.items():
+            table = TableBuilder.build(["a", "b"], ["a", "b", op])
+            self.assertEqual([row[-1] for row in table], expected, op)
+
+    def test_expression_converter_precedence_and_ids(self):
+        # ~ связывает сильнее &, двойное отрицание допустимо
+        tokens = Scanner.scan("!!p & q ~ r").tokens
+        postfix = ExpressionConverter.to_postfix(tokens)
+        self.assertEqual(postfix, ["p", "!", "!", "q", "r", "~", "&"])
+        program = ExpressionConverter.to_ids(postfix, ["p", "q", "r"])
+        self.assertEqual(program, [0, "!", "!", 1, 2, "~", "&"])
+        self.assertTrue(PostfixEvaluator.evaluate(program, [True, False, False]))
+        self.assertEqual(PostfixEvaluator.evaluate(program, [True, False, False]),
+                         PostfixEvaluator.evaluate(postfix, {"p": True, "q": False, "r": False}))
+
+    def test_program_compiler(self):
+        postfix = ExpressionConverter.to_postfix(Scanner.scan("!(a ↑ b) ^ c ~ (a ↓ !c) -> b | a").tokens)
+        program = ProgramCompiler.compile(postfix, ["a", "b", "c"])
+        self.assertIs(program, ProgramCompiler.compile(list(postfix), ("a", "b", "c")))
+        self.assertEqual(list(program.code[:6]), [OP_LOAD, 0, OP_LOAD, 1, OPCODES["↑"], 0])
+        self.assertEqual(program.code[6], OP_NOT)
+        for values in [[bool(i >> 2 & 1), bool(i >> 1 & 1), bool(i & 1)] for i in range(8)]:
+            expected = PostfixEvaluator.evaluate(postfix, dict(zip("abc", values)))
+            self.assertEqual(program(values), expected)
+            self.assertEqual(program.evaluate(values), expected)
+
+        with self.assertRaises(ValueError):
+            ProgramCompiler.compile(["a", "&"], ["a"])
+        with self.assertRaises(ValueError):
+            ProgramCompiler.compile(["x"], ["a"])
+        with self.assertRaises(ValueError):
+            ProgramCompiler.compile(["a", "a"], ["a"])
+
     def test_table_builder_build(self):
         variables = ["a", "b"]
         postfix = ["a", "b", "&"]
@@ -85,6 +178,53 @@ class TestLogicFunctions(unittest.TestCase):
         expected = [[False, True], [True, False]]
         self.assertEqual(table, expected)
 
+    def test_truth_table_bitset(self):
+        rows = [[False, False, True], [False, True, False], [True, False, True], [True, True, True]]
+        table = TruthTable(["a", "b"], 0b1011)
+        self.assertEqual(table, rows)
+        self.assertEqual(table, TruthTable.from_rows(["a", "b"], rows))
+        self.assertEqual((len(table), table[1], table[-1], table[1:3]), (4, rows[1], rows[3], rows[1:3]))
+        with self.assertRaises(IndexError):
+            table[4]
+        self.assertEqual(list(table.minterms()), [0, 2, 3])
+        self.assertEqual(list(table.maxterms()), [1])
+        self.assertEqual(table.output_string(), "1011")
+
+        for forms, args in ((NormalForms.dnf, (["a", "b"],)), (NormalForms.cnf, (["a", "b"],)),
+                            (NumericRepresentation.dnf_indices, ()), (NumericRepresentation.cnf_indices, ()),
+                            (NumericRepresentation.index_value, ())):
+            self.assertEqual(forms(*args, table), forms(*args, rows))
+
+        # 2^16 строк хранятся в одном целом
+        names = [f"x{i}" for i in range(16)]
+        postfix = ["x0"] + [t for name in names[1:] for t in (name, "^")]
+        big = TableBuilder.build(names, postfix)
+        self.assertEqual(sum(1 for _ in big.minterms()), 1 << 15)
+        self.assertEqual(big[12345][-1], bin(12345).count("1") % 2 == 1)
+
+    @unittest.skipIf(evaluator.np is None, "NumPy не установлен")
+    def test_table_builder_numpy(self):
+        for expr in ("a & b", "!(a ↑ b) ^ c ~ (a ↓ !c) -> b | a", "x1 -> x2 & !x3 | x4 ^ x5"):
+            scanned = Scanner.scan(expr)
+            postfix = ExpressionConverter.to_postfix(scanned.tokens)
+            expected = TableBuilder.build(scanned.variables, postfix, backend='python')
+            self.assertEqual(TableBuilder.build(scanned.variables, postfix, backend='numpy'), expected)
+            with patch.object(TableBuilder, 'chunk_rows', 8):  # Несколько порций
+                self.assertEqual(TableBuilder.build(scanned.variables, postfix, backend='numpy'), expected)
+
+    def test_table_builder_without_numpy(self):
+        names = [f"x{i}" for i in range(12)]
+        postfix = ["x0"] + [t for name in names[1:] for t in (name, "|")]
+        with patch.object(evaluator, 'np', None):
+            table = TableBuilder.build(names, postfix)
+            # Явный запрос NumPy без NumPy — тот же путь на чистом Python
+            numpy_table = TableBuilder.build(names, postfix, backend='numpy')
+        self.assertIsInstance(numpy_table, TruthTable)
+        self.assertEqual(numpy_table, table)
+        self.assertEqual(table.index_value, (1 << 4095) - 1)  # Ложь только в первой строке
+        with self.assertRaises(ValueError):
+            TableBuilder.build(names, postfix, backend='gpu')
+
     def test_normal_forms_dnf(self):
         variables = ["a", "b"]
         table = [
@@ -179,6 +319,26 @@ class TestLogicFunctions(unittest.TestCase):
         self.assertEqual(primes, [])
         self.assertEqual(history, [])
 
+    def test_implicant_reducer_step_log(self):
+        primes, history = ImplicantReducer.extract_implicants([0, 1, 2, 5, 6, 7], 3)
+        self.assertEqual(history, [[
+            "000 + 001 => 00- :: {0, 1}", "000 + 010 => 0-0 :: {0, 2}", "001 + 101 => -01 :: {1, 5}",
+            "010 + 110 => -10 :: {2, 6}", "101 + 111 => 1-1 :: {5, 7}", "110 + 111 => 11- :: {6, 7}",
+        ]])
+        self.assertEqual([bits for bits, _ in primes], ["00-", "0-0", "-01", "-10", "1-1", "11-"])
+
+        # Повторяющаяся склейка (0-0- из двух пар) записывается в журнал один раз
+        primes, history = ImplicantReducer.extract_implicants([0, 1, 4, 5], 4)
+        self.assertEqual(history[1], ["000- + 010- => 0-0- :: {0, 1, 4, 5}"])
+        self.assertEqual(primes, [("0-0-", {0, 1, 4, 5})])
+
+    def test_implicant_reducer_large(self):
+        # 12 переменных: все наборы с чётным числом единиц в старших 11 битах, младший бит любой
+        ones = [m for m in range(1 << 12) if bin(m >> 1).count("1") % 2 == 0]
+        primes, history = ImplicantReducer.extract_implicants(ones, 12)
+        self.assertEqual(len(primes), len(ones) // 2)
+        self.assertTrue(all(bits.endswith("-") for bits, _ in primes))
+
     def test_essential_finder_filter_essentials(self):
         primes = [
             ('--1', {0, 1, 2, 3, 4, 5, 6}),
@@ -194,6 +354,186 @@ class TestLogicFunctions(unittest.TestCase):
         essentials = EssentialFinder.filter_essentials(primes, targets)
         self.assertEqual(essentials, [])
 
+    def test_essential_finder_cover_modes(self):
+        # Жадный выбор берёт 5 импликант, минимальное покрытие — 4
+        minterms = [4, 5, 7, 9, 10, 11, 12, 14, 15]
+        primes, _ = ImplicantReducer.extract_implicants(minterms, 4)
+        targets = set(minterms)
+        greedy = EssentialFinder.filter_essentials(primes, targets)
+        self.assertEqual(EssentialFinder.filter_essentials(primes, targets, 'incremental'), greedy)
+        exact = EssentialFinder.filter_essentials(primes, targets, 'exact')
+        self.assertEqual(len(greedy), 5)
+        self.assertEqual(len(exact), 4)
+        self.assertEqual(set().union(*(p[1] for p in exact)), targets)
+
+        with self.assertRaises(ValueError):
+            EssentialFinder.filter_essentials(primes, targets, 'optimal')
+
+        # Простая импликанта, чьи минтермы покрыты другими склейками, остаётся кандидатом:
+        # без неё точный поиск находил 8 импликант вместо 7
+        report = {}
+        result, _ = BooleanMinimizer.minimize([1, 3, 5, 6, 7, 8, 10, 11, 13, 14, 16, 17, 18, 19, 20, 21, 22, 23, 24,
+                                               26, 27, 29, 31], 5, dont_cares=[12], cover='exact', report=report)
+        self.assertEqual(report, {'complete': True})
+        self.assertEqual(result.count("|") + 1, 7)
+        self.assertEqual(sum(clause.count("&") + 1 for clause in result.split(" | ")), 20)
+
+        # Исчерпанный бюджет времени: всё равно возвращается покрытие
+        ones = [m for m in range(1 << 8) if bin(m).count("1") in (3, 5)]
+        primes, _ = ImplicantReducer.extract_implicants(ones, 8)
+        result = EssentialFinder.filter_essentials(primes, set(ones), 'exact', time_budget=0)
+        self.assertEqual(set().union(*(p[1] for p in result)), set(ones))
+
+    def test_boolean_minimizer_exact_cover(self):
+        result, _ = BooleanMinimizer.minimize([4, 5, 7, 9, 10, 11, 12, 14, 15], 4, cover='exact')
+        self.assertEqual(result.count("|"), 3)
+
+    def test_read_pla(self):
+        pla = read_pla(".i 3\n.o 2\n.ilb p q r\n.p 3\n1-0 10\n011 -1\n000 01\n.e\n")
+        self.assertEqual(pla.inputs, ["p", "q", "r"])
+        self.assertEqual(pla.on, [{4, 6}, {0, 3}])
+        self.assertEqual(pla.dc, [{3}, set()])
+        pla = read_pla(".i 2\n.o 1\n.type fr\n11 1\n00 0\n")
+        self.assertEqual((pla.on, pla.dc), ([{3}], [{1, 2}]))
+        self.assertEqual((pla.on_cubes, pla.off_cubes), ([[(3, 0)]], [[(0, 0)]]))
+        self.assertEqual(BooleanMinimizer.minimize_pla(".i 2\n.o 1\n.type fr\n11 1\n00 0\n")[0], "x0")
+        # Кубы остаются кубами: 2^20 минтермов не разворачиваются
+        pla = read_pla(".i 20\n.o 1\n" + "-" * 20 + " 1\n")
+        self.assertEqual(pla.on_cubes, [[(0, (1 << 20) - 1)]])
+        self.assertEqual(BooleanMinimizer.minimize_pla(".i 20\n.o 1\n1" + "-" * 19 + " 1\n01" + "-" * 18 + " 1\n")[0],
+                         "x0 | x1")
+        self.assertEqual(cube_minterms("1-0-"), [8, 9, 12, 13])
+
+    def test_minimize_espresso_fixtures(self):
+        expected_cubes = {'xor5': [16], 'rd53': [5, None, 16], '9sym': [None]}
+        for name in ('xor5', 'rd53', 'rd73', '9sym'):
+            pla = read_pla(os.path.join(FIXTURES, f"{name}.pla"))
+            n = len(pla.inputs)
+            for k, ones in enumerate(pla.on):
+                result, steps = BooleanMinimizer.minimize_espresso(sorted(ones), n, names=pla.inputs)
+                cubes = steps[-1][1:]
+                self.assertEqual(steps[-1][0], "Покрытие:")
+                self.assertEqual(set().union(*(cube_minterms(c) for c in cubes)), ones, (name, k))
+                self.assertEqual(result.count("|") + 1, len(cubes))
+                if name in expected_cubes and expected_cubes[name][k]:
+                    self.assertEqual(len(cubes), expected_cubes[name][k])
+                if name == '9sym':
+                    self.assertLessEqual(len(cubes), 90)  # Не хуже Квайна — Мак-Класки с жадным покрытием
+
+    def test_espresso_cube_operations(self):
+        # a | !a & b | !b над двумя переменными — тавтология; без !b — нет
+        cover = [(0b10, 0b01), (0b01, 0b00), (0b00, 0b10)]
+        self.assertTrue(EspressoMinimizer.tautology(cover, 2))
+        self.assertFalse(EspressoMinimizer.tautology(cover[:2], 2))
+        self.assertEqual(EspressoMinimizer.complement(cover[:2], 2), [(0b00, 0b00)])
+        self.assertEqual(EspressoMinimizer.cofactor(cover, (0b10, 0b01), 2), [(0, 0b11), (0, 0b10)])
+        # Избыточный куб 11 покрыт кубами 1- и -1; результат не зависит от времени работы
+        self.assertEqual(EspressoMinimizer.irredundant([(0b11, 0), (0b10, 0b01), (0b01, 0b10)], [], 2),
+                         [(0b10, 0b01), (0b01, 0b10)])
+
+    def test_minimize_espresso_dont_cares(self):
+        self.assertEqual(BooleanMinimizer.minimize_espresso([1, 3, 5], 3, dont_cares=[7])[0], "c")
+        self.assertEqual(BooleanMinimizer.minimize_espresso([], 3), ("Contradiction", []))
+        self.assertEqual(BooleanMinimizer.minimize_espresso([0, 1, 2], 2, dnf=False)[0],
+                         BooleanMinimizer.minimize([0, 1, 2], 2, dnf=False)[0])
+        self.assertEqual(BooleanMinimizer.minimize_pla(".i 2\n.ilb u v\n.o 1\n01 1\n11 1\n")[0], "v")
+
+    def test_minimize_multi(self):
+        # f0 = a & b, f1 = c | a & b: импликанта 11- общая для обоих выходов
+        primes, history = ImplicantReducer.extract_implicants([1, 3, 5, 6, 7], 3,
+                                                              output_masks={1: 2, 3: 2, 5: 2, 6: 3, 7: 3})
+        self.assertIn("110 + 111 => 11- :: {6, 7} :: выходы [0, 1]", history[0])
+        self.assertIn(("11-", {6, 7}, 3), primes)
+        self.assertIn(("--1", {1, 3, 5, 7}, 2), primes)
+        self.assertNotIn(("111", {7}, 3), primes)
+
+        results, steps = BooleanMinimizer.minimize_multi([[6, 7], [1, 3, 5, 6, 7]], 3)
+        self.assertEqual(results, ["(a & b)", "c | (a & b)"])
+        self.assertEqual(steps[-1], ["Совместное покрытие:", "11- -> выходы [0, 1]", "--1 -> выходы [1]"])
+        self.assertEqual(BooleanMinimizer.minimize_multi([[], [3]], 2)[0], ["Contradiction", "(a & b)"])
+        self.assertEqual(BooleanMinimizer.minimize_multi([[1], [1, 3]], 2, dont_cares=[[3], []])[0], ["b", "b"])
+
+        for name in ('rd53', 'rd73'):
+            pla = read_pla(os.path.join(FIXTURES, f"{name}.pla"))
+            results, steps = BooleanMinimizer.minimize_pla_multi(os.path.join(FIXTURES, f"{name}.pla"))
+            cover = [line.split(" -> выходы ") for line in steps[-1][1:]]
+            for k, ones in enumerate(pla.on):
+                cubes = [cube for cube, outputs in cover if str(k) in outputs.strip("[]").split(", ")]
+                self.assertTrue(set().union(*(cube_minterms(c) for c in cubes)) >= ones, (name, k))
+                self.assertTrue(all(set(cube_minterms(c)) <= ones for c in cubes), (name, k))
+            separate = {clause for on in pla.on
+                        for clause in BooleanMinimizer.minimize(sorted(on), len(pla.inputs), names=pla.inputs,
+                                                                cover='exact')[0].split(" | ")}
+            self.assertLessEqual(len(cover), len(separate))
+            self.assertEqual(len(cover), len({clause for expr in results for clause in expr.split(" | ")}))
+
+        # Предел узлов детерминирован: остановка перебора видна в report и в журнале
+        report = {}
+        path = os.path.join(FIXTURES, "rd53.pla")
+        limited, steps = BooleanMinimizer.minimize_pla_multi(path, node_limit=1, report=report)
+        self.assertFalse(report['complete'])
+        self.assertTrue(steps[-2][0].startswith("Точный перебор остановлен на пределе 1 узлов"))
+        self.assertEqual(steps[-1][0], "Совместное покрытие:")
+        self.assertEqual(BooleanMinimizer.minimize_pla_multi(path, node_limit=1), (limited, steps))
+        BooleanMinimizer.minimize_pla_multi(path, report=report)
+        self.assertTrue(report['complete'])
+
+    def test_bdd_matches_truth_table(self):
+        for expr in ("a & b | c", "!a -> (b ↑ c) ~ d", "a ^ b ^ c ^ d", "(a ↓ b) | (c & !d)", "a & !a", "a | !a"):
+            scan = Scanner.scan(expr)
+            postfix = ExpressionConverter.to_postfix(scan.tokens)
+            table = TableBuilder.build(scan.variables, postfix)
+            function = TableBuilder.build(scan.variables, postfix, backend='bdd')
+            self.assertEqual(list(function.minterms()), list(table.minterms()), expr)
+            self.assertEqual(NumericRepresentation.cnf_indices(function), NumericRepresentation.cnf_indices(table))
+            self.assertEqual(NormalForms.dnf(scan.variables, function), NormalForms.dnf(scan.variables, table))
+            self.assertEqual(NormalForms.cnf(scan.variables, function), NormalForms.cnf(scan.variables, table))
+            self.assertEqual(function.sat_count(), len(NumericRepresentation.dnf_indices(table)))
+            self.assertEqual(NumericRepresentation.index_value(function), NumericRepresentation.index_value(table))
+            self.assertEqual(function.is_satisfiable(), function.satisfy_one() is not None)
+            self.assertEqual([function.value(i) for i in range(table.size)], [table.value(i) for i in range(table.size)])
+            for dnf in (True, False):
+                cubes = function.isop(dnf)
+                covered = set().union(set(), *(EspressoMinimizer.cube_minterms(v, m) for v, m in cubes))
+                self.assertEqual(covered, set(table.minterms() if dnf else table.maxterms()), expr)
+        self.assertEqual(BooleanMinimizer.minimize_bdd(TableBuilder.build(["a", "b", "c"], ["a", "b", "&", "c", "|"],
+                                                                          backend='bdd')), ("(a & b) | c", [["Покрытие:", "11-", "--1"]]))
+
+    def test_bdd_unique_table_and_gc(self):
+        manager = BDD(["a", "b", "c"])
+        first = manager.build(ExpressionConverter.to_postfix(Scanner.scan("a -> (b & c)").tokens))
+        # Каноничность: равные функции — одна и та же вершина
+        self.assertEqual(first, manager.build(ExpressionConverter.to_postfix(Scanner.scan("!a | c & b").tokens)))
+        self.assertEqual(~~first, first)
+        self.assertNotEqual(~first, first)
+        with self.assertRaises(ValueError):
+            manager.build(["a", "&"])
+        manager.collect()
+        count = manager.node_count
+        temporary = manager.build(ExpressionConverter.to_postfix(Scanner.scan("a ^ b ^ c").tokens))
+        self.assertGreater(manager.node_count, count)
+        del temporary
+        self.assertGreater(manager.collect(), 0)
+        self.assertEqual(manager.node_count, count)
+        self.assertEqual(list(first.minterms()), [0, 1, 2, 3, 7])
+
+    def test_bdd_many_variables(self):
+        # 48 переменных: таблица из 2^48 строк не строится
+        names = [f"x{i}" for i in range(48)]
+        expr = " | ".join(f"({a} & {b})" for a, b in zip(names[::2], names[1::2]))
+        function = TableBuilder.build(names, ExpressionConverter.to_postfix(Scanner.scan(expr).tokens), backend='bdd')
+        self.assertEqual(function.sat_count(), (1 << 48) - 3 ** 24)
+        self.assertEqual(function.satisfy_one(), 3)
+        result, steps = BooleanMinimizer.minimize_bdd(function)
+        self.assertEqual(result.count("|"), 23)
+        self.assertIn("(x46 & x47)", result)
+
+        conjunction = BddFunction.from_postfix(names, ExpressionConverter.to_postfix(Scanner.scan(" & ".join(names)).tokens))
+        self.assertEqual(NumericRepresentation.dnf_indices(conjunction), [(1 << 48) - 1])
+        self.assertEqual(NormalForms.dnf(names, conjunction), f"({' & '.join(names)})")
+        self.assertEqual(BooleanMinimizer.minimize_bdd(conjunction, dnf=False)[0],
+                         " & ".join(names))
+
     def test_expression_formatter_to_logical(self):
         variables = ["a", "b", "c"]
         self.assertEqual(ExpressionFormatter.to_logical("--1", variables, True), "c")
@@ -239,6 +579,7 @@ class TestLogicFunctions(unittest.TestCase):
         expected_forms = [
             "(!a & !b & !c) | (!a & !b & c) | (!a & b & !c) | (!a & b & c) | (a & !b & !c) | (a & !b & c) | (a & b & !c)",
             "(!c) | (!a & b) | (!a & !b) | (a & !b)",  # Возможные альтернативы
+            "(!a) | (!b) | (!c)",  # Минимальное покрытие группами по 4 клетки
         ]
         self.assertTrue(any(result == form for form in expected_forms))
 
@@ -261,6 +602,51 @@ class TestLogicFunctions(unittest.TestCase):
         self.assertGreaterEqual(len(steps), 2)
         self.assertTrue(any("Группы не найдены" in line for group in steps for line in group))
 
+    def test_minimize_karnaugh_groups(self):
+        # Угловые клетки карты на 4 переменные склеиваются через края
+        result, steps = BooleanMinimizer.minimize_karnaugh([0, 2, 8, 10], 4)
+        self.assertEqual(result, "(!b & !d)")
+        self.assertEqual(steps[1], ["1 0 0 1", "0 0 0 0", "0 0 0 0", "1 0 0 1"])
+        self.assertEqual(BooleanMinimizer.minimize_karnaugh([1], 1)[0], "(a)")
+        # Константы — как у остальных методов; пустая карта — настоящего размера
+        self.assertEqual(BooleanMinimizer.minimize_karnaugh([0, 1, 2, 3], 2)[0], BooleanMinimizer.minimize([0, 1, 2, 3], 2)[0])
+        self.assertEqual(BooleanMinimizer.minimize_karnaugh([0, 1, 2, 3], 2, dnf=False)[0], "0")
+        result, steps = BooleanMinimizer.minimize_karnaugh([], 5)
+        self.assertEqual(result, "Contradiction")
+        self.assertEqual(steps[1], ["0 0 0 0 0 0 0 0"] * 4)
+        self.assertEqual(steps[-1], ["Группы не найдены"])
+        # На карте из 5 переменных столбцы с e = 0 не соседние на торе, но симметричны относительно оси
+        self.assertEqual(BooleanMinimizer.minimize_karnaugh([m for m in range(32) if not m & 1], 5)[0], "(!e)")
+
+        # До 6 переменных выбранные группы задают ту же функцию
+        import random
+        rng = random.Random(7)
+        for _ in range(20):
+            n = rng.randint(2, 6)
+            ones = sorted(rng.sample(range(1 << n), rng.randint(1, (1 << n) - 1)))
+            result, _ = BooleanMinimizer.minimize_karnaugh(ones, n)
+            table = TableBuilder.build([chr(97 + i) for i in range(n)],
+                                       ExpressionConverter.to_postfix(Scanner.scan(result).tokens))
+            self.assertEqual(list(table.minterms()), ones)
+
+    def test_dont_cares(self):
+        # f = 1 на {1, 3}, безразлично на {5, 7}: минимум — просто c
+        primes, history = ImplicantReducer.extract_implicants([1, 3], 3, dont_cares=[5, 7])
+        self.assertEqual(primes, [("--1", {1, 3, 5, 7})])
+        self.assertEqual(history[-1], ["0-1 + 1-1 => --1 :: {1, 3, 5, 7}"])
+        # Импликанта только из безразличных наборов в простые не попадает
+        primes, _ = ImplicantReducer.extract_implicants([0], 3, dont_cares=[6, 7])
+        self.assertEqual(primes, [("000", {0})])
+
+        self.assertEqual(EssentialFinder.filter_essentials([("0-", {0, 1}), ("-1", {1, 3})], {0, 1}, dont_cares={1}),
+                         [("0-", {0, 1})])
+        for method in (BooleanMinimizer.minimize, BooleanMinimizer.minimize_qmc, BooleanMinimizer.minimize_karnaugh,
+                       BooleanMinimizer.minimize_espresso):
+            result, _ = method([1, 3], 3, dont_cares=[5, 7])
+            self.assertIn(result, ("c", "(c)"), method.__name__)
+        _, steps = BooleanMinimizer.minimize_karnaugh([1, 3], 3, dont_cares=[5, 7])
+        self.assertEqual(steps[1], ["0 1 1 0", "0 X X 0"])
+
 class TestMainRun(unittest.TestCase):
     def setUp(self):
         self.patcher = patch('builtins.input', return_value='')
@@ -300,6 +686,25 @@ class TestMainRun(unittest.TestCase):
         self.assertIn("Минимизированная CNF: a & b", output)
   # Updated to match Karnaugh map output
 
+    def test_run_named_variables(self):
+        self.mock_input.side_effect = ["x1 & x3"]
+        main.run()
+        output = self.mock_stdout.getvalue()
+        self.assertIn("x1 x3 | Выход", output)
+        self.assertIn(" 1  1 | 1", output)
+        self.assertIn("Минимизированная DNF: (x1 & x3)", output)
+
+    def test_run_dont_cares(self):
+        self.mock_input.side_effect = ["a & b & c | !a & b & c ; 2, 7"]
+        main.run()
+        output = self.mock_stdout.getvalue()
+        self.assertIn("Безразличные наборы: 2, 7", output)
+        self.assertIn("Минимизированная DNF: (!a & b)", output)
+
+        self.mock_input.side_effect = ["a & b ; 4"]
+        main.run()
+        self.assertIn("Ошибка: некорректные безразличные наборы.", self.mock_stdout.getvalue())
+
     def test_run_invalid_characters(self):
         self.mock_input.side_effect = ["a + b"]
         main.run()
@@ -311,7 +716,7 @@ class TestMainRun(unittest.TestCase):
         self.mock_input.side_effect = ["(a & b"]
         main.run()
         output = self.mock_stdout.getvalue()
-        self.assertIn("Ошибка: несбалансированные скобки.", output)
+        self.assertIn("Ошибка: несбалансированные скобки. Позиция: 1", output)
         self.assertNotIn("Таблица истинности", output)
 
     def test_run_empty_expression(self):
@@ -328,5 +733,95 @@ class TestMainRun(unittest.TestCase):
         self.assertIn("Ошибка: недопустимые символы в выражении.", output)
         self.assertNotIn("Таблица истинности", output)
 
+    def test_run_uses_analysis_cache(self):
+        main.ANALYSIS_CACHE.clear()
+        self.mock_input.side_effect = ["a & b", "(a)&(b)"]
+        main.run()
+        first = self.mock_stdout.getvalue()
+        self.mock_stdout.truncate(0)
+        self.mock_stdout.seek(0)
+        main.run()
+        self.assertEqual(self.mock_stdout.getvalue(), first)
+        stats = main.ANALYSIS_CACHE.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_run_sections(self):
+        self.mock_input.side_effect = ["a | b"]
+        main.run(sections=('table',))
+        output = self.mock_stdout.getvalue()
+        self.assertIn("a b | Выход", output)
+        self.assertIn("1 0 | 1", output)
+        self.assertNotIn("DNF:", output)
+        self.assertNotIn("Минимизация", output)
+
+        # Невыбранные минимизации не вычисляются, и запись кэша не совпадает с полной
+        postfix = ExpressionConverter.to_postfix(Scanner.scan("a | b").tokens)
+        analysis = main.analyze(["a", "b"], postfix, (), ('calc',))
+        self.assertEqual(set(analysis['minimized']), {'calc'})
+        self.assertNotIn('dnf', analysis)
+        # Списки номеров наборов нужны только формам и минимизациям
+        self.assertNotIn('dnf_indices', main.analyze(["a", "b"], postfix, (), ('table',)))
+        self.assertIn('qmc', main.analyze(["a", "b"], postfix)['minimized'])
+
+        self.mock_input.side_effect = ["a & b"]
+        self.assertEqual(main.cli(["--minimize-only"]), 0)
+        output = self.mock_stdout.getvalue().split("1 1 | 1")[-1]
+        self.assertIn("Минимизация (таблично-расчётная, Квайна-МакКласки):", output)
+        self.assertNotIn("Индекс:", output)
+        # Раздел Карно печатает собственный результат, а не результат расчётного метода
+        karnaugh = output.split("Минимизация (табличная, Карно):")[-1]
+        self.assertIn("Минимизированная CNF: (a) & (b)", karnaugh)
+        with patch('sys.stderr', new=StringIO()), self.assertRaises(SystemExit):
+            main.cli(["--sections", "table,graph"])
+
+    def test_run_json(self):
+        import json
+        self.mock_input.side_effect = ["a & b ; 0"]
+        main.cli(["--json", "--sections", "forms,calc"])
+        document = json.loads(self.mock_stdout.getvalue())
+        self.assertEqual(document['variables'], ["a", "b"])
+        self.assertEqual(document['dont_cares'], [0])
+        self.assertEqual(document['dnf_indices'], [3])
+        self.assertEqual(document['index'], "1")
+        self.assertNotIn('outputs', document)
+        self.assertEqual(set(document['minimized']), {'calc'})
+        self.assertEqual(document['minimized']['calc']['dnf'], "(a & b)")
+
+        self.mock_stdout.truncate(0)
+        self.mock_stdout.seek(0)
+        self.mock_input.side_effect = ["(a"]
+        main.run(output_format='json')
+        self.assertEqual(json.loads(self.mock_stdout.getvalue()),
+                         {'error': "Ошибка: несбалансированные скобки. Позиция: 1"})
+
+
+class TestExpressionCache(unittest.TestCase):
+    def test_lru_and_disk_tier(self):
+        import os
+        import tempfile
+        from expression_cache import ExpressionCache, canonical_key
+
+        self.assertEqual(canonical_key('x', ['a', 'b', '&'], 'ab'), canonical_key('x', ('a', 'b', '&'), 'ab'))
+        # Порядок переменных задаёт порядок столбцов таблицы, поэтому входит в ключ
+        self.assertNotEqual(canonical_key('x', ['a', 'b', '&'], 'ba'), canonical_key('x', ['a', 'b', '&'], 'ab'))
+        main.ANALYSIS_CACHE.clear()
+        postfix = ['a', 'b', '!', '&']
+        self.assertEqual(main.analyze(['a', 'b'], postfix)['mask'], 0b0010)
+        self.assertEqual(main.analyze(['b', 'a'], postfix)['mask'], 0b0100)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'cache')
+            cache = ExpressionCache(maxsize=1, path=path)
+            self.assertEqual(cache.get_or_compute('k1', lambda: 1), 1)
+            self.assertEqual(cache.get_or_compute('k2', lambda: 2), 2)
+            self.assertEqual(cache.stats()['size'], 1)
+            # Вытесненная из памяти запись читается с диска без повторного вычисления
+            self.assertEqual(cache.get_or_compute('k1', lambda: None), 1)
+            cache.close()
+
+            reopened = ExpressionCache(path=path)
+            self.assertEqual(reopened.get_or_compute('k2', lambda: None), 2)
+            self.assertEqual(reopened.stats()['disk_hits'], 1)
+            reopened.close()
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file